@@ -26,24 +26,27 @@ from enum import Enum
 from typing import Dict, List, Optional
 import json
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
-from .common import get_sdk_headers
+from .cache import TTLCache
+from .common import EventStreamsBaseService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class AdminrestV1(BaseService):
+class AdminrestV1(EventStreamsBaseService):
     """The adminrest V1 service."""
 
     DEFAULT_SERVICE_URL = None
     DEFAULT_SERVICE_NAME = 'adminrest'
 
+    HEALTH_OPERATIONS = ('alive', 'get_status')
+
     @classmethod
     def new_instance(
         cls,
@@ -71,7 +74,38 @@ class AdminrestV1(BaseService):
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
                about initializing the authenticator of your choice.
         """
-        BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        EventStreamsBaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        self.topic_cache = None
+
+    def enable_topic_cache(self, max_size: Optional[int] = 1024, ttl: Optional[float] = 30.0) -> None:
+        """
+        Serve repeated get_topic calls for the same topic from an in-process cache.
+
+        Entries are evicted least-recently-used first and expire after `ttl` seconds.
+        create_topic, update_topic and delete_topic invalidate the entry of the topic they
+        change. Cached responses are shared between callers and must not be modified.
+        Hit and miss counters are available from `topic_cache.stats()`.
+
+        :param int max_size: (optional) The maximum number of cached topics, None for
+               no limit.
+        :param float ttl: (optional) The number of seconds a cached topic stays valid,
+               None for no expiry.
+        """
+        self.topic_cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def disable_topic_cache(self) -> None:
+        """Stop caching get_topic responses and drop the cached ones."""
+        self.topic_cache = None
+
+    def probe_health(self) -> bool:
+        """Return whether the instance is not offline, according to get_status."""
+        status = self._send_probe(self._status_request(), 'get_status').get_result() or {}
+        return status.get('status') != 'offline'
+
+    def _status_request(self) -> dict:
+        headers = self.get_operation_headers('get_status')
+        headers['Accept'] = 'application/json'
+        return self.prepare_request(method='GET', url='/admin/status', headers=headers)
 
     #########################
     # createTopic
@@ -104,13 +138,7 @@ class AdminrestV1(BaseService):
 
         if configs is not None:
             configs = [convert_model(x) for x in configs]
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_topic',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('create_topic', content_type='application/json')
 
         data = {
             'name': name,
@@ -119,8 +147,7 @@ class AdminrestV1(BaseService):
             'configs': configs,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -134,7 +161,11 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='create_topic', **kwargs)
+        finally:
+            if self.topic_cache is not None and name:
+                self.topic_cache.invalidate(name)
         return response
 
     #########################
@@ -153,13 +184,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='alive',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('alive')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -172,7 +197,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='alive', **kwargs)
         return response
 
     def list_topics(
@@ -205,13 +230,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `List[TopicDetail]` result
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_topics',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_topics')
 
         params = {
             'topic_filter': topic_filter,
@@ -232,7 +251,7 @@ class AdminrestV1(BaseService):
             params=params,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_topics', **kwargs)
         return response
 
     def get_topic(
@@ -253,13 +272,13 @@ class AdminrestV1(BaseService):
 
         if not topic_name:
             raise ValueError('topic_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_topic',
-        )
-        headers.update(sdk_headers)
+        cache = self.topic_cache
+        if cache is not None:
+            cached = cache.get(topic_name)
+            if cached is not None:
+                return cached
+            generation = cache.generation(topic_name)
+        headers = self.get_operation_headers('get_topic')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -276,7 +295,10 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_topic', **kwargs)
+        if cache is not None:
+            # Not cached if the topic was updated or deleted while it was read.
+            cache.put(topic_name, response, generation)
         return response
 
     def delete_topic(
@@ -297,13 +319,7 @@ class AdminrestV1(BaseService):
 
         if not topic_name:
             raise ValueError('topic_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_topic',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_topic')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -319,7 +335,11 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='delete_topic', **kwargs)
+        finally:
+            if self.topic_cache is not None:
+                self.topic_cache.invalidate(topic_name)
         return response
 
     def update_topic(
@@ -352,21 +372,14 @@ class AdminrestV1(BaseService):
             raise ValueError('topic_name must be provided')
         if configs is not None:
             configs = [convert_model(x) for x in configs]
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_topic',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_topic', content_type='application/json')
 
         data = {
             'new_total_partition_count': new_total_partition_count,
             'configs': configs,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -383,7 +396,11 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='update_topic', **kwargs)
+        finally:
+            if self.topic_cache is not None:
+                self.topic_cache.invalidate(topic_name)
         return response
 
     def delete_topic_records(
@@ -410,20 +427,13 @@ class AdminrestV1(BaseService):
             raise ValueError('topic_name must be provided')
         if records_to_delete is not None:
             records_to_delete = [convert_model(x) for x in records_to_delete]
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_topic_records',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_topic_records', content_type='application/json')
 
         data = {
             'records_to_delete': records_to_delete,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -440,7 +450,7 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='delete_topic_records', **kwargs)
         return response
 
     def create_quota(
@@ -469,21 +479,14 @@ class AdminrestV1(BaseService):
 
         if not entity_name:
             raise ValueError('entity_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_quota',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('create_quota', content_type='application/json')
 
         data = {
             'producer_byte_rate': producer_byte_rate,
             'consumer_byte_rate': consumer_byte_rate,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -500,7 +503,7 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='create_quota', **kwargs)
         return response
 
     def update_quota(
@@ -529,21 +532,14 @@ class AdminrestV1(BaseService):
 
         if not entity_name:
             raise ValueError('entity_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_quota',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_quota', content_type='application/json')
 
         data = {
             'producer_byte_rate': producer_byte_rate,
             'consumer_byte_rate': consumer_byte_rate,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -560,7 +556,7 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='update_quota', **kwargs)
         return response
 
     def delete_quota(
@@ -582,13 +578,7 @@ class AdminrestV1(BaseService):
 
         if not entity_name:
             raise ValueError('entity_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_quota',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_quota')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -604,7 +594,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='delete_quota', **kwargs)
         return response
 
     def get_quota(
@@ -626,13 +616,7 @@ class AdminrestV1(BaseService):
 
         if not entity_name:
             raise ValueError('entity_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_quota',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_quota')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -649,7 +633,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_quota', **kwargs)
         return response
 
     def list_quotas(
@@ -666,13 +650,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `QuotaList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_quotas',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_quotas')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -686,7 +664,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_quotas', **kwargs)
         return response
 
     def list_brokers(
@@ -703,13 +681,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `List[BrokerSummary]` result
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_brokers',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_brokers')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -723,7 +695,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_brokers', **kwargs)
         return response
 
     def get_broker(
@@ -744,13 +716,7 @@ class AdminrestV1(BaseService):
 
         if broker_id is None:
             raise ValueError('broker_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_broker',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_broker')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -767,7 +733,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_broker', **kwargs)
         return response
 
     def get_broker_config(
@@ -800,13 +766,7 @@ class AdminrestV1(BaseService):
 
         if broker_id is None:
             raise ValueError('broker_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_broker_config',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_broker_config')
 
         params = {
             'config_filter': config_filter,
@@ -829,7 +789,7 @@ class AdminrestV1(BaseService):
             params=params,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_broker_config', **kwargs)
         return response
 
     def get_cluster(
@@ -846,13 +806,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `Cluster` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_cluster',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_cluster')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -866,7 +820,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_cluster', **kwargs)
         return response
 
     def list_consumer_groups(
@@ -898,13 +852,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `List[str]` result
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_consumer_groups',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_consumer_groups')
 
         params = {
             'group_filter': group_filter,
@@ -925,7 +873,7 @@ class AdminrestV1(BaseService):
             params=params,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_consumer_groups', **kwargs)
         return response
 
     def get_consumer_group(
@@ -946,13 +894,7 @@ class AdminrestV1(BaseService):
 
         if not group_id:
             raise ValueError('group_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_consumer_group',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_consumer_group')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -969,7 +911,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_consumer_group', **kwargs)
         return response
 
     def delete_consumer_group(
@@ -990,13 +932,7 @@ class AdminrestV1(BaseService):
 
         if not group_id:
             raise ValueError('group_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_consumer_group',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_consumer_group')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1012,7 +948,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='delete_consumer_group', **kwargs)
         return response
 
     def update_consumer_group(
@@ -1047,13 +983,7 @@ class AdminrestV1(BaseService):
 
         if not group_id:
             raise ValueError('group_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_consumer_group',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_consumer_group', content_type='application/json')
 
         data = {
             'topic': topic,
@@ -1062,8 +992,7 @@ class AdminrestV1(BaseService):
             'execute': execute,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1081,7 +1010,7 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='update_consumer_group', **kwargs)
         return response
 
     def get_mirroring_topic_selection(
@@ -1098,13 +1027,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `MirroringTopicSelection` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_mirroring_topic_selection',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_mirroring_topic_selection')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1118,7 +1041,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_mirroring_topic_selection', **kwargs)
         return response
 
     def replace_mirroring_topic_selection(
@@ -1139,20 +1062,13 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `MirroringTopicSelection` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='replace_mirroring_topic_selection',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('replace_mirroring_topic_selection', content_type='application/json')
 
         data = {
             'includes': includes,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1167,7 +1083,7 @@ class AdminrestV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='replace_mirroring_topic_selection', **kwargs)
         return response
 
     def get_mirroring_active_topics(
@@ -1184,13 +1100,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `MirroringActiveTopics` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_mirroring_active_topics',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_mirroring_active_topics')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1204,7 +1114,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_mirroring_active_topics', **kwargs)
         return response
 
     def get_status(
@@ -1221,13 +1131,7 @@ class AdminrestV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `InstanceStatus` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_status',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_status')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1241,7 +1145,7 @@ class AdminrestV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_status', **kwargs)
         return response
 
 
@@ -0,0 +1,48 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The administration REST API for IBM Event Streams on Cloud, driven by asyncio.
+"""
+
+from .adminrest_v1 import AdminrestV1
+from .async_common import AsyncBaseService
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class AsyncAdminrestV1(AsyncBaseService, AdminrestV1):
+    """
+    The adminrest V1 service over a pooled asyncio transport.
+
+    Every operation of `AdminrestV1` is available with the same parameters and returns
+    an awaitable resolving to a `DetailedResponse`:
+
+        async with AsyncAdminrestV1(authenticator=authenticator) as service:
+            service.set_service_url(url)
+            response = await service.get_topic('my-topic')
+    """
+
+    def enable_topic_cache(self, max_size=None, ttl=None) -> None:
+        """The topic cache is only available on the blocking `AdminrestV1` client."""
+        raise NotImplementedError('the topic cache is not supported by the async client')
+
+    async def probe_health(self) -> bool:  # pylint: disable=invalid-overridden-method
+        """Return whether the instance is not offline, according to get_status."""
+        status = (await self._send_probe(self._status_request(), 'get_status')).get_result() or {}
+        return status.get('status') != 'offline'
@@ -0,0 +1,263 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the asyncio transport shared by the async service clients.
+
+The async clients reuse the request building of the generated service classes and only
+replace `send`, so every operation keeps its signature but returns an awaitable.
+Requests are authenticated by `send` rather than `prepare_request`, in a worker thread
+for the authenticators that may fetch a token, so that the event loop never blocks.
+The transport is provided by the optional `httpx` package:
+
+    pip install "eventstreams_sdk[async]"
+"""
+
+import asyncio
+import functools
+import logging
+from json import JSONDecodeError
+from typing import Optional
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+
+from .deadline import Deadline, DeadlineExceeded
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+# The authenticators that never send a request, and can run on the event loop.
+_local_auth_types = frozenset(
+    (Authenticator.AUTHTYPE_NOAUTH, Authenticator.AUTHTYPE_BASIC, Authenticator.AUTHTYPE_BEARERTOKEN)
+)
+
+# Stands in for the authenticator while a request is prepared.
+_deferred_authenticator = NoAuthAuthenticator()
+
+
+class AsyncBaseService:
+    """
+    Mixin replacing the blocking transport of a generated service client with a pooled
+    asyncio one.
+
+    It must be placed before the generated service class in the bases of the async
+    client. A client instance owns one connection pool which is bound to the event loop
+    that first uses it; close it with `aclose()` or use the client as an async context
+    manager.
+    """
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport: 'httpx.AsyncBaseTransport' = None,
+    ) -> None:
+        """
+        Construct a new asyncio client.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+        :param int max_connections: (optional) The maximum number of concurrent
+               connections held by the pool.
+        :param int max_keepalive_connections: (optional) The maximum number of idle
+               connections kept alive for reuse.
+        :param float keepalive_expiry: (optional) The number of seconds an idle
+               connection is kept alive for reuse.
+        :param httpx.AsyncBaseTransport transport: (optional) A custom httpx
+               transport, e.g. `httpx.MockTransport` in tests.
+        """
+        if httpx is None:
+            raise ImportError('the async clients require httpx, install it with: pip install "eventstreams_sdk[async]"')
+        super().__init__(authenticator=authenticator)
+        self.async_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.async_transport = transport
+        self.async_client = None
+
+    def get_async_client(self) -> 'httpx.AsyncClient':
+        """Return the pooled httpx client, creating it on first use."""
+        if self.async_client is None:
+            self.async_client = httpx.AsyncClient(
+                limits=self.async_limits,
+                transport=self.async_transport,
+                verify=not self.disable_ssl_verification,
+            )
+        return self.async_client
+
+    def configure_connection_pool(self, **kwargs) -> None:
+        """The connection pool of the async clients is configured on construction."""
+        raise NotImplementedError(
+            'the connection pool of the async clients is configured with the max_connections, '
+            'max_keepalive_connections and keepalive_expiry arguments of the constructor'
+        )
+
+    def connection_stats(self):
+        """httpx does not report the reuse of the connections of its pool."""
+        raise NotImplementedError('connection statistics are not supported by the async clients')
+
+    def enable_retries(self, max_retries: int = 4, retry_interval: float = 30.0) -> None:
+        """The retries of the core only apply to the blocking transport."""
+        raise NotImplementedError('the async clients retry with enable_retry_policy()')
+
+    def enable_request_coalescing(self) -> None:
+        """Request coalescing is only available on the blocking clients."""
+        raise NotImplementedError('request coalescing is not supported by the async clients')
+
+    def prepare_request(self, method: str, url: str, **kwargs) -> dict:
+        """
+        Build a request like `BaseService.prepare_request`, but leave its
+        authentication to `send`.
+        """
+        # No other coroutine runs before the authenticator is restored.
+        authenticator, self.authenticator = self.authenticator, _deferred_authenticator
+        try:
+            return super().prepare_request(method, url, **kwargs)
+        finally:
+            self.authenticator = authenticator
+
+    async def _authenticate(self, request: dict) -> None:
+        """
+        Add the credentials of the authenticator to a request, fetching or refreshing
+        its token in a worker thread.
+        """
+        authenticator = self.authenticator
+        if authenticator.authentication_type() in _local_auth_types:
+            authenticator.authenticate(request)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, authenticator.authenticate, request)
+
+    # pylint: disable=invalid-overridden-method
+    async def send(
+        self, request: dict, operation_id: str = None, deadline: Optional[Deadline] = None, **kwargs
+    ) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or ApiException.
+
+        Only the `timeout` keyword (and the `timeout` entry of the http config) is
+        honoured; the other requests-specific options do not apply to this transport.
+
+        :param dict request: The request built by `prepare_request`.
+        :param str operation_id: (optional) The operation the request is sent for.
+        :param Deadline deadline: (optional) The deadline of the call, which bounds
+               the timeout of every attempt and stops the retries once it expires.
+        :raises ApiException: The exception from the API.
+        :raises DeadlineExceeded: The deadline expired before a response was received.
+        :return: The response from the request.
+        :rtype: DetailedResponse
+        """
+        await self._authenticate(request)
+        kwargs = dict({'timeout': DEFAULT_TIMEOUT}, **kwargs)
+        timeout = dict(kwargs, **self.http_config)['timeout']
+        send = functools.partial(self._send_attempt_async, request, operation_id, timeout, deadline)
+        if self.hedging_policy is not None and self.hedging_policy.applies_to(request['method'], operation_id):
+            send = functools.partial(self.hedging_policy.call_async, send, operation_id)
+        if self.circuit_breakers is not None:
+            send = functools.partial(self.circuit_breakers.call_async, send, operation_id)
+        if self.retry_policy is not None:
+            return await self.retry_policy.call_async(send, request['method'], operation_id, deadline)
+        return await send()
+
+    # pylint: disable=invalid-overridden-method
+    async def _send_probe(self, request: dict, operation_id: str) -> DetailedResponse:
+        await self._authenticate(request)
+        return await self._send_attempt_async(request, operation_id, self.probe_timeout, Deadline(self.probe_timeout))
+
+    async def _send_attempt_async(
+        self, request: dict, operation_id: str, timeout, deadline: Optional[Deadline]
+    ) -> DetailedResponse:
+        remaining = deadline.check() if deadline is not None else None
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(operation_id, timeout=remaining)
+            if wait is None:
+                raise DeadlineExceeded('the deadline of the call expires before the rate limit allows the request')
+            if wait > 0:
+                await asyncio.sleep(wait)
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        if self.concurrency_limit is not None:
+            return await self.concurrency_limit.call_async(self._send_until_async, deadline, request, timeout)
+        return await self._send_until_async(deadline, request, timeout)
+
+    async def _send_until_async(self, deadline: Optional[Deadline], request: dict, timeout) -> DetailedResponse:
+        # The concurrency limit sees DeadlineExceeded rather than a timeout cut short by the deadline.
+        try:
+            return await self._send_async(request, timeout)
+        except httpx.TimeoutException as err:
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded('the deadline of the call expired') from err
+            raise
+
+    async def _send_async(self, request: dict, timeout) -> DetailedResponse:
+        logger.debug('Sending HTTP request message')
+        response = await self.get_async_client().request(
+            request['method'],
+            request['url'],
+            headers=dict(request['headers']),
+            params=request.get('params'),
+            content=request.get('data'),
+            files=request.get('files') or None,
+            timeout=timeout,
+        )
+        logger.debug('Received HTTP response message, status code %d', response.status_code)
+
+        if 200 <= response.status_code <= 299:
+            if response.status_code == 204 or request['method'] == 'HEAD':
+                result = None
+            elif not response.content:
+                result = None
+            elif is_json_mimetype(response.headers.get('Content-Type')):
+                try:
+                    result = self.json_backend.loads(response.content)
+                except JSONDecodeError as err:
+                    raise ApiException(
+                        code=response.status_code,
+                        http_response=response,
+                        message='Error processing the HTTP response',
+                    ) from err
+            else:
+                result = response
+            return DetailedResponse(response=result, headers=response.headers, status_code=response.status_code)
+
+        raise ApiException(response.status_code, http_response=response)
+
+    async def aclose(self) -> None:
+        """Close the connection pool of this client."""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
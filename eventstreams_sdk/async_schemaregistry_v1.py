@@ -0,0 +1,43 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+IBM Event Streams schema registry management, driven by asyncio.
+"""
+
+from .async_common import AsyncBaseService
+from .schemaregistry_v1 import SchemaregistryV1
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class AsyncSchemaregistryV1(AsyncBaseService, SchemaregistryV1):
+    """
+    The schemaregistry V1 service over a pooled asyncio transport.
+
+    Every operation of `SchemaregistryV1` is available with the same parameters and
+    returns an awaitable resolving to a `DetailedResponse`:
+
+        async with AsyncSchemaregistryV1(authenticator=authenticator) as service:
+            service.set_service_url(url)
+            response = await service.get_latest_schema('my-schema')
+    """
+
+    def enable_schema_cache(self, max_versions=None, latest_schema_ttl=None) -> None:
+        """The schema cache is only available on the blocking `SchemaregistryV1` client."""
+        raise NotImplementedError('the schema cache is not supported by the async client')
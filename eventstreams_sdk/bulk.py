@@ -0,0 +1,456 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides bulk administration helpers over `AdminrestV1`.
+
+The helpers issue one request per item through a bounded pool of threads, optionally
+paced by a rate limit and narrowed by an adaptive concurrency limit, and report the
+outcome of every item instead of stopping at the first failure.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .adminrest_v1 import AdminrestV1, GroupDetail, GroupResetResultsItem, RecordDeleteRequestRecordsToDeleteItem
+from .concurrency import AdaptiveConcurrencyLimit
+from .deadline import Deadline, DeadlineExceeded
+from .lag import group_json, iter_consumer_group_details
+from .lazy_models import LazyGroupDetail
+from .pagination import DEFAULT_MAX_WORKERS, list_all_topics
+from .ratelimit import TokenBucket
+
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+SKIPPED = 'skipped'
+PLANNED = 'planned'
+RESET = 'reset'
+FAILED = 'failed'
+
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of one item of a bulk operation.
+
+    :attr str name: The name of the item, e.g. the topic name.
+    :attr str status: What happened to the item, e.g. 'created', 'skipped' or
+          'failed'.
+    :attr DetailedResponse response: (optional) The response of the request sent for
+          the item.
+    :attr Exception error: (optional) The exception raised by the request of a
+          failed item.
+    """
+
+    name: str
+    status: str
+    response: Optional[DetailedResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the item did not fail."""
+        return self.status != FAILED
+
+
+def run_bulk(
+    calls: Iterable[Tuple[str, str, Callable[[], DetailedResponse]]],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit: Optional[float] = None,
+    concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[BulkResult]:
+    """
+    Run calls concurrently and return their outcomes.
+
+    :param calls: The (name, status, call) tuples to run, where status is the status
+           of the item if its call succeeds. Each call sends one request.
+    :param int max_workers: (optional) The maximum number of calls in flight.
+    :param float rate_limit: (optional) The maximum number of calls started per
+           second.
+    :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+           number of calls in flight below max_workers as the service slows down or
+           throttles.
+    :param Deadline deadline: (optional) The deadline of the whole batch. The calls
+           not started when it expires fail with `DeadlineExceeded` without sending a
+           request; the calls should be given the same deadline to bound the others.
+    :return: The outcome of each call, in the order of calls.
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+    limiter = TokenBucket(rate_limit, capacity=1) if rate_limit is not None else None
+
+    def run(call: Tuple[str, str, Callable[[], DetailedResponse]]) -> BulkResult:
+        name, status, fn = call
+        if deadline is not None and deadline.expired:
+            return BulkResult(name, FAILED, error=DeadlineExceeded('the deadline of the batch has expired'))
+        if limiter is not None:
+            if not limiter.acquire(timeout=deadline.remaining() if deadline is not None else None):
+                return BulkResult(name, FAILED, error=DeadlineExceeded('the deadline of the batch has expired'))
+        try:
+            if concurrency is not None:
+                return BulkResult(name, status, response=concurrency.call(fn))
+            return BulkResult(name, status, response=fn())
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return BulkResult(name, FAILED, error=err)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, calls))
+
+
+def create_topics(
+    service: AdminrestV1,
+    specs: Iterable[Dict[str, Any]],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit: Optional[float] = None,
+    concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+    skip_existing: bool = False,
+    **kwargs,
+) -> List[BulkResult]:
+    """
+    Create topics concurrently.
+
+    A failed creation does not stop the others; its exception is returned in its
+    result.
+
+    :param AdminrestV1 service: The client used to create the topics.
+    :param specs: The topics to create, each given as the keyword arguments of
+           `AdminrestV1.create_topic`: 'name' and optionally 'partitions',
+           'partition_count' and 'configs'.
+    :param int max_workers: (optional) The maximum number of creations in flight.
+    :param float rate_limit: (optional) The maximum number of creations started per
+           second.
+    :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+           number of creations in flight below max_workers as the service slows down or
+           throttles.
+    :param bool skip_existing: (optional) List the topics of the instance first and
+           skip the specs of topics that already exist.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The result of each spec, in the order of specs, with status 'created',
+             'skipped' or 'failed'.
+    :rtype: List[BulkResult]
+    """
+    specs = list(specs)
+    if any(not spec.get('name') for spec in specs):
+        raise ValueError('every topic spec must have a name')
+    existing = set()
+    if skip_existing:
+        existing = {topic.name for topic in list_all_topics(service, max_workers=max_workers, lazy=True, **kwargs)}
+
+    calls = [
+        (spec['name'], CREATED, lambda spec=spec: service.create_topic(**spec, **kwargs))
+        for spec in specs
+        if spec['name'] not in existing
+    ]
+    results = iter(
+        run_bulk(
+            calls,
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+            concurrency=concurrency,
+            deadline=kwargs.get('deadline'),
+        )
+    )
+    return [BulkResult(spec['name'], SKIPPED) if spec['name'] in existing else next(results) for spec in specs]
+
+
+class OffsetReset(NamedTuple):
+    """
+    A reset of the offsets of a consumer group, see `AdminrestV1.update_consumer_group`.
+
+    :attr str group_id: The ID of the consumer group.
+    :attr str topic: (optional) The topic to reset, all the topics read by the group
+          if None.
+    :attr str mode: (optional) 'earliest', 'latest' or 'datetime'.
+    :attr str value: (optional) The datetime to reset to with mode 'datetime'.
+    """
+
+    group_id: str
+    topic: Optional[str] = None
+    mode: Optional[str] = None
+    value: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """Return the group ID, followed by the topic if any."""
+        return self.group_id if self.topic is None else self.group_id + '/' + self.topic
+
+
+class OffsetResetReport:
+    """
+    The outcome of the dry-runs of a batch of offset resets.
+
+    :attr List[OffsetReset] resets: The resets, in the order they were given.
+    :attr List[BulkResult] results: The dry-run result of each reset, with status
+          'planned' or 'failed'.
+    :attr Dict[OffsetReset, List[GroupResetResultsItem]] offsets: The offsets each
+          reset that could be planned would move its partitions to.
+    """
+
+    def __init__(self, resets: List[OffsetReset], results: List[BulkResult]) -> None:
+        self.resets = resets
+        self.results = results
+        self.offsets = {
+            reset: [GroupResetResultsItem.from_dict(item) for item in result.response.get_result() or ()]
+            for reset, result in zip(resets, results)
+            if result.ok
+        }
+
+    @property
+    def planned(self) -> List[OffsetReset]:
+        """Return the resets whose dry-run succeeded."""
+        return [reset for reset, result in zip(self.resets, self.results) if result.ok]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """Return the results of the dry-runs that failed."""
+        return [result for result in self.results if not result.ok]
+
+    def rows(self) -> Iterator[Tuple[str, str, int, int]]:
+        """
+        Iterate over the partitions the planned resets would move.
+
+        :return: An iterator of (group ID, topic, partition, new offset) tuples.
+        """
+        for reset, items in self.offsets.items():
+            for item in items:
+                yield reset.group_id, item.topic, item.partition, item.offset
+
+    def __str__(self) -> str:
+        lines = ['{0} {1}[{2}] -> {3}'.format(*row) for row in self.rows()]
+        lines.extend('! {0}: {1}'.format(result.name, result.error) for result in self.failed)
+        return '\n'.join(lines)
+
+
+def _reset_calls(service: AdminrestV1, resets: List[OffsetReset], status: str, execute: bool, kwargs: dict):
+    return [
+        (
+            reset.name,
+            status,
+            lambda reset=reset: service.update_consumer_group(
+                reset.group_id, topic=reset.topic, mode=reset.mode, value=reset.value, execute=execute, **kwargs
+            ),
+        )
+        for reset in resets
+    ]
+
+
+def dry_run_offset_resets(
+    service: AdminrestV1,
+    resets: Iterable[OffsetReset],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit: Optional[float] = None,
+    concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+    **kwargs,
+) -> OffsetResetReport:
+    """
+    Compute the offsets a batch of resets would move the partitions to, without
+    changing them.
+
+    The dry-runs are sent concurrently, as `update_consumer_group` requests with
+    `execute=False`.
+
+    :param AdminrestV1 service: The client used to reset the offsets.
+    :param resets: The resets to plan.
+    :param int max_workers: (optional) The maximum number of requests in flight.
+    :param float rate_limit: (optional) The maximum number of requests started per
+           second.
+    :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+           number of requests in flight below max_workers as the service slows down or
+           throttles.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :rtype: OffsetResetReport
+    """
+    resets = list(resets)
+    calls = _reset_calls(service, resets, PLANNED, False, kwargs)
+    results = run_bulk(
+        calls, max_workers=max_workers, rate_limit=rate_limit, concurrency=concurrency, deadline=kwargs.get('deadline')
+    )
+    return OffsetResetReport(resets, results)
+
+
+def execute_offset_resets(
+    service: AdminrestV1,
+    resets: Iterable[OffsetReset],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit: Optional[float] = None,
+    concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+    **kwargs,
+) -> List[BulkResult]:
+    """
+    Reset the offsets of consumer groups concurrently.
+
+    The consumer groups must be inactive. Typically called with the resets of an
+    `OffsetResetReport` that were reviewed, e.g. `report.planned`.
+
+    :param AdminrestV1 service: The client used to reset the offsets.
+    :param resets: The resets to execute.
+    :param int max_workers: (optional) The maximum number of requests in flight.
+    :param float rate_limit: (optional) The maximum number of requests started per
+           second.
+    :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+           number of requests in flight below max_workers as the service slows down or
+           throttles.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The result of each reset, in the order of resets, with status 'reset' or
+             'failed'. The result of the `update_consumer_group` requests are lists
+             of the new offsets of the partitions.
+    :rtype: List[BulkResult]
+    """
+    calls = _reset_calls(service, list(resets), RESET, True, kwargs)
+    return run_bulk(
+        calls, max_workers=max_workers, rate_limit=rate_limit, concurrency=concurrency, deadline=kwargs.get('deadline')
+    )
+
+
+def compute_record_deletions(
+    groups: Iterable[Union[dict, DetailedResponse, GroupDetail, LazyGroupDetail]], topics: Iterable[str]
+) -> Dict[str, List[RecordDeleteRequestRecordsToDeleteItem]]:
+    """
+    Compute the records of topics that every consumer group has already consumed.
+
+    For each partition of the topics, the records before the smallest offset committed
+    by any group can be deleted. Every committed offset counts, whether or not the end
+    offset of its partition is known. Partitions no group has committed an offset for,
+    partitions a group reports without a committed offset, and partitions with nothing
+    to delete, are left out.
+
+    :param groups: The consumer groups, as `get_consumer_group` results: json
+           dictionaries, responses, `GroupDetail` objects or `LazyGroupDetail` views.
+    :param topics: The topics to delete records from.
+    :raises ValueError: A committed offset has no partition.
+    :return: The records to delete, per topic, sorted by partition.
+    """
+    wanted = set(topics)
+    minimums = {}
+    # The partitions a group has not committed an offset for, whose records it has not read.
+    uncommitted = set()
+    for group in groups:
+        group = group_json(group)
+        for offset in group.get('offsets') or ():
+            topic = offset.get('topic')
+            if topic not in wanted:
+                continue
+            if offset.get('partition') is None:
+                raise ValueError('an offset of group {0} has no partition'.format(group.get('group_id')))
+            key = (topic, offset['partition'])
+            current_offset = offset.get('current_offset')
+            if current_offset is None:
+                uncommitted.add(key)
+                continue
+            minimum = minimums.get(key)
+            if minimum is None or current_offset < minimum:
+                minimums[key] = current_offset
+
+    deletions = {}
+    for (topic, partition), before_offset in sorted(minimums.items()):
+        if before_offset > 0 and (topic, partition) not in uncommitted:
+            deletions.setdefault(topic, []).append(
+                RecordDeleteRequestRecordsToDeleteItem(partition=partition, before_offset=before_offset)
+            )
+    return deletions
+
+
+def plan_record_deletions(
+    service: AdminrestV1,
+    topics: Iterable[str],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> Dict[str, List[RecordDeleteRequestRecordsToDeleteItem]]:
+    """
+    Compute the records of topics that every consumer group of the instance has
+    already consumed.
+
+    The offsets of all the consumer groups are collected concurrently with
+    `iter_consumer_group_details`. Groups deleted while they are collected are
+    ignored; any other failure to get a group raises, since the offsets of that group
+    are unknown.
+
+    :param AdminrestV1 service: The client used to get the consumer groups.
+    :param topics: The topics to delete records from.
+    :param int max_workers: (optional) The maximum number of groups fetched
+           concurrently.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :raises ApiException: A consumer group could not be fetched.
+    :return: The records to delete, per topic, sorted by partition.
+    """
+
+    def groups() -> Iterator[dict]:
+        for _, group in iter_consumer_group_details(service, max_workers=max_workers, **kwargs):
+            if isinstance(group, ApiException):
+                if group.status_code != 404:
+                    raise group
+            else:
+                yield group
+
+    return compute_record_deletions(groups(), topics)
+
+
+def delete_records(
+    service: AdminrestV1,
+    deletions: Dict[str, List[RecordDeleteRequestRecordsToDeleteItem]],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit: Optional[float] = None,
+    concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+    **kwargs,
+) -> List[BulkResult]:
+    """
+    Delete records concurrently, with one `delete_topic_records` request per topic.
+
+    :param AdminrestV1 service: The client used to delete the records.
+    :param dict deletions: The records to delete per topic, e.g. as returned by
+           `plan_record_deletions`.
+    :param int max_workers: (optional) The maximum number of requests in flight.
+    :param float rate_limit: (optional) The maximum number of requests started per
+           second.
+    :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+           number of requests in flight below max_workers as the service slows down or
+           throttles.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The result of each topic, with status 'deleted' or 'failed'.
+    :rtype: List[BulkResult]
+    """
+    calls = [
+        (
+            topic,
+            DELETED,
+            lambda topic=topic, records=records: service.delete_topic_records(
+                topic, records_to_delete=records, **kwargs
+            ),
+        )
+        for topic, records in deletions.items()
+    ]
+    return run_bulk(
+        calls, max_workers=max_workers, rate_limit=rate_limit, concurrency=concurrency, deadline=kwargs.get('deadline')
+    )
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the in-process response cache used by the service clients.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+Generation = Tuple[int, int]
+
+
+class TTLCache:
+    """
+    A thread-safe cache with least-recently-used eviction and per-entry expiry.
+
+    A value read from the service is cached with the generation of its key taken
+    before the read, so that a value read while the key was invalidated, e.g. by a
+    concurrent update, is not cached:
+
+        generation = cache.generation(key)
+        value = read(key)
+        cache.put(key, value, generation)
+
+    :param int max_size: (optional) The maximum number of entries; the least
+          recently used entry is evicted when it is exceeded. None means unbounded.
+    :param float ttl: (optional) The number of seconds an entry stays valid. None
+          means entries never expire.
+    :param Callable clock: (optional) The monotonic clock used for expiry.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = 1024,
+        ttl: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError('max_size must be a positive integer or None')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be a positive number or None')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        # The number of times each key was invalidated since the epoch started, and the
+        # epoch, which invalidate_if and clear advance for every key.
+        self._generations: Dict[Hashable, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value cached for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def generation(self, key: Hashable) -> Generation:
+        """Return the generation of key, which changes whenever key is invalidated."""
+        with self._lock:
+            return (self._epoch, self._generations.get(key, 0))
+
+    def put(self, key: Hashable, value: Any, generation: Optional[Generation] = None) -> None:
+        """
+        Cache value under key, evicting the least recently used entry if full.
+
+        :param generation: (optional) The generation of key before value was read. The
+               value is not cached if key was invalidated since.
+        """
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if generation is not None and generation != (self._epoch, self._generations.get(key, 0)):
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the entry cached for key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if len(self._generations) > max(self.max_size or 0, 1024):
+                # Bound the generations kept; a new epoch invalidates the reads in flight.
+                self._new_epoch()
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+            self._new_epoch()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._new_epoch()
+
+    def _new_epoch(self) -> None:
+        self._epoch += 1
+        self._generations.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the size of the cache and its hit, miss and eviction counters."""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
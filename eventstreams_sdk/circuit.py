@@ -0,0 +1,251 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the circuit breakers of the service clients.
+
+A circuit opens after consecutive failures of an operation and then fails its calls
+immediately, instead of letting every caller wait for a timeout from an instance that is
+offline. Once `reset_timeout` has elapsed, one caller probes the health of the service
+and, if it is healthy, sends a trial request whose outcome closes or reopens the circuit.
+"""
+
+import inspect
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+import requests
+from ibm_cloud_sdk_core import ApiException
+
+from .deadline import DeadlineExceeded
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_failure_errors = (TimeoutError, ConnectionError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+if httpx is not None:
+    _failure_errors += (httpx.TransportError,)
+
+
+def is_failure(error: BaseException) -> bool:
+    """
+    Return whether an error counts against the circuit: a 5xx response, a timeout or a
+    connection failure. Throttling (429), client errors and expired deadlines do not.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if isinstance(error, ApiException):
+        return error.status_code >= 500
+    return isinstance(error, _failure_errors)
+
+
+class CircuitOpenError(ApiException):
+    """
+    The error raised, without sending a request, by the calls of an operation whose
+    circuit is open. It is an `ApiException` with status code 503.
+
+    :attr str operation_id: The operation whose circuit is open.
+    """
+
+    def __init__(self, operation_id: Optional[str]) -> None:
+        super().__init__(503, message='the circuit of operation {0} is open'.format(operation_id))
+        self.operation_id = operation_id
+
+
+class CircuitBreaker:
+    """
+    The thread-safe circuit of one operation.
+
+    :param int failure_threshold: (optional) The number of consecutive failures
+          opening the circuit.
+    :param float reset_timeout: (optional) The number of seconds the circuit stays
+          open before it is probed.
+    :param Callable clock: (optional) The monotonic clock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+        if reset_timeout <= 0:
+            raise ValueError('reset_timeout must be positive')
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> Optional[str]:
+        """
+        Return the state a call is made in: CLOSED, or HALF_OPEN for the one call
+        probing the circuit once `reset_timeout` has elapsed. Return None when the call
+        must fail: the circuit is open, or being probed by another call.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return CLOSED
+            if self.state == OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                return HALF_OPEN
+            return None
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit after failure_threshold of them or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+    def record_outcome(self, error: Optional[BaseException]) -> None:
+        """Record the outcome of a call; errors that are not failures count as successes."""
+        if error is not None and is_failure(error):
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+class CircuitBreakers:
+    """
+    The circuits of the operations of a client.
+
+    :param int failure_threshold: (optional) The number of consecutive failures of an
+          operation opening its circuit.
+    :param float reset_timeout: (optional) The number of seconds a circuit stays open
+          before it is probed.
+    :param Callable probe: (optional) A function, or coroutine function, returning
+          whether the service is healthy enough for a trial request. Without it, the
+          trial request is the probe.
+    :param Iterable exempt: (optional) The ids of the operations not guarded, such as
+          the health checks used by probe.
+    :param Callable clock: (optional) The monotonic clock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        probe: Optional[Callable[[], Union[bool, Awaitable[bool]]]] = None,
+        exempt: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Validate the arguments now rather than on the first call.
+        CircuitBreaker(failure_threshold, reset_timeout)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self.exempt = frozenset(exempt)
+        self.clock = clock
+        self.circuits: Dict[Optional[str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, operation_id: Optional[str]) -> CircuitBreaker:
+        """Return the circuit of an operation, creating it on first use."""
+        with self._lock:
+            circuit = self.circuits.get(operation_id)
+            if circuit is None:
+                circuit = self.circuits[operation_id] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, clock=self.clock
+                )
+            return circuit
+
+    def state(self, operation_id: Optional[str]) -> str:
+        """Return the state of the circuit of an operation."""
+        with self._lock:
+            circuit = self.circuits.get(operation_id)
+        return circuit.state if circuit is not None else CLOSED
+
+    def _before_call(self, circuit: CircuitBreaker, operation_id: Optional[str]) -> str:
+        state = circuit.before_call()
+        if state is None:
+            raise CircuitOpenError(operation_id)
+        return state
+
+    def call(self, fn: Callable[[], Any], operation_id: Optional[str] = None) -> Any:
+        """
+        Call fn, which sends one request, unless the circuit of its operation is open.
+
+        :raises CircuitOpenError: The circuit is open.
+        """
+        if operation_id in self.exempt:
+            return fn()
+        circuit = self.get(operation_id)
+        if self._before_call(circuit, operation_id) == HALF_OPEN and self.probe is not None:
+            if not _healthy(self.probe):
+                circuit.record_failure()
+                raise CircuitOpenError(operation_id)
+        try:
+            result = fn()
+        except BaseException as err:
+            circuit.record_outcome(err)
+            raise
+        circuit.record_success()
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]], operation_id: Optional[str] = None) -> Any:
+        """Await fn unless the circuit of its operation is open; see `call`."""
+        if operation_id in self.exempt:
+            return await fn()
+        circuit = self.get(operation_id)
+        if self._before_call(circuit, operation_id) == HALF_OPEN and self.probe is not None:
+            if not await _healthy_async(self.probe):
+                circuit.record_failure()
+                raise CircuitOpenError(operation_id)
+        try:
+            result = await fn()
+        except BaseException as err:
+            circuit.record_outcome(err)
+            raise
+        circuit.record_success()
+        return result
+
+
+def _healthy(probe: Callable[[], bool]) -> bool:
+    try:
+        return bool(probe())
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+async def _healthy_async(probe: Callable[[], Union[bool, Awaitable[bool]]]) -> bool:
+    try:
+        healthy = probe()
+        if inspect.isawaitable(healthy):
+            healthy = await healthy
+        return bool(healthy)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
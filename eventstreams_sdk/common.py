@@ -18,7 +18,28 @@
 This module provides common methods for use across all service modules.
 """
 
+import functools
 import platform
+from typing import Dict, Mapping, Optional, Union
+
+import requests
+from ibm_cloud_sdk_core import BaseService, DetailedResponse
+
+from eventstreams_sdk.circuit import CircuitBreakers
+from eventstreams_sdk.concurrency import AdaptiveConcurrencyLimit
+from eventstreams_sdk.connection_pool import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_MAX_HOSTS,
+    ConnectionStats,
+    PooledHTTPAdapter,
+    keepalive_socket_options,
+)
+from eventstreams_sdk.deadline import Deadline, DeadlineExceeded, current_deadline
+from eventstreams_sdk.hedging import HedgingPolicy
+from eventstreams_sdk.json_backend import JSONBackend, get_json_backend
+from eventstreams_sdk.ratelimit import RateLimiter
+from eventstreams_sdk.retry import RetryPolicy
+from eventstreams_sdk.singleflight import SingleFlight
 from eventstreams_sdk.version import __version__
 
 HEADER_NAME_USER_AGENT = 'User-Agent'
@@ -66,3 +87,371 @@ def get_sdk_headers(service_name, service_version, operation_id):
     headers = {}
     headers[HEADER_NAME_USER_AGENT] = get_user_agent()
     return headers
+
+
+class EventStreamsBaseService(BaseService):
+    """
+    Base class of the Event Streams service clients.
+
+    It adds opt-in client-side policies around `BaseService.send`, shared by every
+    operation of the services.
+    """
+
+    SERVICE_VERSION = 'V1'
+
+    # The health check operations, which are not guarded by the circuit breakers.
+    HEALTH_OPERATIONS = ()
+
+    def __init__(self, **kwargs) -> None:
+        # Read by the adapter mounting overrides, which the core may call on construction.
+        self.connection_pool = {}
+        self.json_backend = get_json_backend()
+        BaseService.__init__(self, **kwargs)
+        self.operation_headers = {}
+        self.request_coalescing = None
+        self.rate_limiter = None
+        self.concurrency_limit = None
+        self.retry_policy = None
+        self.hedging_policy = None
+        self.circuit_breakers = None
+        self.probe_timeout = 5.0
+        self.mount_http_adapter()
+
+    def get_operation_headers(self, operation_id: str, *, content_type: Optional[str] = None) -> Dict[str, str]:
+        """
+        Return a new dict holding the static request headers of an operation.
+
+        The headers are built by `get_sdk_headers` the first time the operation is invoked
+        on this client and copied on later invocations.
+
+        :param str operation_id: The operation the request is sent for.
+        :param str content_type: (optional) The content type of the request body of
+               the operation.
+        """
+        headers = self.operation_headers.get(operation_id)
+        if headers is None:
+            headers = get_sdk_headers(
+                service_name=self.DEFAULT_SERVICE_NAME,
+                service_version=self.SERVICE_VERSION,
+                operation_id=operation_id,
+            )
+            if content_type is not None:
+                headers['content-type'] = content_type
+            self.operation_headers[operation_id] = headers
+        return headers.copy()
+
+    def configure_connection_pool(
+        self,
+        *,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_hosts: int = DEFAULT_MAX_HOSTS,
+        pool_block: bool = False,
+        keepalive_idle: Optional[float] = None,
+    ) -> None:
+        """
+        Size the connection pool of this client and configure the keep-alive of its
+        connections.
+
+        Connections are kept open and reused across requests. Size
+        `max_connections_per_host` to the number of threads sending requests
+        concurrently so that each of them finds an idle connection rather than opening,
+        and later discarding, its own.
+
+        :param int max_connections_per_host: (optional) The maximum number of
+               connections kept open to the service endpoint.
+        :param int max_hosts: (optional) The maximum number of hosts, e.g. the
+               endpoints of redirects, the client keeps a pool of connections for.
+        :param bool pool_block: (optional) When all the connections to a host are in
+               use, wait for one to be released rather than opening a connection that
+               is discarded after the request.
+        :param float keepalive_idle: (optional) Send TCP keep-alive probes on the
+               connections idle for this number of seconds, so that load balancers and
+               NATs do not drop idle pooled connections. Not sent when not given.
+        """
+        if max_connections_per_host < 1:
+            raise ValueError('max_connections_per_host must be at least 1')
+        if max_hosts < 1:
+            raise ValueError('max_hosts must be at least 1')
+        if keepalive_idle is not None and keepalive_idle <= 0:
+            raise ValueError('keepalive_idle must be positive')
+        self.connection_pool = {
+            'pool_connections': max_hosts,
+            'pool_maxsize': max_connections_per_host,
+            'pool_block': pool_block,
+        }
+        if keepalive_idle is not None:
+            self.connection_pool['socket_options'] = keepalive_socket_options(keepalive_idle)
+        self.mount_http_adapter()
+
+    def mount_http_adapter(self) -> None:
+        """Mount a new HTTP adapter with the retry, SSL and pool configuration of this client."""
+        kwargs = dict(self.connection_pool)
+        if self.retry_config is not None:
+            kwargs['max_retries'] = self.retry_config
+        self.http_adapter = PooledHTTPAdapter(
+            _disable_ssl_verification=self.disable_ssl_verification, json_backend=self.json_backend, **kwargs
+        )
+        self.http_client.mount('http://', self.http_adapter)
+        self.http_client.mount('https://', self.http_adapter)
+
+    def set_json_backend(self, backend: Union[str, JSONBackend, None] = None) -> None:
+        """
+        Set the JSON library encoding the request bodies and decoding the response bodies.
+
+        :param backend: (optional) A `JSONBackend`, or the name of a library: 'orjson',
+               'ujson' or 'json'. Defaults to the fastest library installed.
+        :raises ImportError: The library is not installed.
+        """
+        self.json_backend = backend if isinstance(backend, JSONBackend) else get_json_backend(backend)
+        self.mount_http_adapter()
+
+    def enable_retries(self, max_retries: int = 4, retry_interval: float = 30.0) -> None:
+        super().enable_retries(max_retries=max_retries, retry_interval=retry_interval)
+        self.mount_http_adapter()
+
+    def disable_retries(self) -> None:
+        super().disable_retries()
+        self.mount_http_adapter()
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        if self.disable_ssl_verification != status:
+            super().set_disable_ssl_verification(status)
+            self.mount_http_adapter()
+
+    def connection_stats(self) -> ConnectionStats:
+        """
+        Return the number of requests sent and of connections opened to send them since
+        the connection pool was last configured.
+
+        The `reuse_rate` of the result is the share of the requests that did not pay for
+        a new connection (and TLS handshake); a low rate under concurrency calls for a
+        larger `max_connections_per_host`.
+
+        :rtype: ConnectionStats
+        """
+        if not isinstance(self.http_adapter, PooledHTTPAdapter):
+            return ConnectionStats(0, 0)
+        return self.http_adapter.connection_stats()
+
+    def enable_request_coalescing(self) -> None:
+        """
+        Share one HTTP call between concurrent identical GET requests.
+
+        While a GET request for a URL, set of query parameters and headers is in flight,
+        identical requests from other threads wait for it and receive the same
+        `DetailedResponse` (or exception) rather than sending their own. The keyword
+        arguments, such as the timeout, of the request that is actually sent apply to all
+        of them, but a waiting call given a deadline stops waiting when it expires. Shared
+        responses must not be modified.
+        """
+        self.request_coalescing = SingleFlight()
+
+    def disable_request_coalescing(self) -> None:
+        """Send every request on its own."""
+        self.request_coalescing = None
+
+    def enable_rate_limiting(
+        self,
+        rate: Optional[float] = None,
+        *,
+        burst: Optional[float] = None,
+        operation_rates: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """
+        Limit the rate of the requests sent by this client.
+
+        Requests wait for a token rather than being sent in bursts the service answers
+        with 429 responses. Rates can be set for all the operations and for individual
+        operations, e.g. `operation_rates={'create_topic': 2.0}`; a request then takes a
+        token from both. Threads sharing the client share its limits; to share them
+        between clients, assign the `rate_limiter` of one to the others.
+
+        :param float rate: (optional) The maximum number of requests sent per second,
+               all operations included. None means no global limit.
+        :param float burst: (optional) The number of requests that can be sent at once
+               after an idle period. Defaults to one second worth of requests.
+        :param Mapping operation_rates: (optional) The maximum number of requests sent
+               per second, by operation id (the name of the client method).
+        """
+        self.rate_limiter = RateLimiter(rate, burst=burst, operation_rates=operation_rates)
+
+    def disable_rate_limiting(self) -> None:
+        """Send requests without waiting for a rate limit."""
+        self.rate_limiter = None
+
+    def enable_adaptive_concurrency(self, initial_limit: int = 8, *, min_limit: int = 1, max_limit: int = 64) -> None:
+        """
+        Limit the number of requests this client has in flight, adapting the limit to
+        the latency and the errors of the service.
+
+        The limit grows while the latency is stable and shrinks on 429 and 5xx
+        responses, timeouts and latency spikes; requests beyond it wait for a request to
+        complete. See `AdaptiveConcurrencyLimit`, whose state is available as
+        `concurrency_limit`.
+
+        :param int initial_limit: (optional) The limit before any request completes.
+        :param int min_limit: (optional) The lowest limit.
+        :param int max_limit: (optional) The highest limit.
+        """
+        self.concurrency_limit = AdaptiveConcurrencyLimit(initial_limit, min_limit=min_limit, max_limit=max_limit)
+
+    def disable_adaptive_concurrency(self) -> None:
+        """Send requests without a concurrency limit."""
+        self.concurrency_limit = None
+
+    def enable_retry_policy(self, policy: Optional[RetryPolicy] = None) -> None:
+        """
+        Retry the failed requests of the operations that are safe to repeat.
+
+        The policy replaces the retries of `enable_retries`, which are disabled. Each
+        attempt goes through the rate limit and concurrency limit of the client, if
+        enabled.
+
+        :param RetryPolicy policy: (optional) The retry policy. Defaults to
+               `RetryPolicy()`: up to 4 attempts of idempotent operations, with
+               decorrelated jitter, within the retry budget of the process.
+        """
+        if self.retry_config is not None:
+            self.disable_retries()
+        self.retry_policy = policy if policy is not None else RetryPolicy()
+
+    def disable_retry_policy(self) -> None:
+        """Send every request once, unless `enable_retries` is enabled."""
+        self.retry_policy = None
+
+    def enable_hedging(self, policy: Optional[HedgingPolicy] = None) -> None:
+        """
+        Send a duplicate of the GET requests that are slower than usual, and use the
+        first response.
+
+        Each duplicate goes through the rate limit and concurrency limit of the client,
+        if enabled. With a retry policy, every attempt is hedged.
+
+        :param HedgingPolicy policy: (optional) The hedging policy. Defaults to
+               `HedgingPolicy()`: every GET operation is hedged after the 95th
+               percentile of its latency, with up to 5% extra requests.
+        """
+        self.hedging_policy = policy if policy is not None else HedgingPolicy()
+
+    def disable_hedging(self) -> None:
+        """Send every request once."""
+        self.hedging_policy = None
+
+    def enable_circuit_breaker(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0, probe_timeout: float = 5.0
+    ) -> None:
+        """
+        Fail the calls of an operation immediately after consecutive failures.
+
+        Each operation has its own circuit, which opens after `failure_threshold`
+        consecutive 5xx responses, timeouts or connection failures. While it is open,
+        calls raise `CircuitOpenError` (an `ApiException` with status code 503) without
+        sending a request. After `reset_timeout` seconds, the next call checks the
+        health of the service with `probe_health()` and, if it is healthy, is sent as a
+        trial whose outcome closes or reopens the circuit. The health check is sent once,
+        without retries or hedging. The state of the circuits is available from
+        `circuit_breakers`.
+
+        :param int failure_threshold: (optional) The number of consecutive failures of
+               an operation opening its circuit.
+        :param float reset_timeout: (optional) The number of seconds a circuit stays
+               open before it is probed.
+        :param float probe_timeout: (optional) The number of seconds the health check
+               is given to respond.
+        """
+        if probe_timeout <= 0:
+            raise ValueError('probe_timeout must be positive')
+        self.probe_timeout = probe_timeout
+        self.circuit_breakers = CircuitBreakers(
+            failure_threshold, reset_timeout, probe=self.probe_health, exempt=self.HEALTH_OPERATIONS
+        )
+
+    def disable_circuit_breaker(self) -> None:
+        """Send the calls of every operation whatever their failures."""
+        self.circuit_breakers = None
+
+    def probe_health(self) -> bool:
+        """
+        Return whether the service is healthy enough for the trial request of a circuit
+        breaker. The service clients without a health check rely on the trial request.
+        """
+        return True
+
+    def _send_probe(self, request: dict, operation_id: str) -> DetailedResponse:
+        # The health check of a circuit breaker is sent once, within probe_timeout.
+        return self._send_attempt(request, operation_id, Deadline(self.probe_timeout))
+
+    def send(
+        self, request: dict, operation_id: Optional[str] = None, deadline: Optional[Deadline] = None, **kwargs
+    ) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or ApiException,
+        applying the client-side policies enabled on this client.
+
+        :param dict request: The request built by `prepare_request`.
+        :param str operation_id: (optional) The operation the request is sent for.
+        :param Deadline deadline: (optional) The deadline of the call, which bounds
+               the timeout of every attempt and stops the retries once it expires.
+        :raises DeadlineExceeded: The deadline expired before a response was received.
+        """
+        if self.request_coalescing is not None and request['method'] == 'GET' and not kwargs.get('stream'):
+            params = request.get('params') or {}
+            headers = request.get('headers') or {}
+            key = (
+                request['url'],
+                tuple(sorted((k, str(v)) for k, v in params.items())),
+                tuple(sorted((k.lower(), str(v)) for k, v in headers.items())),
+            )
+            return self.request_coalescing.do(
+                key, lambda: self._send(request, operation_id, deadline, **kwargs), deadline
+            )
+        return self._send(request, operation_id, deadline, **kwargs)
+
+    def _send(
+        self, request: dict, operation_id: Optional[str], deadline: Optional[Deadline], **kwargs
+    ) -> DetailedResponse:
+        send = functools.partial(self._send_attempt, request, operation_id, deadline, **kwargs)
+        hedging = self.hedging_policy
+        if hedging is not None and not kwargs.get('stream') and hedging.applies_to(request['method'], operation_id):
+            send = functools.partial(hedging.call, send, operation_id)
+        if self.circuit_breakers is not None:
+            send = functools.partial(self.circuit_breakers.call, send, operation_id)
+        if self.retry_policy is not None:
+            return self.retry_policy.call(send, request['method'], operation_id, deadline)
+        return send()
+
+    def _send_attempt(
+        self, request: dict, operation_id: Optional[str], deadline: Optional[Deadline], **kwargs
+    ) -> DetailedResponse:
+        if deadline is None:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(operation_id)
+            if self.concurrency_limit is not None:
+                return self.concurrency_limit.call(super().send, request, **kwargs)
+            return super().send(request, **kwargs)
+
+        remaining = deadline.check()
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(operation_id, timeout=remaining)
+            if wait is None:
+                raise DeadlineExceeded('the deadline of the call expires before the rate limit allows the request')
+            if wait > 0:
+                self.rate_limiter.sleep(wait)
+        # The HTTP adapter shortens the timeout of the request to the time left.
+        token = current_deadline.set(deadline)
+        try:
+            if self.concurrency_limit is not None:
+                return self.concurrency_limit.call(self._send_until, deadline, request, **kwargs)
+            return self._send_until(deadline, request, **kwargs)
+        finally:
+            current_deadline.reset(token)
+
+    def _send_until(self, deadline: Deadline, request: dict, **kwargs) -> DetailedResponse:
+        # A timeout cut short by the deadline says nothing about the service, so that
+        # the concurrency limit sees DeadlineExceeded rather than the timeout.
+        try:
+            return super().send(request, **kwargs)
+        except requests.exceptions.Timeout as err:
+            if deadline.expired:
+                raise DeadlineExceeded('the deadline of the call expired') from err
+            raise
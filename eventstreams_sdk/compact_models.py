@@ -0,0 +1,232 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides compact variants of the small, high-volume admin REST models.
+
+The variants declare `__slots__` and so carry no per-instance `__dict__`, which makes
+them noticeably cheaper to hold in large numbers, e.g. the offsets of every partition
+of every consumer group. They have the same attributes and the same `from_dict` and
+`to_dict` methods as the models of `eventstreams_sdk.adminrest_v1`; unlike them, no
+attributes other than the model properties can be set on an instance.
+"""
+
+from typing import Dict, List, Optional
+import json
+
+
+class CompactModel:
+    """
+    Base class of the compact models.
+
+    Subclasses list their properties in `__slots__`, in the order they are serialized.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CompactModel':
+        """Initialize a model object from a json dictionary."""
+        return cls(**{name: value for name in cls.__slots__ if (value := _dict.get(name)) is not None})
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a model object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def __str__(self) -> str:
+        """Return a `str` version of this model object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CompactModel') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __ne__(self, other: 'CompactModel') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CompactBrokerDetailConfigsItem(CompactModel):
+    """
+    Compact variant of BrokerDetailConfigsItem.
+
+    :param str name: (optional) The name of the config property.
+    :param str value: (optional) The value for a config property.
+    :param bool is_sensitive: (optional) When true, the value cannot be displayed
+          and will be returned with a null value.
+    """
+
+    __slots__ = ('name', 'value', 'is_sensitive')
+
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        value: Optional[str] = None,
+        is_sensitive: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize a CompactBrokerDetailConfigsItem object.
+
+        :param str name: (optional) The name of the config property.
+        :param str value: (optional) The value for a config property.
+        :param bool is_sensitive: (optional) When true, the value cannot be
+               displayed and will be returned with a null value.
+        """
+        self.name = name
+        self.value = value
+        self.is_sensitive = is_sensitive
+
+
+class CompactMemberAssignmentsItem(CompactModel):
+    """
+    Compact variant of MemberAssignmentsItem.
+
+    :param str topic: (optional) The name of the topic.
+    :param int partition: (optional) The ID of the partition.
+    """
+
+    __slots__ = ('topic', 'partition')
+
+    def __init__(
+        self,
+        *,
+        topic: Optional[str] = None,
+        partition: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a CompactMemberAssignmentsItem object.
+
+        :param str topic: (optional) The name of the topic.
+        :param int partition: (optional) The ID of the partition.
+        """
+        self.topic = topic
+        self.partition = partition
+
+
+class CompactTopicDetailReplicaAssignmentsItemBrokers(CompactModel):
+    """
+    Compact variant of TopicDetailReplicaAssignmentsItemBrokers.
+
+    :param List[int] replicas: (optional)
+    """
+
+    __slots__ = ('replicas',)
+
+    def __init__(
+        self,
+        *,
+        replicas: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Initialize a CompactTopicDetailReplicaAssignmentsItemBrokers object.
+
+        :param List[int] replicas: (optional)
+        """
+        self.replicas = replicas
+
+
+class CompactTopicDetailReplicaAssignmentsItem(CompactModel):
+    """
+    Compact variant of TopicDetailReplicaAssignmentsItem.
+
+    :param int id: (optional) The ID of the partition.
+    :param CompactTopicDetailReplicaAssignmentsItemBrokers brokers: (optional)
+    """
+
+    __slots__ = ('id', 'brokers')
+
+    def __init__(
+        self,
+        *,
+        id: Optional[int] = None,
+        brokers: Optional['CompactTopicDetailReplicaAssignmentsItemBrokers'] = None,
+    ) -> None:
+        """
+        Initialize a CompactTopicDetailReplicaAssignmentsItem object.
+
+        :param int id: (optional) The ID of the partition.
+        :param CompactTopicDetailReplicaAssignmentsItemBrokers brokers: (optional)
+        """
+        self.id = id
+        self.brokers = brokers
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CompactTopicDetailReplicaAssignmentsItem':
+        """Initialize a CompactTopicDetailReplicaAssignmentsItem object from a json dictionary."""
+        args = {}
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (brokers := _dict.get('brokers')) is not None:
+            args['brokers'] = CompactTopicDetailReplicaAssignmentsItemBrokers.from_dict(brokers)
+        return cls(**args)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if self.id is not None:
+            _dict['id'] = self.id
+        if self.brokers is not None:
+            if isinstance(self.brokers, dict):
+                _dict['brokers'] = self.brokers
+            else:
+                _dict['brokers'] = self.brokers.to_dict()
+        return _dict
+
+
+class CompactTopicPartitionOffset(CompactModel):
+    """
+    Compact variant of TopicPartitionOffset.
+
+    :param str topic: (optional) The name of the topic.
+    :param int partition: (optional) The ID of the partition.
+    :param int current_offset: (optional) Current offset of the partition.
+    :param int end_offset: (optional) End offset of the partition.
+    """
+
+    __slots__ = ('topic', 'partition', 'current_offset', 'end_offset')
+
+    def __init__(
+        self,
+        *,
+        topic: Optional[str] = None,
+        partition: Optional[int] = None,
+        current_offset: Optional[int] = None,
+        end_offset: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a CompactTopicPartitionOffset object.
+
+        :param str topic: (optional) The name of the topic.
+        :param int partition: (optional) The ID of the partition.
+        :param int current_offset: (optional) Current offset of the partition.
+        :param int end_offset: (optional) End offset of the partition.
+        """
+        self.topic = topic
+        self.partition = partition
+        self.current_offset = current_offset
+        self.end_offset = end_offset
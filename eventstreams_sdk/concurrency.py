@@ -0,0 +1,227 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a concurrency limit that adapts to the latency and the errors of
+the requests it lets through.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+import requests
+from ibm_cloud_sdk_core import ApiException
+
+from .deadline import DeadlineExceeded
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+_overload_errors = (TimeoutError, ConnectionError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+if httpx is not None:
+    _overload_errors += (httpx.TransportError,)
+
+
+def is_overload(error: BaseException) -> bool:
+    """
+    Return whether an error signals an overloaded service: a 429 or 5xx response, a
+    timeout or a connection failure. An expired deadline of the caller does not.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if isinstance(error, ApiException):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, _overload_errors)
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    A limit of the number of requests in flight, adjusted with additive increase and
+    multiplicative decrease (AIMD).
+
+    While the latency of the requests stays close to the lowest latency of the last
+    `min_latency_window` successful requests, the limit grows by about `increase` every
+    `limit` requests completed while it was at least half used. It is multiplied by
+    `backoff` when a request fails with an overload error (see `is_overload`) or when
+    the smoothed latency exceeds `latency_tolerance` times that lowest latency.
+    Requests started before a decrease do not trigger another one, so a burst of
+    failures shrinks the limit once. Other errors, such as fast 404 responses, leave
+    the limit and the latencies unchanged.
+
+    The limit is shared by the threads calling `call`, or by the coroutines of one event
+    loop calling `call_async`.
+
+    :param int initial_limit: (optional) The limit before any request completes.
+    :param int min_limit: (optional) The lowest limit.
+    :param int max_limit: (optional) The highest limit.
+    :param float increase: (optional) The growth of the limit per window of requests.
+    :param float backoff: (optional) The factor applied to the limit on overload.
+    :param float latency_tolerance: (optional) The ratio of the smoothed latency to the
+          lowest latency above which the service is considered overloaded.
+    :param float smoothing: (optional) The weight of a new latency in the smoothed
+          latency.
+    :param int min_latency_window: (optional) The number of successful requests the
+          lowest latency is taken over, so that it follows a lasting change of the
+          latency of the service.
+    :param Callable clock: (optional) The monotonic clock used to time requests.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        min_latency_window: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_limit < 1:
+            raise ValueError('min_limit must be at least 1')
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError('initial_limit must be between min_limit and max_limit')
+        if not 0 < backoff < 1:
+            raise ValueError('backoff must be between 0 and 1')
+        if latency_tolerance <= 1:
+            raise ValueError('latency_tolerance must be greater than 1')
+        if min_latency_window < 1:
+            raise ValueError('min_latency_window must be at least 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.min_latency_window = min_latency_window
+        self.clock = clock
+        self.in_flight = 0
+        self.min_latency = None
+        self.latency = None
+        self.decreases = 0
+        self._limit = float(initial_limit)
+        self._decreased_at = float('-inf')
+        # The (index, latency) of the samples that may become the lowest of the window, by increasing latency.
+        self._window = deque()
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._async_waiters = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent, count it in flight and return its start time."""
+        with self._lock:
+            while self.in_flight >= self.limit:
+                self._released.wait()
+            self.in_flight += 1
+            return self.clock()
+
+    async def acquire_async(self) -> float:
+        """Wait, without blocking the event loop, until a request can be sent; see `acquire`."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return self.clock()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self, started_at: float, error: Optional[BaseException] = None) -> None:
+        """
+        Count a request out of flight and adjust the limit to its outcome.
+
+        :param float started_at: The start time returned by `acquire`.
+        :param Exception error: (optional) The error the request failed with.
+        """
+        with self._lock:
+            # Only grow a limit that is at least half used.
+            used = self.in_flight * 2 >= self.limit
+            self.in_flight -= 1
+            now = self.clock()
+            if error is None:
+                self._sample(now - started_at, started_at, now, used)
+            elif is_overload(error):
+                self._decrease(started_at, now)
+            self._released.notify_all()
+            waiters, self._async_waiters = self._async_waiters, deque()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def _sample(self, latency: float, started_at: float, now: float, used: bool) -> None:
+        window = self._window
+        while window and window[-1][1] >= latency:
+            window.pop()
+        window.append((self._samples, latency))
+        self._samples += 1
+        if window[0][0] <= self._samples - 1 - self.min_latency_window:
+            window.popleft()
+        self.min_latency = window[0][1]
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
+        if self.latency > self.min_latency * self.latency_tolerance:
+            self._decrease(started_at, now)
+        elif used:
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+    def _decrease(self, started_at: float, now: float) -> None:
+        if started_at < self._decreased_at:
+            return
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self._decreased_at = now
+        self.decreases += 1
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call fn within the limit and return its result."""
+        started_at = self.acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as err:
+            self.release(started_at, err)
+            raise
+        self.release(started_at)
+        return result
+
+    async def call_async(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Await fn within the limit and return its result."""
+        started_at = await self.acquire_async()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as err:
+            self.release(started_at, err)
+            raise
+        self.release(started_at)
+        return result
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
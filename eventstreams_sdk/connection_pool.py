@@ -0,0 +1,157 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the sizing and keep-alive configuration of the connection pool of
+the blocking service clients, and the decoding of their JSON responses.
+"""
+
+import socket
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import requests
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from urllib3.connection import HTTPConnection
+
+from .deadline import current_deadline
+from .json_backend import JSONBackend
+
+DEFAULT_MAX_HOSTS = DEFAULT_POOLSIZE
+DEFAULT_MAX_CONNECTIONS_PER_HOST = DEFAULT_POOLSIZE
+
+
+class ConnectionStats(NamedTuple):
+    """
+    The use of the connections of a pool.
+
+    :attr int requests: The number of requests sent.
+    :attr int connections: The number of connections opened to send them.
+    """
+
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """The number of requests sent on a connection opened by an earlier request."""
+        return max(self.requests - self.connections, 0)
+
+    @property
+    def reuse_rate(self) -> float:
+        """The share of the requests sent on a reused connection, 0.0 before any request."""
+        return self.reused / self.requests if self.requests else 0.0
+
+
+def keepalive_socket_options(idle: float) -> List[Tuple[int, int, int]]:
+    """
+    Return the socket options enabling TCP keep-alive probes on idle connections.
+
+    :param float idle: The number of seconds a connection stays idle before the first
+           probe is sent. Ignored on platforms that do not allow to set it.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    seconds = max(int(idle), 1)
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, seconds))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):  # pragma: no cover - macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, seconds))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, seconds))
+    return options
+
+
+class JSONResponse(requests.Response):
+    """
+    A response whose `json()` decodes the body with a JSON backend.
+
+    :attr JSONBackend json_backend: The backend; bodies are decoded by requests
+          without one, or when they are not UTF-8 encoded.
+    """
+
+    json_backend: Optional[JSONBackend] = None
+
+    def json(self, **kwargs) -> Any:
+        """Return the decoded JSON body of the response."""
+        if self.json_backend is not None and (self.encoding is None or self.encoding.lower() in ('utf-8', 'utf8')):
+            try:
+                return self.json_backend.loads(self.content)
+            except ValueError:
+                pass  # let requests raise its usual error
+        return super().json(**kwargs)
+
+
+class PooledHTTPAdapter(SSLHTTPAdapter):
+    """
+    The HTTP adapter of the core with configurable socket options and connection
+    statistics, which shortens the timeout of the requests sent for a call with a
+    deadline to the time left.
+
+    :param list socket_options: (optional) The options set on the sockets of new
+          connections, replacing the urllib3 defaults.
+    :param JSONBackend json_backend: (optional) The backend decoding the JSON bodies
+          of the responses.
+    """
+
+    def __init__(
+        self,
+        *args,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        json_backend: Optional[JSONBackend] = None,
+        **kwargs,
+    ) -> None:
+        # Set before the base class creates the pool manager.
+        self.socket_options = socket_options
+        self.json_backend = json_backend
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        """Create the pool manager, passing the configured socket options to its pools."""
+        if self.socket_options is not None:
+            pool_kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a prepared request, within the deadline of the current call if any."""
+        deadline = current_deadline.get()
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+    def build_response(self, req, resp) -> requests.Response:
+        """Build the response of a request, decoding its JSON body with the JSON backend."""
+        response = super().build_response(req, resp)
+        if self.json_backend is not None:
+            response.__class__ = JSONResponse
+            response.json_backend = self.json_backend
+        return response
+
+    def connection_stats(self) -> ConnectionStats:
+        """
+        Return the use of the connections of the host pools currently held.
+
+        The counts start from zero when the adapter is created and drop the hosts whose
+        pool is evicted, i.e. beyond `max_hosts` hosts.
+        """
+        requests = connections = 0
+        pools = self.poolmanager.pools
+        with pools.lock:
+            held = list(pools._container.values())  # pylint: disable=protected-access
+        for pool in held:
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return ConnectionStats(requests, connections)
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the deadlines bounding the overall duration of a call.
+
+A deadline is passed to the operations of the service clients, and to the helpers built
+on them, with the `deadline` keyword argument:
+
+    deadline = Deadline(10.0)
+    topics = list_all_topics(service, deadline=deadline)
+
+Every request sent for the call, retries and pages included, has its timeout shortened
+to the time left, and no request is sent once the deadline has expired.
+"""
+
+import contextvars
+import time
+from typing import Callable, Optional, Tuple, Union
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+class DeadlineExceeded(TimeoutError):
+    """The error raised by the calls whose deadline expired."""
+
+
+class Deadline:
+    """
+    A point in time by which a call must complete.
+
+    :param float timeout: The number of seconds from now the deadline expires in.
+    :param Callable clock: (optional) The monotonic clock.
+    """
+
+    def __init__(self, timeout: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if timeout < 0:
+            raise ValueError('timeout must not be negative')
+        self.clock = clock
+        self.expires_at = clock() + timeout
+
+    def remaining(self) -> float:
+        """Return the number of seconds left, 0 once expired."""
+        return max(self.expires_at - self.clock(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.clock() >= self.expires_at
+
+    def check(self) -> float:
+        """
+        Return the number of seconds left.
+
+        :raises DeadlineExceeded: The deadline has expired.
+        """
+        remaining = self.expires_at - self.clock()
+        if remaining <= 0:
+            raise DeadlineExceeded('the deadline of the call has expired')
+        return remaining
+
+    def cap(self, timeout: Timeout) -> Timeout:
+        """
+        Return a requests or httpx timeout shortened to the time left.
+
+        :param timeout: A number of seconds, a (connect, read) tuple, or None for no
+               timeout.
+        """
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+# The deadline of the request being sent by the current thread, applied by the HTTP adapter.
+current_deadline: contextvars.ContextVar = contextvars.ContextVar('eventstreams_sdk_deadline', default=None)
@@ -0,0 +1,252 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the hedging of the idempotent requests of the service clients.
+
+A hedged request is sent again when it has not completed after a delay, typically the
+95th percentile of its latency, and the first response of the two is used. This trades a
+few extra requests for a shorter tail latency when a slow backend replica holds up a
+small share of the requests.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+DEFAULT_MAX_WORKERS = 64
+
+
+class HedgingPolicy:
+    """
+    Decide when to send a duplicate of a slow GET request.
+
+    The delay before the duplicate is either fixed or the `percentile` of the latency of
+    the last `window` requests of the operation; the latter is used once `min_samples`
+    requests completed, and recomputed every `refresh_samples` requests. Duplicates are
+    limited to `max_extra_load` times the requests, so that a slow service is not sent
+    twice as many requests.
+
+    The blocking clients send hedged requests, the first attempt included, from a pool
+    of `max_workers` threads owned by the policy, which therefore caps the number of
+    hedged requests in flight. The delay runs from the time the first attempt leaves
+    the queue of the pool, so that waiting for a thread does not trigger a duplicate.
+    A duplicate that lost the race is cancelled if it was not sent yet, and otherwise
+    completes in the background and is discarded; the async clients cancel it.
+
+    :param float delay: (optional) The fixed delay, in seconds, before the duplicate is
+          sent. Defaults to the observed `percentile` latency.
+    :param float percentile: (optional) The percentile of the observed latency used as
+          delay.
+    :param float max_extra_load: (optional) The maximum ratio of duplicates to requests.
+    :param Iterable operations: (optional) The ids of the GET operations to hedge, e.g.
+          `['get_topic', 'get_latest_schema']`. Defaults to every GET operation.
+    :param int window: (optional) The number of latencies kept per operation.
+    :param int min_samples: (optional) The number of latencies observed before the
+          observed delay is used. No request is hedged before that.
+    :param int refresh_samples: (optional) The number of latencies observed between two
+          computations of the observed delay.
+    :param int max_workers: (optional) The size of the thread pool of the blocking
+          clients, and so the maximum number of hedged requests they have in flight.
+    :param Callable clock: (optional) The monotonic clock used to time requests.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        *,
+        percentile: float = 95,
+        max_extra_load: float = 0.05,
+        operations: Optional[Iterable[str]] = None,
+        window: int = 1000,
+        min_samples: int = 20,
+        refresh_samples: int = 50,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError('delay must not be negative')
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        if max_extra_load < 0:
+            raise ValueError('max_extra_load must not be negative')
+        if min_samples < 2 or window < min_samples:
+            raise ValueError('min_samples must be at least 2 and at most window')
+        if refresh_samples < 1:
+            raise ValueError('refresh_samples must be at least 1')
+        self.delay = delay
+        self.percentile = percentile
+        self.max_extra_load = max_extra_load
+        self.operations = frozenset(operations) if operations is not None else None
+        self.window = window
+        self.min_samples = min_samples
+        self.refresh_samples = refresh_samples
+        self.max_workers = max_workers
+        self.clock = clock
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[Optional[str], Deque[float]] = {}
+        # The number of latencies recorded per operation, and the observed delays with
+        # that number when they were computed.
+        self._recorded: Dict[Optional[str], int] = {}
+        self._delays: Dict[Optional[str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def applies_to(self, method: str, operation_id: Optional[str]) -> bool:
+        """Return whether the requests of an operation are hedged."""
+        return method.upper() == 'GET' and (self.operations is None or operation_id in self.operations)
+
+    def hedge_delay(self, operation_id: Optional[str] = None) -> Optional[float]:
+        """
+        Return the delay before a duplicate of a request of an operation, or None if it
+        must not be hedged yet.
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = self._latencies.get(operation_id, ())
+            if len(latencies) < self.min_samples:
+                return None
+            recorded = self._recorded[operation_id]
+            cached = self._delays.get(operation_id)
+            if cached is not None and recorded - cached[1] < self.refresh_samples:
+                return cached[0]
+            latencies = list(latencies)
+        cut_points = statistics.quantiles(latencies, n=100, method='inclusive')
+        delay = cut_points[min(max(round(self.percentile), 1), 99) - 1]
+        with self._lock:
+            self._delays[operation_id] = (delay, recorded)
+        return delay
+
+    def record(self, operation_id: Optional[str], latency: float) -> None:
+        """Record the latency of a completed request of an operation."""
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None:
+                latencies = self._latencies[operation_id] = deque(maxlen=self.window)
+            latencies.append(latency)
+            self._recorded[operation_id] = self._recorded.get(operation_id, 0) + 1
+
+    def _start(self, operation_id: Optional[str]) -> Optional[float]:
+        """Count a request and return its hedge delay, None if it must not be hedged."""
+        delay = self.hedge_delay(operation_id)
+        with self._lock:
+            self.requests += 1
+            if delay is None or self.hedges >= self.max_extra_load * self.requests:
+                return None
+        return delay
+
+    def _count_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges >= self.max_extra_load * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _timed(
+        self, fn: Callable[[], Any], operation_id: Optional[str], started: Optional[threading.Event] = None
+    ) -> Any:
+        if started is not None:
+            started.set()
+        started_at = self.clock()
+        result = fn()
+        self.record(operation_id, self.clock() - started_at)
+        return result
+
+    async def _timed_async(self, fn: Callable[[], Awaitable[Any]], operation_id: Optional[str]) -> Any:
+        started_at = self.clock()
+        result = await fn()
+        self.record(operation_id, self.clock() - started_at)
+        return result
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool sending the hedged requests, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='hedging')
+            return self._executor
+
+    def call(self, fn: Callable[[], Any], operation_id: Optional[str] = None) -> Any:
+        """
+        Call fn, which sends one request, and call it again if it is slower than the
+        hedge delay; return the first result.
+
+        :raises Exception: The error of the first attempt, if both fail.
+        """
+        delay = self._start(operation_id)
+        if delay is None:
+            return self._timed(fn, operation_id)
+        executor = self.get_executor()
+        started = threading.Event()
+        primary = executor.submit(self._timed, fn, operation_id, started)
+        # Time the first attempt from when a thread runs it, not from when it is queued.
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._count_hedge():
+            return primary.result()
+        hedge = executor.submit(self._timed, fn, operation_id)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return primary.result()
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]], operation_id: Optional[str] = None) -> Any:
+        """Await fn, and a duplicate of it if it is slower than the hedge delay; see `call`."""
+        delay = self._start(operation_id)
+        if delay is None:
+            return await self._timed_async(fn, operation_id)
+        primary = asyncio.ensure_future(self._timed_async(fn, operation_id))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if done or not self._count_hedge():
+                return await primary
+            hedge = asyncio.ensure_future(self._timed_async(fn, operation_id))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        if task is hedge:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the thread pool of the blocking clients once its requests complete."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
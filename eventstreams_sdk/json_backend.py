@@ -0,0 +1,130 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the JSON libraries the service clients encode request bodies and
+decode response bodies with.
+
+The fastest library installed is used: `orjson`, then `ujson`, then the standard
+library. Documents a faster library rejects, such as integers beyond 64 bits or strings
+with raw control characters, are handled by the standard library instead, so that the
+choice of library never changes what the clients accept.
+"""
+
+import functools
+import importlib
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode('utf-8')
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data, strict=False)
+
+
+class JSONBackend:
+    """
+    A JSON library.
+
+    :attr str name: The name of the library, e.g. 'orjson'.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes] = _stdlib_dumps,
+        loads: Callable[[Union[bytes, str]], Any] = _stdlib_loads,
+    ) -> None:
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def __repr__(self) -> str:
+        return 'JSONBackend({0!r})'.format(self.name)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Return the UTF-8 encoded JSON document of obj."""
+        if self._dumps is _stdlib_dumps:
+            return _stdlib_dumps(obj)
+        try:
+            return self._dumps(obj)
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Return the object of a JSON document.
+
+        :raises json.JSONDecodeError: data is not a JSON document.
+        """
+        if self._loads is _stdlib_loads:
+            return _stdlib_loads(data)
+        try:
+            return self._loads(data)
+        except (ValueError, OverflowError):
+            return _stdlib_loads(data)
+
+
+def _load_backend(name: str) -> JSONBackend:
+    if name == 'json':
+        return JSONBackend('json')
+    module = importlib.import_module(name)
+    if name == 'orjson':
+        return JSONBackend(name, module.dumps, module.loads)
+    return JSONBackend(
+        name,
+        lambda obj: module.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8'),
+        module.loads,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Return a JSON library.
+
+    :param str name: (optional) One of 'orjson', 'ujson' and 'json'. Defaults to the
+           first of them that is installed.
+    :raises ValueError: name is not a supported library.
+    :raises ImportError: The library is not installed.
+    """
+    if name is not None:
+        if name not in JSON_BACKENDS:
+            raise ValueError('name must be one of {0}'.format(', '.join(JSON_BACKENDS)))
+        return _load_backend(name)
+    for candidate in JSON_BACKENDS[:-1]:
+        try:
+            return _load_backend(candidate)
+        except ImportError:
+            continue
+    return _load_backend('json')
+
+
+def available_json_backends() -> Tuple[str, ...]:
+    """Return the names of the JSON libraries installed, fastest first."""
+    names = []
+    for name in JSON_BACKENDS:
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return tuple(names)
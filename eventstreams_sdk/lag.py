@@ -0,0 +1,571 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module computes consumer group lag from `get_consumer_group` results.
+
+The offsets of any number of groups are loaded into a `LagTable`, which keeps one typed
+array per column rather than one object per partition, and aggregates the lag of every
+partition, or of every group or topic, in a single pass over those arrays.
+
+`snapshot_consumer_groups` loads the offsets of every group of an instance into a table.
+A `LagWatcher` polls a set of groups and reports the partitions whose offsets moved
+between two polls, with the rates at which they moved.
+"""
+
+import logging
+import math
+import operator
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .adminrest_v1 import AdminrestV1, GroupDetail
+from .lazy_models import LazyGroupDetail
+from .pagination import DEFAULT_MAX_WORKERS, DEFAULT_PER_PAGE, iter_consumer_groups
+
+logger = logging.getLogger(__name__)
+
+GROUP = 'group'
+TOPIC = 'topic'
+GROUP_TOPIC = 'group_topic'
+
+_keys = (GROUP, TOPIC, GROUP_TOPIC)
+
+
+def percentile(values: List[int], q: float) -> float:
+    """
+    Return the q-th percentile of sorted values, interpolating linearly between the two
+    closest ranks.
+
+    :param List[int] values: The values, in ascending order.
+    :param float q: The percentile to compute, between 0 and 100 inclusive.
+    """
+    if not 0 <= q <= 100:
+        raise ValueError('q must be between 0 and 100')
+    if not values:
+        raise ValueError('percentile of an empty lag table')
+    rank = (len(values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def group_json(group: Union[dict, DetailedResponse, GroupDetail, LazyGroupDetail]) -> dict:
+    """Return the json dictionary of a `get_consumer_group` result."""
+    if isinstance(group, DetailedResponse):
+        return group.get_result()
+    if isinstance(group, LazyGroupDetail):
+        return group._dict  # pylint: disable=protected-access
+    if isinstance(group, GroupDetail):
+        return group.to_dict()
+    return group
+
+
+class LagTable:
+    """
+    The committed offset, end offset and lag of consumer group partitions, stored by
+    column.
+
+    Group IDs and topic names are stored once and referenced by index from the rows.
+    Partitions for which the group has no committed offset are not loaded.
+
+    :attr List[str] group_ids: The consumer groups loaded into the table.
+    :attr List[str] states: The state of each group of `group_ids`.
+    :attr List[str] topics: The topics loaded into the table.
+    :attr array group_index: The index in `group_ids` of the group of each row.
+    :attr array topic_index: The index in `topics` of the topic of each row.
+    :attr array partitions: The partition of each row, -1 when it is not reported.
+    :attr array current_offsets: The committed offset of each row.
+    :attr array end_offsets: The end offset of each row.
+    :attr array lags: The lag of each row, never negative.
+    """
+
+    def __init__(self) -> None:
+        self.group_ids = []
+        self.states = []
+        self.topics = []
+        self._group_ids = {}
+        self._topic_ids = {}
+        self.group_index = array('l')
+        self.topic_index = array('l')
+        self.partitions = array('l')
+        self.current_offsets = array('q')
+        self.end_offsets = array('q')
+        self.lags = array('q')
+
+    @classmethod
+    def from_groups(cls, groups: Iterable[Union[dict, DetailedResponse, GroupDetail, LazyGroupDetail]]) -> 'LagTable':
+        """
+        Build a table from consumer group details.
+
+        :param groups: `get_consumer_group` results, as json dictionaries, responses,
+               `GroupDetail` objects or `LazyGroupDetail` views.
+        """
+        table = cls()
+        for group in groups:
+            table.add_group(group)
+        return table
+
+    def add_group(self, group: Union[dict, DetailedResponse, GroupDetail, LazyGroupDetail]) -> None:
+        """
+        Append the partitions of one consumer group to the table.
+
+        :param group: A `get_consumer_group` result, as a json dictionary, a response,
+               a `GroupDetail` object or a `LazyGroupDetail` view.
+        """
+        group = group_json(group)
+        offsets = [
+            offset
+            for offset in group.get('offsets') or ()
+            if offset.get('current_offset') is not None and offset.get('end_offset') is not None
+        ]
+        group_index = self._index(self.group_ids, self._group_ids, group.get('group_id'))
+        if group_index == len(self.states):
+            self.states.append(group.get('state'))
+        else:
+            self.states[group_index] = group.get('state')
+        self.group_index.extend([group_index] * len(offsets))
+        self.topic_index.extend([self._index(self.topics, self._topic_ids, offset.get('topic')) for offset in offsets])
+
+        current_offsets = [offset['current_offset'] for offset in offsets]
+        end_offsets = [offset['end_offset'] for offset in offsets]
+        partitions = [offset.get('partition') for offset in offsets]
+        self.partitions.extend([-1 if partition is None else partition for partition in partitions])
+        self.current_offsets.extend(current_offsets)
+        self.end_offsets.extend(end_offsets)
+        self.lags.extend(map(max, map(operator.sub, end_offsets, current_offsets), [0] * len(offsets)))
+
+    @staticmethod
+    def _index(names: List[str], ids: Dict[str, int], name: str) -> int:
+        index = ids.get(name)
+        if index is None:
+            index = ids[name] = len(names)
+            names.append(name)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of partitions in the table."""
+        return len(self.lags)
+
+    def rows(self) -> Iterator[Tuple[str, str, int, int, int, int]]:
+        """
+        Iterate over the rows of the table.
+
+        :return: An iterator of (group ID, topic, partition, committed offset, end offset,
+                 lag) tuples.
+        """
+        group_ids = self.group_ids
+        topics = self.topics
+        for group, topic, partition, current_offset, end_offset, lag in zip(
+            self.group_index, self.topic_index, self.partitions, self.current_offsets, self.end_offsets, self.lags
+        ):
+            yield group_ids[group], topics[topic], partition, current_offset, end_offset, lag
+
+    def sum(self, by: Optional[str] = None) -> Union[int, Dict]:
+        """
+        Return the total lag.
+
+        :param str by: (optional) Aggregate per 'group', 'topic' or 'group_topic'
+               rather than over the whole table.
+        :return: The total lag, or a dict of the total lag per group ID, topic or
+                 (group ID, topic) pair.
+        """
+        if by is None:
+            return sum(self.lags)
+        return {key: sum(lags) for key, lags in self.split(by).items()}
+
+    def max(self, by: Optional[str] = None) -> Union[int, Dict]:
+        """
+        Return the largest partition lag, 0 for an empty table.
+
+        :param str by: (optional) Aggregate per 'group', 'topic' or 'group_topic'
+               rather than over the whole table.
+        :return: The largest lag, or a dict of the largest lag per group ID, topic or
+                 (group ID, topic) pair.
+        """
+        if by is None:
+            return max(self.lags, default=0)
+        return {key: max(lags) for key, lags in self.split(by).items()}
+
+    def percentile(self, q: float, by: Optional[str] = None) -> Union[float, Dict]:
+        """
+        Return the q-th percentile of the partition lags.
+
+        :param float q: The percentile to compute, between 0 and 100 inclusive.
+        :param str by: (optional) Aggregate per 'group', 'topic' or 'group_topic'
+               rather than over the whole table.
+        :return: The percentile, or a dict of the percentile per group ID, topic or
+                 (group ID, topic) pair.
+        :raises ValueError: The table is empty, or q is out of range.
+        """
+        if by is None:
+            return percentile(sorted(self.lags), q)
+        return {key: percentile(sorted(lags), q) for key, lags in self.split(by).items()}
+
+    def split(self, by: str) -> Dict:
+        """
+        Return the partition lags of each group, topic or (group, topic) pair.
+
+        :param str by: 'group', 'topic' or 'group_topic'.
+        :return: A dict of `array` of lags, keyed by group ID, topic or (group ID,
+                 topic) pair.
+        """
+        if by not in _keys:
+            raise ValueError('by must be one of ' + ', '.join(_keys))
+        if by == GROUP:
+            keys = self.group_index
+        elif by == TOPIC:
+            keys = self.topic_index
+        else:
+            keys = zip(self.group_index, self.topic_index)
+
+        split = {}
+        for key, lag in zip(keys, self.lags):
+            lags = split.get(key)
+            if lags is None:
+                lags = split[key] = array('q')
+            lags.append(lag)
+
+        if by == GROUP:
+            return {self.group_ids[group]: lags for group, lags in split.items()}
+        if by == TOPIC:
+            return {self.topics[topic]: lags for topic, lags in split.items()}
+        return {(self.group_ids[group], self.topics[topic]): lags for (group, topic), lags in split.items()}
+
+
+class ConsumerGroupSnapshot(LagTable):
+    """
+    The offsets of the consumer groups of an instance, as returned by
+    `snapshot_consumer_groups`.
+
+    :attr dict errors: The exception raised when getting each group that could not be
+          loaded, e.g. because it was deleted after being listed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors = {}
+
+
+def iter_consumer_group_details(
+    service: AdminrestV1,
+    *,
+    group_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> Iterator[Tuple[str, Union[dict, ApiException]]]:
+    """
+    Iterate over the details of every consumer group of an instance.
+
+    The groups are listed page by page while the details of the groups already listed
+    are fetched by a pool of `max_workers` threads, so listing and fetching overlap. At
+    most twice `max_workers` details are requested ahead of the iteration, which
+    receives the groups in the order they are listed.
+
+    :param AdminrestV1 service: The client used to list and get the consumer groups.
+    :param str group_filter: (optional) A filter to be applied to the consumer
+           group IDs, see `AdminrestV1.list_consumer_groups`.
+    :param int per_page: (optional) The number of consumer groups requested per page.
+    :param int max_workers: (optional) The maximum number of groups fetched
+           concurrently.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The id of each group with its `get_consumer_group` result, or the
+             `ApiException` raised when getting it.
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+
+    def fetch(group_id: str) -> Union[dict, ApiException]:
+        try:
+            return service.get_consumer_group(group_id, **kwargs).get_result()
+        except ApiException as err:
+            return err
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for group_id in iter_consumer_groups(
+                service, group_filter=group_filter, per_page=per_page, prefetch=True, **kwargs
+            ):
+                pending.append((group_id, executor.submit(fetch, group_id)))
+                if len(pending) >= 2 * max_workers:
+                    group_id, future = pending.popleft()
+                    yield group_id, future.result()
+            while pending:
+                group_id, future = pending.popleft()
+                yield group_id, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def snapshot_consumer_groups(
+    service: AdminrestV1,
+    *,
+    group_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> ConsumerGroupSnapshot:
+    """
+    Load the offsets of every consumer group of an instance.
+
+    The groups are fetched concurrently with `iter_consumer_group_details`.
+
+    :param AdminrestV1 service: The client used to list and get the consumer groups.
+    :param str group_filter: (optional) A filter to be applied to the consumer
+           group IDs, see `AdminrestV1.list_consumer_groups`.
+    :param int per_page: (optional) The number of consumer groups requested per page.
+    :param int max_workers: (optional) The maximum number of groups fetched
+           concurrently.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The offsets of the groups, and the errors of the groups that could not
+             be fetched.
+    :rtype: ConsumerGroupSnapshot
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+    snapshot = ConsumerGroupSnapshot()
+    for group_id, group in iter_consumer_group_details(
+        service, group_filter=group_filter, per_page=per_page, max_workers=max_workers, **kwargs
+    ):
+        if isinstance(group, ApiException):
+            snapshot.errors[group_id] = group
+        else:
+            snapshot.add_group(group)
+    return snapshot
+
+
+class LagChange(NamedTuple):
+    """
+    The offsets of a consumer group partition that changed since the previous poll.
+
+    :attr str group_id: The ID of the consumer group.
+    :attr str topic: The name of the topic.
+    :attr int partition: The ID of the partition.
+    :attr int current_offset: The committed offset of the group.
+    :attr int end_offset: The end offset of the partition.
+    :attr int lag: The lag of the group on the partition, never negative.
+    :attr float consumption_rate: The committed offset increase per second since the
+          previous poll, None the first time the partition is seen.
+    :attr float production_rate: The end offset increase per second since the previous
+          poll, None the first time the partition is seen.
+    """
+
+    group_id: str
+    topic: str
+    partition: int
+    current_offset: int
+    end_offset: int
+    lag: int
+    consumption_rate: Optional[float]
+    production_rate: Optional[float]
+
+
+class LagWatcher:
+    """
+    Poll the offsets of a set of consumer groups and report what changed.
+
+    Each poll fetches the groups concurrently, at most `max_workers` at a time, and
+    compares their offsets with the previous poll. Only the partitions whose committed
+    or end offset moved are reported, with the rates at which they moved, so the work
+    done by the consumer of the changes follows the volume of change rather than the
+    number of partitions watched.
+
+    Polls run either on demand with `poll()` or every `interval` seconds on a background
+    thread started by `start()`, which passes the changes of each poll to `on_change`.
+
+    :attr dict snapshots: The time of the last successful poll of each group and the
+          (committed offset, end offset) pair of each of its (topic, partition) then.
+    :attr dict errors: The exception raised by the last fetch of each group that
+          failed in the last poll. The offsets of a failed group are kept from the
+          previous poll.
+    """
+
+    def __init__(
+        self,
+        service: AdminrestV1,
+        group_ids: Iterable[str] = (),
+        *,
+        interval: float = 5.0,
+        max_workers: int = 8,
+        on_change: Optional[Callable[[List[LagChange]], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Construct a new watcher.
+
+        :param AdminrestV1 service: The client used to get the consumer groups.
+        :param Iterable[str] group_ids: (optional) The IDs of the groups to watch.
+        :param float interval: (optional) The number of seconds between the start of
+               two polls of the background thread.
+        :param int max_workers: (optional) The maximum number of groups fetched
+               concurrently.
+        :param Callable on_change: (optional) Called by the background thread with
+               the changes of each poll that found any.
+        :param Callable clock: (optional) The monotonic clock, in seconds, the rates
+               are computed with.
+        """
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.service = service
+        self.interval = interval
+        self.max_workers = max_workers
+        self.on_change = on_change
+        self.clock = clock
+        self.errors = {}
+        self.snapshots = {}
+        self._group_ids = dict.fromkeys(group_ids)
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._executor = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def watch(self, group_id: str) -> None:
+        """Add a group to the watched groups."""
+        with self._lock:
+            self._group_ids[group_id] = None
+
+    def unwatch(self, group_id: str) -> None:
+        """Remove a group from the watched groups and forget its offsets."""
+        with self._lock:
+            self._group_ids.pop(group_id, None)
+            self.snapshots.pop(group_id, None)
+
+    def group_ids(self) -> List[str]:
+        """Return the IDs of the watched groups."""
+        with self._lock:
+            return list(self._group_ids)
+
+    def _fetch(self, group_id: str) -> Tuple[str, Union[dict, Exception], float]:
+        try:
+            group = self.service.get_consumer_group(group_id).get_result()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return group_id, err, self.clock()
+        return group_id, group, self.clock()
+
+    def poll(self) -> List[LagChange]:
+        """
+        Fetch the watched groups once and return the partitions that changed.
+
+        Partitions seen for the first time are reported without rates. Partitions that
+        disappear from a group are forgotten without being reported.
+
+        :return: The changed partitions, in the order of the watched groups.
+        """
+        with self._poll_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            changes = []
+            errors = {}
+            for group_id, group, polled_at in self._executor.map(self._fetch, self.group_ids()):
+                if isinstance(group, Exception):
+                    errors[group_id] = group
+                    continue
+                changes.extend(self._update(group_id, group, polled_at))
+            self.errors = errors
+            return changes
+
+    def _update(self, group_id: str, group: dict, polled_at: float) -> List[LagChange]:
+        previous_at, previous = self.snapshots.get(group_id, (None, {}))
+        elapsed = polled_at - previous_at if previous_at is not None else None
+        snapshot = {}
+        changes = []
+        for offset in group.get('offsets') or ():
+            current_offset = offset.get('current_offset')
+            end_offset = offset.get('end_offset')
+            if current_offset is None or end_offset is None:
+                continue
+            key = (offset.get('topic'), offset.get('partition'))
+            offsets = snapshot[key] = (current_offset, end_offset)
+            before = previous.get(key)
+            if before == offsets:
+                continue
+            if before is None or not elapsed:
+                consumption_rate = production_rate = None
+            else:
+                consumption_rate = (current_offset - before[0]) / elapsed
+                production_rate = (end_offset - before[1]) / elapsed
+            changes.append(
+                LagChange(
+                    group_id,
+                    key[0],
+                    key[1],
+                    current_offset,
+                    end_offset,
+                    max(end_offset - current_offset, 0),
+                    consumption_rate,
+                    production_rate,
+                )
+            )
+        with self._lock:
+            if group_id in self._group_ids:
+                self.snapshots[group_id] = (polled_at, snapshot)
+        return changes
+
+    def start(self) -> None:
+        """Start polling every `interval` seconds on a background thread."""
+        if self._thread is not None:
+            raise RuntimeError('the watcher is already started')
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='LagWatcher', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        next_poll = self.clock()
+        while True:
+            try:
+                changes = self.poll()
+                if changes and self.on_change is not None:
+                    self.on_change(changes)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception('Consumer group lag poll failed')
+            # A poll slower than the interval delays the next one rather than bursting to catch up.
+            next_poll = max(next_poll + self.interval, self.clock())
+            if self._stopped.wait(max(next_poll - self.clock(), 0)):
+                return
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting for the poll in progress, and release the workers."""
+        self._stopped.set()
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        with self._poll_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
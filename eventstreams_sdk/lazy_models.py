@@ -0,0 +1,186 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides lazy, read-only views of the admin REST models with nested objects.
+
+A view wraps the json dictionary of a response and reads its scalar properties straight
+from it. Nested models are only built the first time their property is read, and are
+then kept by the view, so scanning many topics or consumer groups for a few scalar
+properties allocates one small object per item.
+"""
+
+from typing import Dict, List, Optional
+import json
+
+from .adminrest_v1 import (
+    GroupDetail,
+    Member,
+    TopicConfigs,
+    TopicDetail,
+    TopicDetailReplicaAssignmentsItem,
+    TopicPartitionOffset,
+)
+
+
+class _Property:
+    """A model property read from the wrapped json dictionary."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._dict.get(self.key)
+
+
+class _NestedProperty(_Property):
+    """A model property holding a nested model, or a list of them, built on first access."""
+
+    def __init__(self, key: str, model: type, is_list: bool = False) -> None:
+        super().__init__(key)
+        self.model = model
+        self.is_list = is_list
+        self.slot = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slot = getattr(owner, '_' + name)
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        try:
+            return self.slot.__get__(view, owner)
+        except AttributeError:
+            pass
+        value = view._dict.get(self.key)
+        if value is not None:
+            if self.is_list:
+                value = [self.model.from_dict(v) for v in value]
+            else:
+                value = self.model.from_dict(value)
+        self.slot.__set__(view, value)
+        return value
+
+
+class LazyModel:
+    """
+    Base class of the lazy views.
+
+    :attr dict _dict: The wrapped json dictionary, which must not be modified while it
+          is wrapped.
+    """
+
+    __slots__ = ('_dict',)
+
+    model = None
+
+    def __init__(self, _dict: Dict) -> None:
+        """
+        Wrap a json dictionary.
+
+        :param dict _dict: The json dictionary of the model.
+        """
+        self._dict = _dict
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'LazyModel':
+        """Initialize a view of a json dictionary."""
+        return cls(_dict)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a view of a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        return self.materialize().to_dict()
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    def materialize(self):
+        """Return the model the view stands for, with all its nested models built."""
+        return self.model.from_dict(self._dict)
+
+    def __str__(self) -> str:
+        """Return a `str` version of this model object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'LazyModel') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __ne__(self, other: 'LazyModel') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class LazyTopicDetail(LazyModel):
+    """
+    Lazy view of a TopicDetail.
+
+    :attr str name: (optional) The name of the topic.
+    :attr int partitions: (optional) The number of partitions.
+    :attr int replication_factor: (optional) The number of replication factor.
+    :attr int retention_ms: (optional) The value of config property 'retention.ms'.
+    :attr str cleanup_policy: (optional) The value of config property
+          'cleanup.policy'.
+    :attr TopicConfigs configs: (optional) Built on first access.
+    :attr List[TopicDetailReplicaAssignmentsItem] replica_assignments: (optional)
+          The replia assignment of the topic, built on first access.
+    """
+
+    __slots__ = ('_configs', '_replica_assignments')
+
+    model = TopicDetail
+
+    name: Optional[str] = _Property('name')
+    partitions: Optional[int] = _Property('partitions')
+    replication_factor: Optional[int] = _Property('replicationFactor')
+    retention_ms: Optional[int] = _Property('retentionMs')
+    cleanup_policy: Optional[str] = _Property('cleanupPolicy')
+    configs: Optional[TopicConfigs] = _NestedProperty('configs', TopicConfigs)
+    replica_assignments: Optional[List[TopicDetailReplicaAssignmentsItem]] = _NestedProperty(
+        'replicaAssignments', TopicDetailReplicaAssignmentsItem, is_list=True
+    )
+
+
+class LazyGroupDetail(LazyModel):
+    """
+    Lazy view of a GroupDetail.
+
+    :attr str group_id: (optional) The ID of the consumer group.
+    :attr str state: (optional) THe state of the consumer group.
+    :attr List[Member] members: (optional) Members in the consumer group, built on
+          first access.
+    :attr List[TopicPartitionOffset] offsets: (optional) The offsets of the
+          consumer group, built on first access.
+    """
+
+    __slots__ = ('_members', '_offsets')
+
+    model = GroupDetail
+
+    group_id: Optional[str] = _Property('group_id')
+    state: Optional[str] = _Property('state')
+    members: Optional[List[Member]] = _NestedProperty('members', Member, is_list=True)
+    offsets: Optional[List[TopicPartitionOffset]] = _NestedProperty('offsets', TopicPartitionOffset, is_list=True)
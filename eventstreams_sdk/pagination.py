@@ -0,0 +1,278 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides helpers walking the paginated list operations of the admin REST API.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+from ibm_cloud_sdk_core import DetailedResponse
+from requests.utils import parse_header_links
+
+from .adminrest_v1 import AdminrestV1, TopicDetail
+from .lazy_models import LazyTopicDetail
+
+DEFAULT_PER_PAGE = 100
+DEFAULT_MAX_WORKERS = 8
+
+
+def iter_pages(fetch: Callable[[int], List], per_page: int, *, prefetch: bool = False) -> Iterator[List]:
+    """
+    Yield the pages returned by fetch(page), starting at page 1, until a short page.
+
+    :param Callable fetch: Called with a 1-based page number, returns the items of that
+           page.
+    :param int per_page: The page size the items were requested with. A page holding
+           fewer items is the last one.
+    :param bool prefetch: (optional) When true, the next page is requested in a
+           background thread while the caller consumes the current one.
+    """
+    if per_page < 1:
+        raise ValueError('per_page must be a positive integer')
+    if not prefetch:
+        page = 1
+        while True:
+            items = fetch(page) or []
+            yield items
+            if len(items) < per_page:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(fetch, 1)
+    try:
+        page = 1
+        while True:
+            items = future.result() or []
+            if len(items) < per_page:
+                future = None
+                yield items
+                return
+            page += 1
+            future = executor.submit(fetch, page)
+            yield items
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def get_page_count(response: DetailedResponse, per_page: int) -> Optional[int]:
+    """
+    Return the number of pages of a list operation from the headers of one of its pages.
+
+    The `X-Total-Count` header is used when present, otherwise the page number of the
+    `last` entry of the `Link` header. None is returned when neither is available.
+
+    :param DetailedResponse response: The response for any page of the listing.
+    :param int per_page: The page size the listing was requested with.
+    """
+    headers = response.get_headers() or {}
+    total_count = headers.get('X-Total-Count')
+    if total_count is not None:
+        try:
+            return max(1, -(-int(total_count) // per_page))
+        except ValueError:
+            pass
+    link = headers.get('Link')
+    if link:
+        for entry in parse_header_links(link):
+            if entry.get('rel') == 'last':
+                page = parse_qs(urlparse(entry.get('url', '')).query).get('page')
+                if page and page[0].isdigit():
+                    return int(page[0])
+    return None
+
+
+def fetch_all_pages(
+    fetch: Callable[[int], DetailedResponse],
+    per_page: int,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List:
+    """
+    Return the items of every page of a list operation, fetching pages concurrently.
+
+    The first page is requested on its own to discover the page count (see
+    `get_page_count`); the remaining pages are then requested by a pool of at most
+    `max_workers` threads and merged in page order. If the page count cannot be
+    discovered, or the listing grew while it was being fetched, the pages past the
+    known end are requested sequentially until a short page is returned.
+
+    :param Callable fetch: Called with a 1-based page number, returns the
+           `DetailedResponse` for that page.
+    :param int per_page: The page size the items are requested with.
+    :param int max_workers: (optional) The maximum number of pages in flight.
+    """
+    if per_page < 1:
+        raise ValueError('per_page must be a positive integer')
+    if max_workers < 1:
+        raise ValueError('max_workers must be a positive integer')
+
+    first = fetch(1)
+    items = list(first.get_result() or [])
+    if len(items) < per_page:
+        return items
+
+    page_count = get_page_count(first, per_page) or 1
+    last_page = items
+    if page_count > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, page_count - 1)) as executor:
+            for page_items in executor.map(lambda page: fetch(page).get_result() or [], range(2, page_count + 1)):
+                items.extend(page_items)
+                last_page = page_items
+    if len(last_page) < per_page:
+        return items
+
+    for page_items in iter_pages(lambda page: fetch(page_count + page).get_result(), per_page):
+        items.extend(page_items)
+    return items
+
+
+def iter_topics(
+    service: AdminrestV1,
+    *,
+    topic_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    prefetch: bool = False,
+    lazy: bool = False,
+    **kwargs,
+) -> Iterator[Union[TopicDetail, LazyTopicDetail]]:
+    """
+    Iterate over the topics of an instance, one page at a time.
+
+    Pages are requested lazily as the iterator is consumed, so only one page (two with
+    `prefetch`) is held in memory however many topics are defined.
+
+    :param AdminrestV1 service: The client used to list the topics.
+    :param str topic_filter: (optional) A filter to be applied to the topic names,
+           see `AdminrestV1.list_topics`.
+    :param int per_page: (optional) The number of topics requested per page.
+    :param bool prefetch: (optional) Request the next page in the background while
+           the current one is consumed.
+    :param bool lazy: (optional) Yield `LazyTopicDetail` views, which only build the
+           configs and replica assignments of a topic when they are read.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: An iterator of `TopicDetail` (or `LazyTopicDetail`) objects.
+    """
+    model = LazyTopicDetail if lazy else TopicDetail
+
+    def fetch(page: int) -> List[dict]:
+        return service.list_topics(topic_filter=topic_filter, per_page=per_page, page=page, **kwargs).get_result()
+
+    for items in iter_pages(fetch, per_page, prefetch=prefetch):
+        for item in items:
+            yield model.from_dict(item)
+
+
+def list_all_topics(
+    service: AdminrestV1,
+    *,
+    topic_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    lazy: bool = False,
+    **kwargs,
+) -> List[Union[TopicDetail, LazyTopicDetail]]:
+    """
+    Return every topic of an instance, fetching the pages of list_topics concurrently.
+
+    :param AdminrestV1 service: The client used to list the topics.
+    :param str topic_filter: (optional) A filter to be applied to the topic names,
+           see `AdminrestV1.list_topics`.
+    :param int per_page: (optional) The number of topics requested per page.
+    :param int max_workers: (optional) The maximum number of pages in flight.
+    :param bool lazy: (optional) Return `LazyTopicDetail` views, which only build the
+           configs and replica assignments of a topic when they are read.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The topics, in the order the service lists them.
+    :rtype: List[TopicDetail] or List[LazyTopicDetail]
+    """
+    model = LazyTopicDetail if lazy else TopicDetail
+
+    def fetch(page: int) -> DetailedResponse:
+        return service.list_topics(topic_filter=topic_filter, per_page=per_page, page=page, **kwargs)
+
+    return [model.from_dict(item) for item in fetch_all_pages(fetch, per_page, max_workers=max_workers)]
+
+
+def iter_consumer_groups(
+    service: AdminrestV1,
+    *,
+    group_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    prefetch: bool = False,
+    **kwargs,
+) -> Iterator[str]:
+    """
+    Iterate over the consumer group IDs of an instance, one page at a time.
+
+    :param AdminrestV1 service: The client used to list the consumer groups.
+    :param str group_filter: (optional) A filter to be applied to the consumer
+           group IDs, see `AdminrestV1.list_consumer_groups`.
+    :param int per_page: (optional) The number of consumer groups requested per page.
+    :param bool prefetch: (optional) Request the next page in the background while
+           the current one is consumed.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: An iterator of consumer group IDs.
+    """
+
+    def fetch(page: int) -> List[str]:
+        return service.list_consumer_groups(
+            group_filter=group_filter, per_page=per_page, page=page, **kwargs
+        ).get_result()
+
+    for items in iter_pages(fetch, per_page, prefetch=prefetch):
+        yield from items
+
+
+def list_all_consumer_groups(
+    service: AdminrestV1,
+    *,
+    group_filter: Optional[str] = None,
+    per_page: int = DEFAULT_PER_PAGE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> List[str]:
+    """
+    Return every consumer group ID of an instance, fetching the pages of
+    list_consumer_groups concurrently.
+
+    :param AdminrestV1 service: The client used to list the consumer groups.
+    :param str group_filter: (optional) A filter to be applied to the consumer
+           group IDs, see `AdminrestV1.list_consumer_groups`.
+    :param int per_page: (optional) The number of consumer groups requested per page.
+    :param int max_workers: (optional) The maximum number of pages in flight.
+    :param dict headers: A `dict` containing the request headers
+    :param Deadline deadline: (optional) The deadline of the whole call, shared by
+           all of its requests.
+    :return: The consumer group IDs, in the order the service lists them.
+    :rtype: List[str]
+    """
+
+    def fetch(page: int) -> DetailedResponse:
+        return service.list_consumer_groups(group_filter=group_filter, per_page=per_page, page=page, **kwargs)
+
+    return fetch_all_pages(fetch, per_page, max_workers=max_workers)
@@ -0,0 +1,199 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the client-side request rate limiting.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens and is refilled at `rate` tokens per
+    second. Callers that find it empty wait for their tokens in the order they asked.
+
+    :param float rate: The number of tokens added per second.
+    :param float capacity: (optional) The maximum number of tokens held, i.e. the
+          largest burst allowed. Defaults to one second worth of tokens, and at
+          least 1.
+    :param Callable clock: (optional) The monotonic clock used for refilling.
+    :param Callable sleep: (optional) The function used to wait for tokens.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if capacity is None:
+            capacity = max(rate, 1.0)
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.waits = 0
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens if they are available right away, and return whether they were."""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens now, possibly into debt, and return the number of seconds to wait
+        before using them.
+
+        This lets callers wait without blocking a thread, e.g. with `asyncio.sleep`.
+
+        :param float tokens: (optional) The number of tokens to take.
+        """
+        if tokens > self.capacity:
+            raise ValueError('cannot acquire more tokens than the capacity')
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            self.waits += 1
+            return -self._tokens / self.rate
+
+    def refund(self, tokens: float = 1) -> None:
+        """
+        Give back tokens taken by `reserve` for a request that is not sent.
+
+        :param float tokens: (optional) The number of tokens to give back.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting until they are available.
+
+        :param float tokens: (optional) The number of tokens to take.
+        :param float timeout: (optional) The maximum number of seconds to wait. None
+               means no limit.
+        :return: True once the tokens are taken, False if they would not be
+                 available within timeout, in which case none are taken.
+        """
+        if tokens > self.capacity:
+            raise ValueError('cannot acquire more tokens than the capacity')
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if timeout is not None and wait > timeout:
+                self._tokens += tokens
+                return False
+            if wait > 0:
+                self.waits += 1
+        if wait > 0:
+            self.sleep(wait)
+        return True
+
+
+class RateLimiter:
+    """
+    A thread-safe limit of the rate of requests sent by the service clients.
+
+    Every request takes a token from the bucket of its operation, if the operation has
+    its own rate, and from the global bucket, if a global rate is set. The limiter can be
+    shared by several clients so that they draw from the same budget.
+
+    :param float rate: (optional) The maximum number of requests sent per second, all
+          operations included. None means no global limit.
+    :param float burst: (optional) The number of requests that can be sent at once
+          after an idle period. Defaults to one second worth of requests.
+    :param Mapping operation_rates: (optional) The maximum number of requests sent per
+          second by operation id, e.g. `{'create_topic': 2.0}`. Each operation can send
+          a burst of one second worth of requests.
+    :param Callable clock: (optional) The monotonic clock used for refilling.
+    :param Callable sleep: (optional) The function used to wait for tokens.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        *,
+        burst: Optional[float] = None,
+        operation_rates: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.sleep = sleep
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep) if rate is not None else None
+        self.operation_buckets: Dict[str, TokenBucket] = {
+            operation_id: TokenBucket(operation_rate, clock=clock, sleep=sleep)
+            for operation_id, operation_rate in (operation_rates or {}).items()
+        }
+
+    def reserve(self, operation_id: Optional[str] = None, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Take the tokens of a request and return the number of seconds to wait before
+        sending it.
+
+        :param str operation_id: (optional) The operation the request is sent for.
+        :param float timeout: (optional) The maximum number of seconds to wait. None
+               means no limit.
+        :return: The number of seconds to wait, or None if the request could not be sent
+                 within timeout, in which case no tokens are taken.
+        """
+        reserved = []
+        wait = 0.0
+        for bucket in (self.operation_buckets.get(operation_id), self.bucket):
+            if bucket is not None:
+                wait = max(wait, bucket.reserve())
+                reserved.append(bucket)
+        if timeout is not None and wait > timeout:
+            for bucket in reserved:
+                bucket.refund()
+            return None
+        return wait
+
+    def acquire(self, operation_id: Optional[str] = None) -> None:
+        """
+        Wait until a request for an operation can be sent.
+
+        :param str operation_id: (optional) The operation the request is sent for.
+        """
+        wait = self.reserve(operation_id)
+        if wait > 0:
+            self.sleep(wait)
@@ -0,0 +1,289 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module reconciles the topics of an instance with a declared desired state.
+
+The desired state maps topic names to their number of partitions and config
+properties, e.g. as loaded from a YAML file:
+
+    desired = {
+        'orders': {'partitions': 6, 'configs': {'retention.ms': 86400000, 'cleanup.policy': 'delete'}},
+    }
+
+`TopicReconciler.plan()` lists the current topics and computes the operations needed
+to reach the desired state; `TopicReconciler.apply()` sends them concurrently.
+"""
+
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+from .adminrest_v1 import AdminrestV1
+from .bulk import CREATED, DELETED, UPDATED, BulkResult, run_bulk
+from .concurrency import AdaptiveConcurrencyLimit
+from .pagination import DEFAULT_MAX_WORKERS, DEFAULT_PER_PAGE, fetch_all_pages
+
+CREATE = 'create'
+UPDATE = 'update'
+DELETE = 'delete'
+
+_statuses = {CREATE: CREATED, UPDATE: UPDATED, DELETE: DELETED}
+
+# Config properties reported as top level properties of the list_topics items.
+_listed_configs = {'retention.ms': 'retentionMs', 'cleanup.policy': 'cleanupPolicy'}
+
+# Config properties list_topics reports, at the top level or under 'configs'.
+_reported_configs = frozenset(
+    ('retention.ms', 'cleanup.policy', 'retention.bytes', 'segment.bytes', 'segment.index.bytes', 'segment.ms')
+)
+
+
+class TopicOperation(NamedTuple):
+    """
+    An operation of a reconciliation plan.
+
+    :attr str action: 'create', 'update' or 'delete'.
+    :attr str topic: The name of the topic.
+    :attr int partitions: (optional) The number of partitions the topic is created
+          with or increased to.
+    :attr dict configs: The config properties set on the topic.
+    :attr dict current: The current values of the partitions (under 'partitions')
+          and config properties changed by an update.
+    """
+
+    action: str
+    topic: str
+    partitions: Optional[int] = None
+    configs: Dict[str, str] = {}
+    current: Dict[str, Any] = {}
+
+    def __str__(self) -> str:
+        if self.action == DELETE:
+            return '- delete ' + self.topic
+        changes = dict(self.configs)
+        if self.partitions is not None:
+            changes = dict(partitions=self.partitions, **changes)
+        if self.action == CREATE:
+            return '+ create {0} ({1})'.format(
+                self.topic, ', '.join('{0}={1}'.format(name, value) for name, value in changes.items())
+            )
+        return '~ update {0} ({1})'.format(
+            self.topic,
+            ', '.join('{0}: {1} -> {2}'.format(name, self.current.get(name), value) for name, value in changes.items()),
+        )
+
+
+class TopicPlan:
+    """
+    The operations that bring the topics of an instance to their desired state.
+
+    :attr List[TopicOperation] operations: The operations, creations first, then
+          updates and deletions, each sorted by topic name.
+    :attr List[str] conflicts: The differences that cannot be reconciled, e.g. a
+          decrease of the number of partitions, and the desired configs of existing
+          topics that list_topics does not report.
+    """
+
+    def __init__(self, operations: List[TopicOperation], conflicts: List[str]) -> None:
+        self.operations = operations
+        self.conflicts = conflicts
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def __str__(self) -> str:
+        lines = [str(operation) for operation in self.operations]
+        lines.extend('! ' + conflict for conflict in self.conflicts)
+        return '\n'.join(lines) if lines else 'No changes.'
+
+
+def current_configs(topic: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Return the config properties of a list_topics item, as strings.
+
+    :param dict topic: An item of the list_topics result.
+    """
+    configs = {name: str(value) for name, value in (topic.get('configs') or {}).items() if value is not None}
+    for name, key in _listed_configs.items():
+        if name not in configs and topic.get(key) is not None:
+            configs[name] = str(topic[key])
+    return configs
+
+
+class TopicReconciler:
+    """
+    Reconcile the topics of an instance with a desired state.
+
+    Only topics that differ from their desired state are touched, with a single
+    request each: topics are created with their partitions and configs, and existing
+    topics get one update carrying both their partition increase and their config
+    changes. Config values are compared as strings; configs that are not declared are
+    left alone. The desired configs of an existing topic that list_topics does not
+    report, e.g. 'max.message.bytes', cannot be compared: they are reported as
+    conflicts rather than updated on every run.
+
+    :param AdminrestV1 service: The client used to list and change the topics.
+    :param Mapping desired: The desired topics: a mapping of topic names to a dict
+          with an optional 'partitions' number and an optional 'configs' mapping of
+          config property names to values.
+    :param bool prune: (optional) Delete the topics that are not desired. Use
+          `topic_filter` to restrict the topics the reconciler owns.
+    :param str topic_filter: (optional) Only manage the topics matching this filter,
+          see `AdminrestV1.list_topics`.
+    """
+
+    def __init__(
+        self,
+        service: AdminrestV1,
+        desired: Mapping[str, Mapping[str, Any]],
+        *,
+        prune: bool = False,
+        topic_filter: Optional[str] = None,
+    ) -> None:
+        self.service = service
+        self.desired = desired
+        self.prune = prune
+        self.topic_filter = topic_filter
+
+    def list_current(self, *, max_workers: int = DEFAULT_MAX_WORKERS, **kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the list_topics items of the managed topics, by name.
+
+        :param int max_workers: (optional) The maximum number of pages in flight.
+        :param dict headers: A `dict` containing the request headers
+        :param Deadline deadline: (optional) The deadline of the whole call, shared by
+               all of its requests.
+        """
+
+        def fetch(page: int):
+            return self.service.list_topics(
+                topic_filter=self.topic_filter, per_page=DEFAULT_PER_PAGE, page=page, **kwargs
+            )
+
+        return {topic['name']: topic for topic in fetch_all_pages(fetch, DEFAULT_PER_PAGE, max_workers=max_workers)}
+
+    def plan(self, current: Optional[Dict[str, Dict[str, Any]]] = None, **kwargs) -> TopicPlan:
+        """
+        Compute the operations needed to reach the desired state.
+
+        :param dict current: (optional) The list_topics items of the managed topics,
+               by name. Listed with `list_current()` when not given.
+        :param int max_workers: (optional) The maximum number of pages in flight when
+               listing the topics.
+        :param dict headers: A `dict` containing the request headers
+        :param Deadline deadline: (optional) The deadline of the whole call, shared by
+               all of its requests.
+        :rtype: TopicPlan
+        """
+        if current is None:
+            current = self.list_current(**kwargs)
+        creates, updates, deletes, conflicts = [], [], [], []
+
+        for name in sorted(self.desired):
+            spec = self.desired[name]
+            partitions = spec.get('partitions')
+            configs = {config: str(value) for config, value in (spec.get('configs') or {}).items()}
+            topic = current.get(name)
+            if topic is None:
+                creates.append(TopicOperation(CREATE, name, partitions=partitions, configs=configs))
+                continue
+
+            current_partitions = topic.get('partitions')
+            partition_increase = None
+            if partitions is not None and current_partitions is not None and partitions != current_partitions:
+                if partitions < current_partitions:
+                    conflicts.append(
+                        '{0}: cannot decrease partitions from {1} to {2}'.format(name, current_partitions, partitions)
+                    )
+                else:
+                    partition_increase = partitions
+            topic_configs = current_configs(topic)
+            unverifiable = [config for config in configs if config not in _reported_configs | topic_configs.keys()]
+            conflicts.extend(
+                '{0}: cannot verify config {1}, not reported by list_topics'.format(name, config)
+                for config in unverifiable
+            )
+            changed = {
+                config: value
+                for config, value in configs.items()
+                if config not in unverifiable and topic_configs.get(config) != value
+            }
+            if partition_increase is not None or changed:
+                previous = {config: topic_configs.get(config) for config in changed}
+                if partition_increase is not None:
+                    previous['partitions'] = current_partitions
+                updates.append(
+                    TopicOperation(UPDATE, name, partitions=partition_increase, configs=changed, current=previous)
+                )
+
+        if self.prune:
+            deletes = [TopicOperation(DELETE, name) for name in sorted(current) if name not in self.desired]
+        return TopicPlan(creates + updates + deletes, conflicts)
+
+    def apply(
+        self,
+        plan: Optional[TopicPlan] = None,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limit: Optional[float] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimit] = None,
+        **kwargs,
+    ) -> List[BulkResult]:
+        """
+        Send the operations of a plan concurrently.
+
+        :param TopicPlan plan: (optional) The plan to apply, as returned by `plan()`.
+               Computed when not given.
+        :param int max_workers: (optional) The maximum number of requests in flight.
+        :param float rate_limit: (optional) The maximum number of requests started
+               per second.
+        :param AdaptiveConcurrencyLimit concurrency: (optional) A limit narrowing the
+               number of requests in flight below max_workers as the service slows
+               down or throttles.
+        :param dict headers: A `dict` containing the request headers
+        :param Deadline deadline: (optional) The deadline of the whole call, shared by
+               all of its requests.
+        :return: The result of each operation, in the order of the plan, with status
+                 'created', 'updated', 'deleted' or 'failed'.
+        :rtype: List[BulkResult]
+        """
+        if plan is None:
+            plan = self.plan(max_workers=max_workers, **kwargs)
+        calls = [
+            (operation.topic, _statuses[operation.action], lambda operation=operation: self._send(operation, **kwargs))
+            for operation in plan
+        ]
+        return run_bulk(
+            calls,
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+            concurrency=concurrency,
+            deadline=kwargs.get('deadline'),
+        )
+
+    def _send(self, operation: TopicOperation, **kwargs):
+        configs = [{'name': name, 'value': value} for name, value in operation.configs.items()] or None
+        if operation.action == CREATE:
+            return self.service.create_topic(
+                name=operation.topic, partition_count=operation.partitions, configs=configs, **kwargs
+            )
+        if operation.action == UPDATE:
+            return self.service.update_topic(
+                operation.topic, new_total_partition_count=operation.partitions, configs=configs, **kwargs
+            )
+        return self.service.delete_topic(operation.topic, **kwargs)
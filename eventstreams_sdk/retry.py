@@ -0,0 +1,293 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the retry policy of the service clients.
+
+Unlike the retries of the core (`enable_retries`), which retry every method the same
+way, a `RetryPolicy` knows which operations are safe to repeat, spreads the retries of
+concurrent callers with decorrelated jitter, and stops retrying when the retries of the
+process exceed their budget, so that an outage is not amplified by retry storms.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import requests
+from ibm_cloud_sdk_core import ApiException
+
+from .circuit import CircuitOpenError
+from .deadline import Deadline
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+# Operations that are not safe to repeat whatever their method: each call creates a
+# topic, quota, schema or schema version (update_schema is a PUT adding a version).
+NON_IDEMPOTENT_OPERATIONS = frozenset(
+    ['create_topic', 'create_quota', 'create_schema', 'create_version', 'update_schema']
+)
+
+# Errors raised before the request reached the service, after which any request can be retried.
+_connect_errors = (requests.exceptions.ConnectTimeout,)
+# Errors after which the request may or may not have been processed.
+_transport_errors = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+if httpx is not None:
+    _connect_errors += (httpx.ConnectError, httpx.ConnectTimeout)
+    _transport_errors += (httpx.TransportError,)
+
+
+class RetryBudget:
+    """
+    A thread-safe budget limiting retries to a share of the requests.
+
+    Every request adds `ratio` to the budget and every retry takes 1 from it, so that
+    retries stay below `ratio` times the requests when many of them fail. Besides,
+    `min_per_second` retries per second are always allowed, so that a client sending few
+    requests can still retry.
+
+    :param float ratio: (optional) The share of the requests that may be retried.
+    :param float min_per_second: (optional) The number of retries per second allowed
+          whatever the number of requests.
+    :param float capacity: (optional) The maximum budget saved up while requests
+          succeed. Defaults to ten seconds worth of `min_per_second` retries.
+    :param Callable clock: (optional) The monotonic clock used for the minimum rate.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        *,
+        min_per_second: float = 1.0,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError('ratio must not be negative')
+        if min_per_second < 0:
+            raise ValueError('min_per_second must not be negative')
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity if capacity is not None else max(10 * min_per_second, 1.0)
+        self.clock = clock
+        self.denied = 0
+        self._balance = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float) -> None:
+        now = self.clock()
+        amount += (now - self._updated_at) * self.min_per_second
+        self._balance = min(self.capacity, self._balance + amount)
+        self._updated_at = now
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._refill(self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget and return whether it was available."""
+        with self._lock:
+            self._refill(0.0)
+            if self._balance < 1:
+                self.denied += 1
+                return False
+            self._balance -= 1
+            return True
+
+
+# The budget shared by the retry policies that are not given their own.
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryPolicy:
+    """
+    Decide which failed requests to retry, and when.
+
+    A request is retried when it fails with a status in `retry_statuses` or a timeout
+    or connection error, provided its operation is safe to repeat: its method is
+    idempotent (GET, HEAD, PUT, DELETE, OPTIONS) and it is not one of the
+    `NON_IDEMPOTENT_OPERATIONS`, or its operation id is listed in
+    `retryable_operations`. Requests rejected with 429 or that could not connect were
+    not processed and are retried whatever their method. Calls failed by an open
+    circuit (`CircuitOpenError`) are not retried.
+
+    The delay before a retry follows decorrelated jitter: it is drawn between
+    `base_delay` and three times the previous delay, capped by `max_delay`, and is at
+    least the Retry-After delay of the response. No retry is made when its delay would
+    outlast the deadline of the call.
+
+    :param int max_attempts: (optional) The maximum number of attempts, first one
+          included.
+    :param float base_delay: (optional) The lowest delay before a retry, in seconds.
+    :param float max_delay: (optional) The highest delay before a retry, in seconds.
+    :param Iterable retry_statuses: (optional) The retryable response statuses.
+    :param Iterable retryable_operations: (optional) The ids of non-idempotent
+          operations that may be retried anyway, e.g. `['create_topic']`.
+    :param RetryBudget budget: (optional) The budget the retries are taken from.
+          Defaults to a budget shared by the whole process.
+    :param Callable sleep: (optional) The function used to wait between attempts.
+    :param Callable uniform: (optional) The function drawing the delays.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        *,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retryable_operations: Iterable[str] = (),
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        if not 0 < base_delay <= max_delay:
+            raise ValueError('base_delay must be positive and at most max_delay')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retryable_operations = frozenset(retryable_operations)
+        self.budget = budget if budget is not None else DEFAULT_RETRY_BUDGET
+        self.sleep = sleep
+        self.uniform = uniform
+        self.retries = 0
+
+    def is_retryable(self, error: BaseException, method: str, operation_id: Optional[str] = None) -> bool:
+        """
+        Return whether a request failing with error may be sent again.
+
+        :param Exception error: The error the request failed with.
+        :param str method: The HTTP method of the request.
+        :param str operation_id: (optional) The operation the request was sent for.
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, ApiException):
+            if error.status_code not in self.retry_statuses:
+                return False
+            if error.status_code == 429:
+                return True
+        elif isinstance(error, _connect_errors):
+            return True
+        elif not isinstance(error, _transport_errors):
+            return False
+        if operation_id in self.retryable_operations:
+            return True
+        return method.upper() in IDEMPOTENT_METHODS and operation_id not in NON_IDEMPOTENT_OPERATIONS
+
+    def next_delay(self, previous: float, error: BaseException) -> float:
+        """
+        Return the delay before the next attempt.
+
+        :param float previous: The previous delay, or 0 before the first retry.
+        :param Exception error: The error of the last attempt.
+        """
+        delay = min(self.max_delay, self.uniform(self.base_delay, max(previous, self.base_delay) * 3))
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _retry(
+        self,
+        attempt: int,
+        error: BaseException,
+        method: str,
+        operation_id: Optional[str],
+        delay: float,
+        deadline: Optional[Deadline],
+    ) -> bool:
+        if attempt >= self.max_attempts or not self.is_retryable(error, method, operation_id):
+            return False
+        if deadline is not None and delay >= deadline.remaining():
+            return False
+        if not self.budget.withdraw():
+            return False
+        self.retries += 1
+        return True
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        method: str,
+        operation_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """
+        Call fn, which sends one request, until it succeeds or must not be retried.
+
+        :param Callable fn: The function sending the request.
+        :param str method: The HTTP method of the request.
+        :param str operation_id: (optional) The operation the request is sent for.
+        :param Deadline deadline: (optional) The deadline of the call.
+        :raises Exception: The error of the last attempt.
+        """
+        delay = 0.0
+        attempt = 1
+        self.budget.deposit()
+        while True:
+            try:
+                return fn()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                delay = self.next_delay(delay, err)
+                if not self._retry(attempt, err, method, operation_id, delay, deadline):
+                    raise
+            self.sleep(delay)
+            attempt += 1
+
+    async def call_async(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        method: str,
+        operation_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Await fn until it succeeds or must not be retried; see `call`."""
+        delay = 0.0
+        attempt = 1
+        self.budget.deposit()
+        while True:
+            try:
+                return await fn()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                delay = self.next_delay(delay, err)
+                if not self._retry(attempt, err, method, operation_id, delay, deadline):
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Return the number of seconds of the Retry-After header of an error response, if any."""
+    response = getattr(error, 'http_response', None)
+    if response is None:
+        return None
+    try:
+        return max(float(response.headers.get('Retry-After')), 0.0)
+    except (TypeError, ValueError):
+        return None
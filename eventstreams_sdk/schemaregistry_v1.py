@@ -26,18 +26,19 @@ from enum import Enum
 from typing import Dict, Optional
 import json
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
+from ibm_cloud_sdk_core import DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 
-from .common import get_sdk_headers
+from .cache import TTLCache
+from .common import EventStreamsBaseService
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class SchemaregistryV1(BaseService):
+class SchemaregistryV1(EventStreamsBaseService):
     """The schemaregistry V1 service."""
 
     DEFAULT_SERVICE_URL = None
@@ -70,7 +71,47 @@ class SchemaregistryV1(BaseService):
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
                about initializing the authenticator of your choice.
         """
-        BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        EventStreamsBaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        self.version_cache = None
+        self.latest_schema_cache = None
+
+    def enable_schema_cache(
+        self,
+        max_versions: Optional[int] = None,
+        latest_schema_ttl: Optional[float] = 5.0,
+    ) -> None:
+        """
+        Serve schema lookups from an in-process cache.
+
+        A schema version never changes once created, so get_version responses are cached
+        per (id, version) without expiry. get_latest_schema responses are cached for
+        `latest_schema_ttl` seconds. Operations that change a schema (create_version,
+        update_schema, delete_version, delete_schema and the state setters) invalidate
+        its entries. Cached responses are shared between callers and must not be
+        modified.
+
+        :param int max_versions: (optional) The maximum number of cached schema
+               versions, evicted least-recently-used first. None for no limit.
+        :param float latest_schema_ttl: (optional) The number of seconds a
+               get_latest_schema response stays valid. None to not cache them.
+        """
+        self.version_cache = TTLCache(max_size=max_versions, ttl=None)
+        self.latest_schema_cache = TTLCache(max_size=max_versions, ttl=latest_schema_ttl) if latest_schema_ttl else None
+
+    def disable_schema_cache(self) -> None:
+        """Stop caching schema lookups and drop the cached ones."""
+        self.version_cache = None
+        self.latest_schema_cache = None
+
+    def _invalidate_schema_cache(self, id: str, version: Optional[int] = None, all_versions: bool = False) -> None:
+        """Drop the cached latest schema of id, and one or all of its cached versions."""
+        if self.latest_schema_cache is not None:
+            self.latest_schema_cache.invalidate(id)
+        if self.version_cache is not None:
+            if all_versions:
+                self.version_cache.invalidate_if(lambda key: key[0] == id)
+            elif version is not None:
+                self.version_cache.invalidate((id, str(version)))
 
     #########################
     # globalRules
@@ -97,13 +138,7 @@ class SchemaregistryV1(BaseService):
 
         if not rule:
             raise ValueError('rule must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_global_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_global_rule')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -120,7 +155,7 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_global_rule', **kwargs)
         return response
 
     def update_global_rule(
@@ -154,21 +189,14 @@ class SchemaregistryV1(BaseService):
             raise ValueError('type must be provided')
         if config is None:
             raise ValueError('config must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_global_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_global_rule', content_type='application/json')
 
         data = {
             'type': type,
             'config': config,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -186,7 +214,7 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='update_global_rule', **kwargs)
         return response
 
     #########################
@@ -222,21 +250,14 @@ class SchemaregistryV1(BaseService):
             raise ValueError('type must be provided')
         if config is None:
             raise ValueError('config must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_schema_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('create_schema_rule', content_type='application/json')
 
         data = {
             'type': type,
             'config': config,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -254,7 +275,7 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='create_schema_rule', **kwargs)
         return response
 
     def get_schema_rule(
@@ -281,13 +302,7 @@ class SchemaregistryV1(BaseService):
             raise ValueError('id must be provided')
         if not rule:
             raise ValueError('rule must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_schema_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('get_schema_rule')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -304,7 +319,7 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_schema_rule', **kwargs)
         return response
 
     def update_schema_rule(
@@ -343,21 +358,14 @@ class SchemaregistryV1(BaseService):
             raise ValueError('type must be provided')
         if config is None:
             raise ValueError('config must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_schema_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_schema_rule', content_type='application/json')
 
         data = {
             'type': type,
             'config': config,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -375,7 +383,7 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='update_schema_rule', **kwargs)
         return response
 
     def delete_schema_rule(
@@ -403,13 +411,7 @@ class SchemaregistryV1(BaseService):
             raise ValueError('id must be provided')
         if not rule:
             raise ValueError('rule must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_schema_rule',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_schema_rule')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -425,7 +427,7 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='delete_schema_rule', **kwargs)
         return response
 
     #########################
@@ -454,20 +456,13 @@ class SchemaregistryV1(BaseService):
             raise ValueError('id must be provided')
         if state is None:
             raise ValueError('state must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='set_schema_state',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('set_schema_state', content_type='application/json')
 
         data = {
             'state': state,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -484,7 +479,10 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='set_schema_state', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id, all_versions=True)
         return response
 
     #########################
@@ -518,20 +516,13 @@ class SchemaregistryV1(BaseService):
             raise ValueError('version must be provided')
         if state is None:
             raise ValueError('state must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='set_schema_version_state',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('set_schema_version_state', content_type='application/json')
 
         data = {
             'state': state,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -548,7 +539,10 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='set_schema_version_state', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id, version)
         return response
 
     #########################
@@ -579,13 +573,7 @@ class SchemaregistryV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_versions',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_versions')
 
         params = {
             'jsonformat': jsonformat,
@@ -607,7 +595,7 @@ class SchemaregistryV1(BaseService):
             params=params,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_versions', **kwargs)
         return response
 
     def create_version(
@@ -633,20 +621,13 @@ class SchemaregistryV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_version',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('create_version', content_type='application/json')
 
         data = {
             'schema': schema,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -664,7 +645,10 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='create_version', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id)
         return response
 
     def get_version(
@@ -691,13 +675,13 @@ class SchemaregistryV1(BaseService):
             raise ValueError('id must be provided')
         if version is None:
             raise ValueError('version must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_version',
-        )
-        headers.update(sdk_headers)
+        cache = self.version_cache
+        if cache is not None:
+            cached = cache.get((id, str(version)))
+            if cached is not None:
+                return cached
+            generation = cache.generation((id, str(version)))
+        headers = self.get_operation_headers('get_version')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -714,7 +698,10 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_version', **kwargs)
+        if cache is not None:
+            # Not cached if the version was deleted while it was read.
+            cache.put((id, str(version)), response, generation)
         return response
 
     def delete_version(
@@ -741,13 +728,7 @@ class SchemaregistryV1(BaseService):
             raise ValueError('id must be provided')
         if version is None:
             raise ValueError('version must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_version',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_version')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -763,7 +744,10 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='delete_version', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id, version)
         return response
 
     #########################
@@ -789,13 +773,7 @@ class SchemaregistryV1(BaseService):
         :rtype: DetailedResponse with `List[str]` result
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_schemas',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('list_schemas')
 
         params = {
             'jsonformat': jsonformat,
@@ -814,7 +792,7 @@ class SchemaregistryV1(BaseService):
             params=params,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='list_schemas', **kwargs)
         return response
 
     def create_schema(
@@ -842,19 +820,13 @@ class SchemaregistryV1(BaseService):
         headers = {
             'X-Registry-ArtifactId': x_registry_artifact_id,
         }
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_schema',
-        )
-        headers.update(sdk_headers)
+        headers.update(self.get_operation_headers('create_schema', content_type='application/json'))
 
         data = {
             'schema': schema,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -869,7 +841,7 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='create_schema', **kwargs)
         return response
 
     def get_latest_schema(
@@ -890,13 +862,13 @@ class SchemaregistryV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_latest_schema',
-        )
-        headers.update(sdk_headers)
+        cache = self.latest_schema_cache
+        if cache is not None:
+            cached = cache.get(id)
+            if cached is not None:
+                return cached
+            generation = cache.generation(id)
+        headers = self.get_operation_headers('get_latest_schema')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -913,7 +885,10 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        response = self.send(request, operation_id='get_latest_schema', **kwargs)
+        if cache is not None:
+            # Not cached if the schema was changed while it was read.
+            cache.put(id, response, generation)
         return response
 
     def delete_schema(
@@ -934,13 +909,7 @@ class SchemaregistryV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_schema',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('delete_schema')
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -956,7 +925,10 @@ class SchemaregistryV1(BaseService):
             headers=headers,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='delete_schema', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id, all_versions=True)
         return response
 
     def update_schema(
@@ -980,20 +952,13 @@ class SchemaregistryV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_schema',
-        )
-        headers.update(sdk_headers)
+        headers = self.get_operation_headers('update_schema', content_type='application/json')
 
         data = {
             'schema': schema,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
-        headers['content-type'] = 'application/json'
+        data = self.json_backend.dumps(data)
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
@@ -1011,7 +976,10 @@ class SchemaregistryV1(BaseService):
             data=data,
         )
 
-        response = self.send(request, **kwargs)
+        try:
+            response = self.send(request, operation_id='update_schema', **kwargs)
+        finally:
+            self._invalidate_schema_cache(id)
         return response
 
 
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides request coalescing: concurrent identical calls share one execution.
+"""
+
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from .deadline import Deadline, DeadlineExceeded
+
+
+class _Call:
+    """An execution in flight and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    While a call for a key is in flight, other callers asking for the same key wait for
+    it and receive its result (or its exception) instead of executing their own.
+    """
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        """
+        Return fn(), or the result of the call already in flight for key.
+
+        :param Hashable key: Identifies calls that can share a result.
+        :param Callable fn: Executes the call.
+        :param Deadline deadline: (optional) The deadline of the caller, which bounds
+               its wait for a call already in flight. fn is expected to honour it.
+        :raises DeadlineExceeded: The deadline expired before the call in flight
+                completed.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+        if not leader:
+            if not call.done.wait(deadline.check() if deadline is not None else None):
+                raise DeadlineExceeded('the deadline of the call expired while waiting for the same call in flight')
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of keys with a call in flight."""
+        with self._lock:
+            return len(self._calls)
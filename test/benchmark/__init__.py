@@ -0,0 +1,5 @@
+# coding: utf-8
+
+"""Benchmarks"""
+
+# This file is only here to get pylint to check the files in this directory
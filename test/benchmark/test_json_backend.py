@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the JSON backends on list_topics and verbose get_broker_config payloads.
+
+Run with: make test-benchmark
+"""
+
+import timeit
+
+import requests
+
+from eventstreams_sdk.adminrest_v1 import BrokerDetail, TopicDetail
+from eventstreams_sdk.connection_pool import JSONResponse
+from eventstreams_sdk.json_backend import available_json_backends, get_json_backend
+
+_iterations = 20
+
+
+def topic_details(count=1000, partitions=12):
+    """
+    Return the json of a page of list_topics.
+    """
+    return [
+        TopicDetail.from_dict(
+            {
+                'name': 'orders.region-{0:04d}.v2'.format(i),
+                'partitions': partitions,
+                'replicationFactor': 3,
+                'retentionMs': 86400000,
+                'cleanupPolicy': 'delete',
+                'configs': {
+                    'retention.bytes': '1073741824',
+                    'segment.bytes': '536870912',
+                    'segment.index.bytes': '10485760',
+                    'segment.ms': '604800000',
+                },
+                'replicaAssignments': [
+                    {'id': p, 'brokers': {'replicas': [(p + r) % 6 for r in range(3)]}} for p in range(partitions)
+                ],
+            }
+        ).to_dict()
+        for i in range(count)
+    ]
+
+
+def broker_detail(configs=250):
+    """
+    Return the json of a verbose get_broker_config.
+    """
+    return BrokerDetail.from_dict(
+        {
+            'id': 0,
+            'host': 'kafka-0.mh-abcdefghijklmnopqrst.us-south.containers.appdomain.cloud',
+            'port': 9093,
+            'rack': 'us-south-1',
+            'configs': [
+                {'name': 'broker.config.property.{0}'.format(i), 'value': str(i * 1024), 'is_sensitive': i % 50 == 0}
+                for i in range(configs)
+            ],
+        }
+    ).to_dict()
+
+
+def report(name, seconds):
+    """
+    Print the time taken per iteration.
+    """
+    print('{0}: {1:.3f} ms/call'.format(name, seconds / _iterations * 1e3))
+
+
+def measure(fn):
+    """
+    Return the best time of _iterations calls of fn.
+    """
+    return min(timeit.repeat(fn, number=_iterations, repeat=5))
+
+
+def json_response(body, backend=None):
+    """
+    Return a response with a JSON body, decoded with backend if given.
+    """
+    response = JSONResponse() if backend is not None else requests.Response()
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response._content = body  # pylint: disable=protected-access
+    response.json_backend = backend
+    return response
+
+
+def test_decode():
+    """
+    Compare decoding the responses with requests and with each JSON backend.
+    """
+    for payload_name, payload in (('list_topics', topic_details()), ('get_broker_config', broker_detail())):
+        body = get_json_backend('json').dumps(payload)
+        print('{0}: {1} KiB'.format(payload_name, len(body) // 1024))
+        report('{0} decoded by requests'.format(payload_name), measure(lambda: json_response(body).json()))
+        for name in available_json_backends():
+            backend = get_json_backend(name)
+            assert json_response(body, backend).json() == payload
+            report(
+                '{0} decoded by {1}'.format(payload_name, name),
+                measure(lambda backend=backend: json_response(body, backend).json()),
+            )
+
+
+def test_encode():
+    """
+    Compare encoding request bodies with each JSON backend.
+    """
+    for payload_name, payload in (('topic details', topic_details(count=100)), ('broker configs', broker_detail())):
+        for name in available_json_backends():
+            backend = get_json_backend(name)
+            seconds = measure(lambda backend=backend: backend.dumps(payload))
+            report('{0} encoded by {1}'.format(payload_name, name), seconds)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared fixtures of the unit tests
+"""
+
+import pytest
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+
+_base_url = 'https://fake'
+
+
+class FakeClock:
+    """
+    A manually advanced clock.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """
+    Return a manually advanced clock, starting at 0.
+    """
+    return FakeClock()
+
+
+@pytest.fixture
+def new_service():
+    """
+    Return a function creating a blocking client of the mock service.
+    """
+
+    def new_service(service_class=AdminrestV1, url=_base_url, **http_config):
+        service = service_class(authenticator=NoAuthAuthenticator())
+        service.set_service_url(url)
+        if http_config:
+            service.set_http_config(http_config)
+        return service
+
+    return new_service
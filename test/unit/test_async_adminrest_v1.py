@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for AsyncAdminrestV1
+"""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+
+_base_url = 'https://fake'
+
+
+def new_service(handler):
+    """
+    Return an async client whose transport is served by the given handler.
+    """
+    service = AsyncAdminrestV1(
+        authenticator=NoAuthAuthenticator(),
+        transport=httpx.MockTransport(handler),
+    )
+    service.set_service_url(_base_url)
+    return service
+
+
+class TokenAuthenticator(Authenticator):
+    """
+    A token authenticator recording the threads it runs in.
+    """
+
+    def __init__(self):
+        self.threads = []
+
+    def validate(self):
+        pass
+
+    def authentication_type(self):
+        return Authenticator.AUTHTYPE_IAM
+
+    def authenticate(self, req):
+        self.threads.append(threading.current_thread())
+        req['headers']['Authorization'] = 'Bearer token'
+
+
+class TestAsyncAdminrestV1:
+    """
+    Test Class for AsyncAdminrestV1
+    """
+
+    def test_list_topics(self):
+        """
+        list_topics() returns an awaitable with the decoded result.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[{'name': 'topic1', 'partitions': 1}])
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.list_topics(topic_filter='topic*', per_page=10, page=2)
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response.get_result() == [{'name': 'topic1', 'partitions': 1}]
+        assert len(requests) == 1
+        assert requests[0].method == 'GET'
+        assert requests[0].url.path == '/admin/topics'
+        assert dict(requests[0].url.params) == {'topic_filter': 'topic*', 'per_page': '10', 'page': '2'}
+        assert 'eventstreams-python-sdk' in requests[0].headers['User-Agent']
+
+    def test_create_topic(self):
+        """
+        create_topic() sends the JSON body.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(202)
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.create_topic(name='topic1', partition_count=3, headers={'X-Test': 'yes'})
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 202
+        assert response.get_result() is None
+        assert requests[0].method == 'POST'
+        assert json.loads(requests[0].content) == {'name': 'topic1', 'partition_count': 3}
+        assert requests[0].headers['content-type'] == 'application/json'
+        assert requests[0].headers['X-Test'] == 'yes'
+
+    def test_error_response(self):
+        """
+        Error responses raise ApiException.
+        """
+
+        def handler(request):
+            return httpx.Response(404, json={'error_code': 404, 'message': 'topic not found'})
+
+        async def run():
+            async with new_service(handler) as service:
+                await service.get_topic('missing')
+
+        with pytest.raises(ApiException) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.message == 'topic not found'
+
+    def test_concurrent_calls(self):
+        """
+        Many operations can be in flight on one event loop.
+        """
+
+        def handler(request):
+            name = request.url.path.rsplit('/', 1)[-1]
+            return httpx.Response(200, json={'name': name})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await asyncio.gather(*(service.get_topic('topic%d' % i) for i in range(50)))
+
+        responses = asyncio.run(run())
+
+        assert [r.get_result()['name'] for r in responses] == ['topic%d' % i for i in range(50)]
+
+    def test_authentication_off_the_event_loop(self):
+        """
+        Requests are authenticated when sent, outside of the event loop thread.
+        """
+        authorizations = []
+
+        def handler(request):
+            authorizations.append(request.headers.get('Authorization'))
+            return httpx.Response(200, json={'name': 'topic1'})
+
+        authenticator = TokenAuthenticator()
+        service = AsyncAdminrestV1(authenticator=authenticator, transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+
+        async def run():
+            async with service:
+                call = service.get_topic('topic1')
+                assert not authenticator.threads
+                await call
+
+        asyncio.run(run())
+        assert authorizations == ['Bearer token']
+        assert len(authenticator.threads) == 1
+        assert authenticator.threads[0] is not threading.main_thread()
+        assert service.authenticator is authenticator
+
+    def test_value_errors_are_raised_eagerly(self):
+        """
+        Parameter validation happens before anything is awaited.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+        with pytest.raises(ValueError, match='topic_name must be provided'):
+            service.get_topic(None)
+
+    def test_topic_cache_not_supported(self):
+        """
+        The blocking topic cache cannot be enabled on the async client.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+        with pytest.raises(NotImplementedError):
+            service.enable_topic_cache()
+
+    def test_request_coalescing_not_supported(self):
+        """
+        Request coalescing cannot be enabled on the async client.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+        with pytest.raises(NotImplementedError):
+            service.enable_request_coalescing()
+
+    def test_connection_pool_configured_on_construction(self):
+        """
+        The connection pool of the async client is sized by its constructor.
+        """
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), max_connections=4, keepalive_expiry=30.0)
+        assert service.async_limits.max_connections == 4
+        assert service.async_limits.keepalive_expiry == 30.0
+        with pytest.raises(NotImplementedError):
+            service.configure_connection_pool(max_connections_per_host=4)
+
+    def test_connection_stats_not_supported(self):
+        """
+        The async client does not report a reuse rate it cannot observe.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+        with pytest.raises(NotImplementedError):
+            service.connection_stats()
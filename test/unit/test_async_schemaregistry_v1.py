@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for AsyncSchemaregistryV1
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.async_schemaregistry_v1 import AsyncSchemaregistryV1
+
+_base_url = 'https://fake'
+
+_schema = {'type': 'record', 'name': 'book', 'fields': [{'name': 'title', 'type': 'string'}]}
+
+
+def new_service(handler):
+    """
+    Return an async client whose transport is served by the given handler.
+    """
+    service = AsyncSchemaregistryV1(
+        authenticator=NoAuthAuthenticator(),
+        transport=httpx.MockTransport(handler),
+    )
+    service.set_service_url(_base_url)
+    return service
+
+
+def run(handler, call):
+    """
+    Run call(service) on a fresh event loop and return its result.
+    """
+
+    async def main():
+        async with new_service(handler) as service:
+            return await call(service)
+
+    return asyncio.run(main())
+
+
+class TestAsyncSchemaregistryV1:
+    """
+    Test Class for AsyncSchemaregistryV1
+    """
+
+    def test_get_latest_schema(self):
+        """
+        get_latest_schema() returns an awaitable with the decoded schema.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=_schema)
+
+        response = run(handler, lambda service: service.get_latest_schema('my-schema'))
+
+        assert response.get_result() == _schema
+        assert requests[0].method == 'GET'
+        assert requests[0].url.path == '/artifacts/my-schema'
+        assert requests[0].headers['Accept'] == 'application/json'
+
+    def test_get_version(self):
+        """
+        get_version() encodes the id and version path parameters.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=_schema)
+
+        response = run(handler, lambda service: service.get_version('my schema', 3))
+
+        assert response.status_code == 200
+        assert requests[0].url.raw_path == b'/artifacts/my%20schema/versions/3'
+
+    def test_create_schema(self):
+        """
+        create_schema() sends the schema body and the artifact id header.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'id': 'my-schema', 'version': 1})
+
+        response = run(
+            handler, lambda service: service.create_schema(schema=_schema, x_registry_artifact_id='my-schema')
+        )
+
+        assert response.get_result() == {'id': 'my-schema', 'version': 1}
+        assert requests[0].method == 'POST'
+        assert requests[0].headers['X-Registry-ArtifactId'] == 'my-schema'
+        assert json.loads(requests[0].content) == {'schema': _schema}
+
+    def test_set_schema_version_state(self):
+        """
+        set_schema_version_state() issues a PUT with no response body.
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(204)
+
+        response = run(handler, lambda service: service.set_schema_version_state('my-schema', 2, 'DISABLED'))
+
+        assert response.status_code == 204
+        assert response.get_result() is None
+        assert requests[0].method == 'PUT'
+        assert requests[0].url.path == '/artifacts/my-schema/versions/2/state'
+        assert json.loads(requests[0].content) == {'state': 'DISABLED'}
+
+    def test_update_global_rule(self):
+        """
+        update_global_rule() issues a PUT with the rule body.
+        """
+
+        def handler(request):
+            return httpx.Response(200, json=json.loads(request.content))
+
+        response = run(
+            handler, lambda service: service.update_global_rule('COMPATIBILITY', 'COMPATIBILITY', 'BACKWARD')
+        )
+
+        assert response.get_result() == {'type': 'COMPATIBILITY', 'config': 'BACKWARD'}
+
+    def test_error_response(self):
+        """
+        Error responses raise ApiException.
+        """
+
+        def handler(request):
+            return httpx.Response(404, json={'error_code': 404, 'message': 'schema not found'})
+
+        with pytest.raises(ApiException) as exc_info:
+            run(handler, lambda service: service.delete_schema('missing'))
+        assert exc_info.value.status_code == 404
+
+    def test_schema_cache_not_supported(self):
+        """
+        The blocking schema cache cannot be enabled on the async client.
+        """
+        service = new_service(lambda request: httpx.Response(200))
+        with pytest.raises(NotImplementedError):
+            service.enable_schema_cache()
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the bulk administration helpers
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+
+from eventstreams_sdk.adminrest_v1 import RecordDeleteRequestRecordsToDeleteItem
+from eventstreams_sdk.bulk import (
+    BulkResult,
+    OffsetReset,
+    compute_record_deletions,
+    create_topics,
+    delete_records,
+    dry_run_offset_resets,
+    execute_offset_resets,
+    plan_record_deletions,
+    run_bulk,
+)
+
+_base_url = 'https://fake'
+
+
+def request_json(call):
+    """
+    Return the decoded body of a recorded request.
+    """
+    return json.loads(call.request.body)
+
+
+class TestRunBulk:
+    """
+    Test Class for run_bulk
+    """
+
+    def test_bounded_concurrency(self):
+        """
+        At most max_workers calls are in flight, and results keep the order of calls.
+        """
+        lock = threading.Lock()
+        counts = {'in_flight': 0, 'max': 0}
+
+        def call(i):
+            with lock:
+                counts['in_flight'] += 1
+                counts['max'] = max(counts['max'], counts['in_flight'])
+            time.sleep(0.002)
+            with lock:
+                counts['in_flight'] -= 1
+            return i
+
+        results = run_bulk([(str(i), 'done', lambda i=i: call(i)) for i in range(30)], max_workers=3)
+
+        assert [result.response for result in results] == list(range(30))
+        assert all(result.status == 'done' and result.ok for result in results)
+        assert 1 < counts['max'] <= 3
+
+    def test_failures_do_not_abort(self):
+        """
+        A failing call is reported and the others still run.
+        """
+
+        def fail():
+            raise ApiException(500, message='boom')
+
+        results = run_bulk([('a', 'done', lambda: 1), ('b', 'done', fail), ('c', 'done', lambda: 3)])
+
+        assert [result.status for result in results] == ['done', 'failed', 'done']
+        assert not results[1].ok
+        assert results[1].error.status_code == 500
+
+    def test_rate_limit(self):
+        """
+        rate_limit paces the start of the calls.
+        """
+        started = []
+        run_bulk([(str(i), 'done', lambda: started.append(time.monotonic())) for i in range(6)], rate_limit=100)
+        assert started[-1] - started[0] >= 0.04
+
+    def test_invalid_max_workers(self):
+        """
+        max_workers must be positive.
+        """
+        with pytest.raises(ValueError):
+            run_bulk([], max_workers=0)
+
+
+class TestCreateTopics:
+    """
+    Test Class for create_topics
+    """
+
+    @responses.activate
+    def test_create_topics(self, new_service):
+        """
+        Every spec is created, and failures are reported per topic.
+        """
+
+        def callback(request):
+            if json.loads(request.body)['name'] == 'bad':
+                return (422, {}, json.dumps({'error_code': 422, 'message': 'invalid config'}))
+            return (202, {}, '')
+
+        responses.add_callback(responses.POST, _base_url + '/admin/topics', callback=callback)
+        specs = [{'name': 'topic%d' % i, 'partitions': 3} for i in range(20)] + [{'name': 'bad'}]
+
+        results = create_topics(new_service(), specs, max_workers=4)
+
+        assert [result.name for result in results] == [spec['name'] for spec in specs]
+        assert [result.status for result in results] == ['created'] * 20 + ['failed']
+        assert results[-1].error.status_code == 422
+        assert sorted(request_json(call)['name'] for call in responses.calls) == sorted(spec['name'] for spec in specs)
+        assert all(request_json(call).get('partitions', 3) == 3 for call in responses.calls)
+
+    @responses.activate
+    def test_skip_existing(self, new_service):
+        """
+        skip_existing lists the topics and only creates the missing ones.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics', json=[{'name': 'topic1'}])
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+
+        results = create_topics(new_service(), [{'name': 'topic1'}, {'name': 'topic2'}], skip_existing=True)
+
+        assert results[0] == BulkResult('topic1', 'skipped')
+        assert results[1].status == 'created'
+        posts = [call for call in responses.calls if call.request.method == 'POST']
+        assert [request_json(call) for call in posts] == [{'name': 'topic2'}]
+
+    def test_spec_without_name(self, new_service):
+        """
+        Every spec needs a name.
+        """
+        with pytest.raises(ValueError):
+            create_topics(new_service(), [{'partitions': 1}])
+
+
+class TestOffsetResets:
+    """
+    Test Class for dry_run_offset_resets and execute_offset_resets
+    """
+
+    def add_groups(self):
+        """
+        Register mock update_consumer_group responses; group3 is active and fails.
+        """
+
+        def callback(request):
+            group_id = request.path_url.rsplit('/', 1)[-1]
+            if group_id == 'group3':
+                return (400, {}, json.dumps({'error_code': 400, 'message': 'group is active'}))
+            body = json.loads(request.body)
+            topic = body.get('topic', 'orders')
+            offsets = [{'topic': topic, 'partition': 0, 'offset': 100}, {'topic': topic, 'partition': 1, 'offset': 200}]
+            return (200, {'Content-Type': 'application/json'}, json.dumps(offsets))
+
+        for group_id in ('group1', 'group2', 'group3'):
+            responses.add_callback(responses.PATCH, _base_url + '/admin/consumergroups/' + group_id, callback=callback)
+
+    @responses.activate
+    def test_dry_run(self, new_service):
+        """
+        Dry-runs are aggregated into a single report.
+        """
+        self.add_groups()
+        resets = [
+            OffsetReset('group1', mode='latest'),
+            OffsetReset('group2', topic='payments', mode='earliest'),
+            OffsetReset('group3', mode='latest'),
+        ]
+
+        report = dry_run_offset_resets(new_service(), resets, max_workers=3)
+
+        assert [result.status for result in report.results] == ['planned', 'planned', 'failed']
+        assert report.planned == resets[:2]
+        assert [result.name for result in report.failed] == ['group3']
+        assert list(report.rows()) == [
+            ('group1', 'orders', 0, 100),
+            ('group1', 'orders', 1, 200),
+            ('group2', 'payments', 0, 100),
+            ('group2', 'payments', 1, 200),
+        ]
+        assert report.offsets[resets[1]][0].topic == 'payments'
+        assert str(report).splitlines()[0] == 'group1 orders[0] -> 100'
+        assert str(report).splitlines()[-1].startswith('! group3: ')
+        assert all(json.loads(call.request.body)['execute'] is False for call in responses.calls)
+        group2 = [call for call in responses.calls if call.request.path_url.endswith('/group2')]
+        assert json.loads(group2[0].request.body) == {'topic': 'payments', 'mode': 'earliest', 'execute': False}
+
+    @responses.activate
+    def test_execute(self, new_service):
+        """
+        The approved resets are executed.
+        """
+        self.add_groups()
+        report = dry_run_offset_resets(new_service(), [OffsetReset('group%d' % i, mode='latest') for i in (1, 2, 3)])
+        responses.calls.reset()
+
+        results = execute_offset_resets(new_service(), report.planned)
+
+        assert [(result.name, result.status) for result in results] == [('group1', 'reset'), ('group2', 'reset')]
+        assert results[0].response.get_result()[1]['offset'] == 200
+        assert all(json.loads(call.request.body)['execute'] is True for call in responses.calls)
+        assert len(responses.calls) == 2
+
+    def test_reset_name(self):
+        """
+        The name of a reset identifies its group and topic.
+        """
+        assert OffsetReset('group1').name == 'group1'
+        assert OffsetReset('group1', topic='orders').name == 'group1/orders'
+
+
+def group(group_id, *offsets):
+    """
+    Return the json of a consumer group committed at the (topic, partition, offset) offsets.
+    """
+    return {
+        'group_id': group_id,
+        'offsets': [
+            {'topic': topic, 'partition': partition, 'current_offset': current_offset, 'end_offset': 1000}
+            for topic, partition, current_offset in offsets
+        ],
+    }
+
+
+class TestRecordDeletions:
+    """
+    Test Class for the records deletion helpers
+    """
+
+    groups = [
+        group('group1', ('orders', 0, 100), ('orders', 1, 250), ('payments', 0, 40)),
+        group('group2', ('orders', 0, 80), ('orders', 1, 300)),
+        group('group3', ('refunds', 0, 0), ('payments', 1, 7)),
+    ]
+
+    def test_compute(self):
+        """
+        Records are deleted before the smallest offset committed on each partition.
+        """
+        deletions = compute_record_deletions(self.groups, ['orders', 'refunds', 'missing'])
+
+        assert deletions == {
+            'orders': [
+                RecordDeleteRequestRecordsToDeleteItem(partition=0, before_offset=80),
+                RecordDeleteRequestRecordsToDeleteItem(partition=1, before_offset=250),
+            ]
+        }
+
+    def test_offsets_without_end_offset(self):
+        """
+        A committed offset counts even when the end offset of its partition is unknown.
+        """
+        lagging = group('group4', ('orders', 0, 10))
+        del lagging['offsets'][0]['end_offset']
+        deletions = compute_record_deletions(self.groups + [lagging], ['orders'])
+
+        assert deletions['orders'][0] == RecordDeleteRequestRecordsToDeleteItem(partition=0, before_offset=10)
+
+    def test_offsets_without_current_offset(self):
+        """
+        A partition a group has not committed an offset for is left out of the plan.
+        """
+        groups = [group('group_a', ('orders', 0, None)), group('group_b', ('orders', 0, 90))]
+        deletions = compute_record_deletions(groups, ['orders'])
+
+        assert deletions == {}
+
+    def test_offsets_without_partition(self):
+        """
+        A committed offset of an unknown partition makes the computation fail.
+        """
+        broken = group('group4', ('orders', 0, 10))
+        del broken['offsets'][0]['partition']
+        with pytest.raises(ValueError):
+            compute_record_deletions([broken], ['orders'])
+
+    @responses.activate
+    def test_plan_and_delete(self, new_service):
+        """
+        The offsets of every group are collected, then one request is sent per topic.
+        """
+        responses.add(responses.GET, _base_url + '/admin/consumergroups', json=['group1', 'group2', 'group3', 'gone'])
+        for g in self.groups:
+            responses.add(responses.GET, _base_url + '/admin/consumergroups/' + g['group_id'], json=g)
+        responses.add(responses.GET, _base_url + '/admin/consumergroups/gone', status=404)
+        responses.add(responses.DELETE, _base_url + '/admin/topics/orders/records', status=202)
+        responses.add(responses.DELETE, _base_url + '/admin/topics/payments/records', status=202)
+        service = new_service()
+
+        deletions = plan_record_deletions(service, ['orders', 'payments'], max_workers=2)
+        results = delete_records(service, deletions)
+
+        assert sorted((result.name, result.status) for result in results) == [
+            ('orders', 'deleted'),
+            ('payments', 'deleted'),
+        ]
+        bodies = {
+            call.request.path_url: json.loads(call.request.body)
+            for call in responses.calls
+            if call.request.method == 'DELETE'
+        }
+        assert bodies == {
+            '/admin/topics/orders/records': {
+                'records_to_delete': [{'partition': 0, 'before_offset': 80}, {'partition': 1, 'before_offset': 250}]
+            },
+            '/admin/topics/payments/records': {
+                'records_to_delete': [{'partition': 0, 'before_offset': 40}, {'partition': 1, 'before_offset': 7}]
+            },
+        }
+
+    @responses.activate
+    def test_unknown_offsets_raise(self, new_service):
+        """
+        A group whose offsets cannot be fetched makes the plan fail.
+        """
+        responses.add(responses.GET, _base_url + '/admin/consumergroups', json=['group1'])
+        responses.add(responses.GET, _base_url + '/admin/consumergroups/group1', status=503)
+
+        with pytest.raises(ApiException) as exc_info:
+            plan_record_deletions(new_service(), ['orders'])
+        assert exc_info.value.status_code == 503
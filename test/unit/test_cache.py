@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the response caches
+"""
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.cache import TTLCache
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+
+_base_url = 'https://fake'
+
+
+class TestTTLCache:
+    """
+    Test Class for TTLCache
+    """
+
+    def test_get_put(self):
+        """
+        get() returns the cached value and counts hits and misses.
+        """
+        cache = TTLCache()
+        assert cache.get('a') is None
+        cache.put('a', 1)
+        assert cache.get('a') == 1
+        assert cache.stats() == {'size': 1, 'hits': 1, 'misses': 1, 'evictions': 0}
+
+    def test_ttl(self, clock):
+        """
+        Entries expire after ttl seconds.
+        """
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.put('a', 1)
+        clock.now = 9.9
+        assert cache.get('a') == 1
+        clock.now = 10.0
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """
+        The least recently used entry is evicted first.
+        """
+        cache = TTLCache(max_size=2, ttl=None)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.evictions == 1
+
+    def test_unbounded(self):
+        """
+        max_size None keeps every entry.
+        """
+        cache = TTLCache(max_size=None, ttl=None)
+        for i in range(5000):
+            cache.put(i, i)
+        assert len(cache) == 5000
+
+    def test_invalidate(self):
+        """
+        invalidate(), invalidate_if() and clear() remove entries.
+        """
+        cache = TTLCache()
+        for key in [('a', 1), ('a', 2), ('b', 1)]:
+            cache.put(key, True)
+        cache.invalidate(('b', 1))
+        assert cache.get(('b', 1)) is None
+        cache.invalidate_if(lambda key: key[0] == 'a')
+        assert len(cache) == 0
+        cache.put('x', 1)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_generation(self):
+        """
+        A value read before its key was invalidated is not cached.
+        """
+        cache = TTLCache()
+        generation = cache.generation('a')
+        cache.invalidate('a')
+        cache.put('a', 'stale', generation)
+        assert cache.get('a') is None
+
+        generation = cache.generation('a')
+        cache.invalidate('b')
+        cache.put('a', 'fresh', generation)
+        assert cache.get('a') == 'fresh'
+
+        for invalidate in (lambda: cache.invalidate_if(lambda key: key == 'a'), cache.clear):
+            generation = cache.generation('a')
+            invalidate()
+            cache.put('a', 'stale', generation)
+            assert cache.get('a') is None
+
+    def test_generations_are_bounded(self):
+        """
+        Invalidating many keys does not grow the cache beyond its size.
+        """
+        cache = TTLCache(max_size=10)
+        generation = cache.generation('a')
+        for key in range(2000):
+            cache.invalidate(key)
+        assert len(cache._generations) <= 1024  # pylint: disable=protected-access
+        cache.put('a', 'stale', generation)
+        assert cache.get('a') is None
+
+    def test_invalid_arguments(self):
+        """
+        The constructor rejects non-positive sizes and ttls.
+        """
+        with pytest.raises(ValueError):
+            TTLCache(max_size=0)
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
+
+
+class TestTopicCache:
+    """
+    Test Class for the AdminrestV1 topic cache
+    """
+
+    def setup_method(self):
+        """
+        Create a client with the topic cache enabled.
+        """
+        self.service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        self.service.set_service_url(_base_url)
+        self.service.enable_topic_cache(max_size=10, ttl=60)
+
+    def add_topic(self, name, partitions=1):
+        """
+        Register a mock get_topic response.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/admin/topics/' + name,
+            json={'name': name, 'partitions': partitions},
+        )
+
+    @responses.activate
+    def test_repeated_lookups_are_cached(self):
+        """
+        Repeated get_topic calls only reach the service once.
+        """
+        self.add_topic('topic1')
+
+        for _ in range(5):
+            response = self.service.get_topic('topic1')
+            assert response.get_result()['partitions'] == 1
+
+        assert len(responses.calls) == 1
+        assert self.service.topic_cache.stats()['hits'] == 4
+        assert self.service.topic_cache.stats()['misses'] == 1
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        'mutate',
+        [
+            lambda service: service.update_topic('topic1', new_total_partition_count=2),
+            lambda service: service.delete_topic('topic1'),
+            lambda service: service.create_topic(name='topic1'),
+        ],
+    )
+    def test_mutations_invalidate(self, mutate):
+        """
+        create_topic, update_topic and delete_topic invalidate the cached topic.
+        """
+        self.add_topic('topic1')
+        responses.add(responses.PATCH, _base_url + '/admin/topics/topic1', status=202)
+        responses.add(responses.DELETE, _base_url + '/admin/topics/topic1', status=202)
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+
+        self.service.get_topic('topic1')
+        mutate(self.service)
+        self.service.get_topic('topic1')
+
+        assert len([call for call in responses.calls if call.request.method == 'GET']) == 2
+
+    @responses.activate
+    def test_mutation_during_lookup(self):
+        """
+        A topic updated while it is read is not cached.
+        """
+
+        def get_topic(request):
+            # The topic is updated by another thread while the response is on its way.
+            self.service.topic_cache.invalidate('topic1')
+            return (200, {}, '{"name": "topic1", "partitions": 1}')
+
+        responses.add_callback(
+            responses.GET, _base_url + '/admin/topics/topic1', callback=get_topic, content_type='application/json'
+        )
+
+        self.service.get_topic('topic1')
+        assert len(self.service.topic_cache) == 0
+        self.service.get_topic('topic1')
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_failed_mutation_invalidates(self):
+        """
+        A mutation that fails still invalidates the cached topic.
+        """
+        self.add_topic('topic1')
+        responses.add(responses.PATCH, _base_url + '/admin/topics/topic1', status=500)
+
+        self.service.get_topic('topic1')
+        with pytest.raises(ApiException):
+            self.service.update_topic('topic1', new_total_partition_count=2)
+
+        assert len(self.service.topic_cache) == 0
+
+    @responses.activate
+    def test_errors_are_not_cached(self):
+        """
+        Failed lookups are not cached.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/missing', status=404)
+
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                self.service.get_topic('missing')
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_disable(self):
+        """
+        disable_topic_cache() turns caching off.
+        """
+        self.add_topic('topic1')
+        self.service.disable_topic_cache()
+
+        self.service.get_topic('topic1')
+        self.service.get_topic('topic1')
+
+        assert self.service.topic_cache is None
+        assert len(responses.calls) == 2
+
+
+class TestSchemaCache:
+    """
+    Test Class for the SchemaregistryV1 schema cache
+    """
+
+    schema = {'type': 'record', 'name': 'book', 'fields': []}
+
+    def setup_method(self):
+        """
+        Create a client with the schema cache enabled.
+        """
+        self.service = SchemaregistryV1(authenticator=NoAuthAuthenticator())
+        self.service.set_service_url(_base_url)
+        self.service.enable_schema_cache()
+
+    def get_count(self, path):
+        """
+        Return the number of GET requests sent to path.
+        """
+        return len([call for call in responses.calls if call.request.method == 'GET' and call.request.path_url == path])
+
+    @responses.activate
+    def test_versions_are_cached(self):
+        """
+        get_version responses are cached per (id, version).
+        """
+        responses.add(responses.GET, _base_url + '/artifacts/s1/versions/1', json=self.schema)
+        responses.add(responses.GET, _base_url + '/artifacts/s1/versions/2', json=self.schema)
+
+        for _ in range(3):
+            assert self.service.get_version('s1', 1).get_result() == self.schema
+            self.service.get_version('s1', '2')
+        self.service.get_version('s1', 2)
+
+        assert self.get_count('/artifacts/s1/versions/1') == 1
+        assert self.get_count('/artifacts/s1/versions/2') == 1
+
+    @responses.activate
+    def test_latest_schema_ttl(self, clock):
+        """
+        get_latest_schema responses are cached until their ttl elapses.
+        """
+        self.service.latest_schema_cache.clock = clock
+        responses.add(responses.GET, _base_url + '/artifacts/s1', json=self.schema)
+
+        self.service.get_latest_schema('s1')
+        self.service.get_latest_schema('s1')
+        clock.now = 5.0
+        self.service.get_latest_schema('s1')
+
+        assert self.get_count('/artifacts/s1') == 2
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        'mutate,versions_kept',
+        [
+            (lambda service: service.create_version('s1', schema={}), 2),
+            (lambda service: service.update_schema('s1', schema={}), 2),
+            (lambda service: service.delete_version('s1', 1), 1),
+            (lambda service: service.set_schema_version_state('s1', 1, 'DISABLED'), 1),
+            (lambda service: service.set_schema_state('s1', 'DISABLED'), 0),
+            (lambda service: service.delete_schema('s1'), 0),
+        ],
+    )
+    def test_mutations_invalidate(self, mutate, versions_kept):
+        """
+        Mutations drop the latest schema and the versions they affect.
+        """
+        responses.add(responses.GET, _base_url + '/artifacts/s1', json=self.schema)
+        responses.add(responses.GET, _base_url + '/artifacts/s1/versions/1', json=self.schema)
+        responses.add(responses.GET, _base_url + '/artifacts/s1/versions/2', json=self.schema)
+        responses.add(responses.POST, _base_url + '/artifacts/s1/versions', json={})
+        responses.add(responses.PUT, _base_url + '/artifacts/s1', json={})
+        responses.add(responses.PUT, _base_url + '/artifacts/s1/state', status=204)
+        responses.add(responses.PUT, _base_url + '/artifacts/s1/versions/1/state', status=204)
+        responses.add(responses.DELETE, _base_url + '/artifacts/s1/versions/1', status=204)
+        responses.add(responses.DELETE, _base_url + '/artifacts/s1', status=204)
+
+        self.service.get_latest_schema('s1')
+        self.service.get_version('s1', 1)
+        self.service.get_version('s1', 2)
+        mutate(self.service)
+
+        assert len(self.service.latest_schema_cache) == 0
+        assert len(self.service.version_cache) == versions_kept
+
+    @responses.activate
+    def test_deletion_during_lookup(self):
+        """
+        A version deleted while get_version is in flight is not cached.
+        """
+
+        def get_version(request):
+            # The version is deleted by another caller while the response is on its way.
+            self.service.delete_version('s1', 1)
+            return (200, {}, '{"type": "record", "name": "book", "fields": []}')
+
+        responses.add_callback(
+            responses.GET, _base_url + '/artifacts/s1/versions/1', callback=get_version, content_type='application/json'
+        )
+        responses.add(responses.DELETE, _base_url + '/artifacts/s1/versions/1', status=204)
+
+        self.service.get_version('s1', 1)
+        assert len(self.service.version_cache) == 0
+
+    def test_latest_schema_cache_optional(self):
+        """
+        latest_schema_ttl None only caches schema versions.
+        """
+        self.service.enable_schema_cache(max_versions=10, latest_schema_ttl=None)
+        assert self.service.latest_schema_cache is None
+        assert self.service.version_cache.max_size == 10
+
+    def test_disable(self):
+        """
+        disable_schema_cache() drops both caches.
+        """
+        self.service.disable_schema_cache()
+        assert self.service.version_cache is None
+        assert self.service.latest_schema_cache is None
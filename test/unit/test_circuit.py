@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the circuit breakers
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitOpenError,
+    is_failure,
+)
+from eventstreams_sdk.retry import RetryBudget, RetryPolicy
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+
+_base_url = 'https://fake'
+
+
+def fail(error):
+    """
+    Return a function raising error.
+    """
+
+    def fn():
+        raise error
+
+    return fn
+
+
+class TestCircuitBreaker:
+    """
+    Test Class for CircuitBreaker
+    """
+
+    def test_is_failure(self):
+        """
+        Server errors, timeouts and connection failures count against the circuit.
+        """
+        assert is_failure(ApiException(500))
+        assert is_failure(requests.exceptions.ReadTimeout())
+        assert is_failure(httpx.ConnectError('refused'))
+        assert not is_failure(ApiException(429))
+        assert not is_failure(ApiException(404))
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """
+        The circuit opens after failure_threshold consecutive failures only.
+        """
+        circuit = CircuitBreaker(3, clock=clock)
+        circuit.record_failure()
+        circuit.record_failure()
+        circuit.record_success()
+        circuit.record_failure()
+        circuit.record_failure()
+        assert circuit.state == CLOSED
+        circuit.record_failure()
+        assert circuit.state == OPEN
+        assert circuit.before_call() is None
+
+    def test_half_open_after_reset_timeout(self, clock):
+        """
+        Once reset_timeout has elapsed, one call probes the circuit.
+        """
+        circuit = CircuitBreaker(1, 10, clock=clock)
+        circuit.record_failure()
+        clock.now += 9
+        assert circuit.before_call() is None
+        clock.now += 1
+        assert circuit.before_call() == HALF_OPEN
+        assert circuit.before_call() is None
+
+        circuit.record_failure()
+        assert circuit.state == OPEN
+        clock.now += 10
+        assert circuit.before_call() == HALF_OPEN
+        circuit.record_success()
+        assert circuit.state == CLOSED
+
+    def test_invalid_arguments(self):
+        """
+        The threshold and the timeout are validated.
+        """
+        with pytest.raises(ValueError):
+            CircuitBreaker(0)
+        with pytest.raises(ValueError):
+            CircuitBreakers(reset_timeout=0)
+
+
+class TestCircuitBreakers:
+    """
+    Test Class for CircuitBreakers
+    """
+
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, clock):
+        """
+        Use a fake clock.
+        """
+        self.clock = clock
+
+    def test_fail_fast_per_operation(self):
+        """
+        An open circuit fails the calls of its operation only, without calling them.
+        """
+        breakers = CircuitBreakers(2, clock=self.clock)
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                breakers.call(fail(ApiException(503)), 'get_topic')
+
+        calls = []
+        with pytest.raises(CircuitOpenError) as err:
+            breakers.call(lambda: calls.append(None), 'get_topic')
+        assert not calls
+        assert err.value.status_code == 503
+        assert err.value.operation_id == 'get_topic'
+        assert breakers.call(lambda: 'ok', 'list_topics') == 'ok'
+        assert breakers.state('get_topic') == OPEN
+        assert breakers.state('list_topics') == CLOSED
+
+    def test_probe(self):
+        """
+        The half-open call is only sent when the probe reports a healthy service.
+        """
+        healthy = []
+        breakers = CircuitBreakers(1, 5, probe=lambda: healthy.pop(), clock=self.clock)
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            breakers.call(fail(requests.exceptions.ReadTimeout()), 'get_topic')
+
+        self.clock.now += 5
+        healthy.append(False)
+        calls = []
+        with pytest.raises(CircuitOpenError):
+            breakers.call(lambda: calls.append(None), 'get_topic')
+        assert not calls
+        assert breakers.state('get_topic') == OPEN
+
+        self.clock.now += 5
+        healthy.append(True)
+        assert breakers.call(lambda: 'ok', 'get_topic') == 'ok'
+        assert breakers.state('get_topic') == CLOSED
+
+    def test_failing_probe(self):
+        """
+        A probe raising an error reports an unhealthy service.
+        """
+        breakers = CircuitBreakers(1, 5, probe=fail(ApiException(503)), clock=self.clock)
+        with pytest.raises(ApiException):
+            breakers.call(fail(ApiException(500)), 'get_topic')
+        self.clock.now += 5
+        with pytest.raises(CircuitOpenError):
+            breakers.call(lambda: 'ok', 'get_topic')
+
+    def test_exempt_operations(self):
+        """
+        Exempt operations are never failed by the circuit.
+        """
+        breakers = CircuitBreakers(1, exempt=['get_status'], clock=self.clock)
+        for _ in range(3):
+            with pytest.raises(ApiException):
+                breakers.call(fail(ApiException(503)), 'get_status')
+        assert breakers.call(lambda: 'ok', 'get_status') == 'ok'
+
+    def test_async_probe(self):
+        """
+        The async calls await coroutine probes.
+        """
+
+        async def probe():
+            return True
+
+        async def ok():
+            return 'ok'
+
+        async def failing():
+            raise ApiException(502)
+
+        breakers = CircuitBreakers(1, 5, probe=probe, clock=self.clock)
+
+        async def run():
+            with pytest.raises(ApiException):
+                await breakers.call_async(failing, 'get_topic')
+            with pytest.raises(CircuitOpenError):
+                await breakers.call_async(ok, 'get_topic')
+            self.clock.now += 5
+            return await breakers.call_async(ok, 'get_topic')
+
+        assert asyncio.run(run()) == 'ok'
+        assert breakers.state('get_topic') == CLOSED
+
+
+class TestServiceCircuitBreaker:
+    """
+    Test Class for the circuit breakers of the service clients
+    """
+
+    @responses.activate
+    def test_offline_instance(self, clock):
+        """
+        The admin client fails fast while the instance is offline, and probes it with
+        get_status.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', status=503)
+        responses.add(responses.GET, _base_url + '/admin/status', json={'status': 'offline'})
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_circuit_breaker(failure_threshold=2, reset_timeout=5)
+        service.circuit_breakers.clock = clock
+
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                service.get_topic('topic1')
+        with pytest.raises(CircuitOpenError):
+            service.get_topic('topic1')
+        assert len(responses.calls) == 2
+
+        clock.now += 5
+        with pytest.raises(CircuitOpenError):
+            service.get_topic('topic1')
+        assert [call.request.url for call in responses.calls[2:]] == [_base_url + '/admin/status']
+
+        service.disable_circuit_breaker()
+        with pytest.raises(ApiException):
+            service.get_topic('topic1')
+
+    @responses.activate
+    def test_open_circuit_is_not_retried(self):
+        """
+        The retry policy does not retry the calls failed by an open circuit.
+        """
+        responses.add(responses.GET, _base_url + '/artifacts', status=500)
+        service = SchemaregistryV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_circuit_breaker(failure_threshold=2)
+        service.enable_retry_policy(RetryPolicy(5, budget=RetryBudget(), sleep=lambda delay: None))
+
+        with pytest.raises(CircuitOpenError):
+            service.list_schemas()
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_probe_is_sent_once(self, clock):
+        """
+        The health check is sent once within probe_timeout, without retries or hedging.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', status=503)
+        responses.add(responses.GET, _base_url + '/admin/status', status=503)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_retry_policy(RetryPolicy(1, budget=RetryBudget(), sleep=lambda delay: None))
+        service.enable_hedging()
+        service.enable_circuit_breaker(failure_threshold=1, reset_timeout=5, probe_timeout=2)
+        service.circuit_breakers.clock = clock
+
+        with pytest.raises(ApiException):
+            service.get_topic('topic1')
+        clock.now += 5
+        with pytest.raises(CircuitOpenError):
+            service.get_topic('topic1')
+
+        probes = [call for call in responses.calls if call.request.url == _base_url + '/admin/status']
+        assert len(probes) == 1
+        assert 0 < probes[0].request.req_kwargs['timeout'] <= 2
+
+        with pytest.raises(ValueError):
+            service.enable_circuit_breaker(probe_timeout=0)
+
+    def test_async_client(self, clock):
+        """
+        The async admin client probes the instance with get_status.
+        """
+        paths = []
+        probe_timeouts = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == '/admin/status':
+                probe_timeouts.append(request.extensions['timeout']['read'])
+                return httpx.Response(200, json={'status': 'available'})
+            if len(paths) == 1:
+                return httpx.Response(504)
+            return httpx.Response(200, json={'name': 'topic1'})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        service.enable_circuit_breaker(failure_threshold=1, reset_timeout=5, probe_timeout=2)
+        service.circuit_breakers.clock = clock
+
+        async def run():
+            async with service:
+                with pytest.raises(ApiException):
+                    await service.get_topic('topic1')
+                with pytest.raises(CircuitOpenError):
+                    await service.get_topic('topic1')
+                clock.now += 5
+                return await service.get_topic('topic1')
+
+        assert asyncio.run(run()).get_result() == {'name': 'topic1'}
+        assert paths == ['/admin/topics/topic1', '/admin/status', '/admin/topics/topic1']
+        assert 0 < probe_timeouts[0] <= 2
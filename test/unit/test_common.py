@@ -19,7 +19,12 @@ Test methods in the common module
 """
 
 import unittest
+from unittest import mock
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
 from eventstreams_sdk import common
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
 
 
 class TestCommon(unittest.TestCase):
@@ -48,3 +53,43 @@ class TestCommon(unittest.TestCase):
         self.assertIn('arch=', system_info)
         self.assertIn('os=', system_info)
         self.assertIn('python.version=', system_info)
+
+
+class TestOperationHeaders(unittest.TestCase):
+    """
+    Test the precomputed per-operation headers
+    """
+
+    def setUp(self):
+        self.service = AdminrestV1(authenticator=NoAuthAuthenticator())
+
+    def test_headers_are_built_once(self):
+        """
+        get_sdk_headers is only called the first time an operation is invoked
+        """
+        with mock.patch.object(common, 'get_sdk_headers', wraps=common.get_sdk_headers) as get_sdk_headers:
+            for _ in range(3):
+                headers = self.service.get_operation_headers('get_consumer_group')
+        get_sdk_headers.assert_called_once_with(
+            service_name=AdminrestV1.DEFAULT_SERVICE_NAME,
+            service_version='V1',
+            operation_id='get_consumer_group',
+        )
+        self.assertEqual(headers, {'User-Agent': common.get_user_agent()})
+
+    def test_headers_are_copied(self):
+        """
+        Changes to the returned headers do not leak into later requests
+        """
+        headers = self.service.get_operation_headers('get_topic')
+        headers['Accept'] = 'application/json'
+        headers['X-Custom'] = 'value'
+        self.assertEqual(self.service.get_operation_headers('get_topic'), {'User-Agent': common.get_user_agent()})
+
+    def test_content_type(self):
+        """
+        The content type is part of the headers of operations with a request body
+        """
+        headers = self.service.get_operation_headers('create_topic', content_type='application/json')
+        self.assertEqual(headers['content-type'], 'application/json')
+        self.assertNotIn('content-type', self.service.get_operation_headers('get_topic'))
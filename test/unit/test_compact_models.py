@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compact models
+"""
+
+import tracemalloc
+
+import pytest
+
+from eventstreams_sdk.adminrest_v1 import (
+    BrokerDetailConfigsItem,
+    MemberAssignmentsItem,
+    TopicDetailReplicaAssignmentsItem,
+    TopicPartitionOffset,
+)
+from eventstreams_sdk.compact_models import (
+    CompactBrokerDetailConfigsItem,
+    CompactMemberAssignmentsItem,
+    CompactTopicDetailReplicaAssignmentsItem,
+    CompactTopicDetailReplicaAssignmentsItemBrokers,
+    CompactTopicPartitionOffset,
+)
+
+_models = [
+    (
+        BrokerDetailConfigsItem,
+        CompactBrokerDetailConfigsItem,
+        {'name': 'log.retention.ms', 'value': '86400000', 'is_sensitive': False},
+    ),
+    (MemberAssignmentsItem, CompactMemberAssignmentsItem, {'topic': 'topic1', 'partition': 3}),
+    (
+        TopicDetailReplicaAssignmentsItem,
+        CompactTopicDetailReplicaAssignmentsItem,
+        {'id': 0, 'brokers': {'replicas': [0, 1, 2]}},
+    ),
+    (
+        TopicPartitionOffset,
+        CompactTopicPartitionOffset,
+        {'topic': 'topic1', 'partition': 3, 'current_offset': 1000, 'end_offset': 1200},
+    ),
+]
+
+
+def allocated_per_object(cls, dicts):
+    """
+    Return the memory allocated per object when building cls objects from dicts.
+    """
+    tracemalloc.start()
+    try:
+        objects = [cls.from_dict(d) for d in dicts]
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return allocated / len(objects)
+
+
+class TestCompactModels:
+    """
+    Test Class for the compact models
+    """
+
+    @pytest.mark.parametrize('model,compact,model_json', _models)
+    def test_serialization(self, model, compact, model_json):
+        """
+        Compact models serialize like the models they mirror.
+        """
+        compact_model = compact.from_dict(model_json)
+        assert compact_model.to_dict() == model_json
+        assert compact_model.to_dict() == model.from_dict(model_json).to_dict()
+        assert compact_model == compact._from_dict(compact_model._to_dict())
+        assert str(compact_model) == str(model.from_dict(model_json))
+
+    @pytest.mark.parametrize('model,compact,model_json', _models)
+    def test_unset_properties(self, model, compact, model_json):
+        """
+        Unset properties are omitted from the json dictionary.
+        """
+        assert compact.from_dict({}).to_dict() == {}
+        assert compact() != compact.from_dict(model_json)
+
+    def test_nested_model(self):
+        """
+        Nested properties are compact models too.
+        """
+        item = CompactTopicDetailReplicaAssignmentsItem.from_dict({'id': 1, 'brokers': {'replicas': [1]}})
+        assert isinstance(item.brokers, CompactTopicDetailReplicaAssignmentsItemBrokers)
+        assert item.brokers.replicas == [1]
+
+    def test_no_instance_dict(self):
+        """
+        Compact models only accept their own properties.
+        """
+        offset = CompactTopicPartitionOffset(topic='topic1', partition=0)
+        assert not hasattr(offset, '__dict__')
+        offset.current_offset = 5
+        with pytest.raises(AttributeError):
+            offset.lag = 5
+
+    @pytest.mark.parametrize('model,compact,model_json', _models)
+    def test_memory(self, model, compact, model_json):
+        """
+        Compact models take substantially less memory than the models they mirror.
+        """
+        dicts = [dict(model_json) for _ in range(10000)]
+
+        model_size = allocated_per_object(model, dicts)
+        compact_size = allocated_per_object(compact, dicts)
+
+        assert compact_size < 0.85 * model_size
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the adaptive concurrency limit
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.bulk import CREATED, FAILED, create_topics, run_bulk
+from eventstreams_sdk.concurrency import AdaptiveConcurrencyLimit, is_overload
+from eventstreams_sdk.deadline import Deadline, DeadlineExceeded
+
+_base_url = 'https://fake'
+
+
+class InFlight:
+    """
+    Track the highest number of concurrent calls.
+    """
+
+    def __init__(self):
+        self.current = 0
+        self.highest = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.highest = max(self.highest, self.current)
+
+    def __exit__(self, *exc_info):
+        with self.lock:
+            self.current -= 1
+
+
+class TestIsOverload:
+    """
+    Test Class for is_overload
+    """
+
+    def test_overload_errors(self):
+        """
+        429 and 5xx responses, timeouts and connection failures signal an overload.
+        """
+        assert is_overload(ApiException(429))
+        assert is_overload(ApiException(503))
+        assert is_overload(requests.exceptions.ReadTimeout())
+        assert is_overload(requests.exceptions.ConnectionError())
+        assert is_overload(httpx.ConnectTimeout('timed out'))
+        assert not is_overload(ApiException(404))
+        assert not is_overload(ValueError())
+        assert not is_overload(DeadlineExceeded())
+
+
+class TestAdaptiveConcurrencyLimit:
+    """
+    Test Class for AdaptiveConcurrencyLimit
+    """
+
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, clock):
+        """
+        Use a fake clock.
+        """
+        self.clock = clock
+
+    def new_limit(self, initial_limit=4, **kwargs):
+        """
+        Return a limit timed by the fake clock.
+        """
+        return AdaptiveConcurrencyLimit(initial_limit, clock=self.clock, **kwargs)
+
+    def complete(self, limit, count, latency=0.1, error=None):
+        """
+        Run count requests concurrently, completing them after latency.
+        """
+        started = [limit.acquire() for _ in range(count)]
+        self.clock.now += latency
+        for started_at in started:
+            limit.release(started_at, error)
+
+    def test_increase_while_latency_is_stable(self):
+        """
+        The limit grows while the requests use it.
+        """
+        limit = self.new_limit(4, max_limit=6)
+        for _ in range(3):
+            self.complete(limit, limit.limit)
+        assert limit.limit == 5
+        for _ in range(20):
+            self.complete(limit, limit.limit)
+        assert limit.limit == 6
+        assert limit.in_flight == 0
+        assert limit.decreases == 0
+
+    def test_no_increase_when_underused(self):
+        """
+        Requests that do not reach the limit do not grow it.
+        """
+        limit = self.new_limit(4)
+        for _ in range(10):
+            self.complete(limit, 1)
+        assert limit.limit == 4
+
+    def test_decrease_once_per_burst_of_overloads(self):
+        """
+        The requests in flight when the service throttles shrink the limit once.
+        """
+        limit = self.new_limit(8)
+        self.complete(limit, 8, error=ApiException(429))
+        assert limit.limit == 4
+        assert limit.decreases == 1
+
+        self.complete(limit, 4, error=ApiException(503))
+        assert limit.limit == 2
+        self.complete(limit, 2, error=ApiException(503))
+        self.complete(limit, 1, error=ApiException(503))
+        assert limit.limit == 1
+
+    def test_other_errors_are_ignored(self):
+        """
+        Client errors neither shrink the limit nor count as latency samples.
+        """
+        limit = self.new_limit(4)
+        for _ in range(3):
+            self.complete(limit, 4, error=ApiException(404), latency=0.001)
+        assert limit.limit == 4
+        assert limit.min_latency is None
+        assert limit.decreases == 0
+
+    def test_min_latency_follows_the_service(self):
+        """
+        The lowest latency is taken over a window of requests, so one fast outlier does
+        not shrink the limit forever.
+        """
+        limit = self.new_limit(8, min_latency_window=10)
+        self.complete(limit, 1, latency=0.001)
+        for _ in range(2000):
+            self.complete(limit, limit.limit, latency=0.1)
+        assert limit.min_latency == pytest.approx(0.1)
+        assert limit.decreases < 10
+        assert limit.limit == 64
+
+    def test_decrease_on_latency_spike(self):
+        """
+        A smoothed latency above the tolerance shrinks the limit.
+        """
+        limit = self.new_limit(8, smoothing=1.0)
+        self.complete(limit, 1, latency=0.1)
+        self.complete(limit, 1, latency=0.15)
+        assert limit.limit == 8
+        self.complete(limit, 1, latency=0.5)
+        assert limit.limit == 4
+
+    def test_threads_wait_for_the_limit(self):
+        """
+        Calls beyond the limit wait for a call to complete.
+        """
+        limit = AdaptiveConcurrencyLimit(2, max_limit=2)
+        tracker = InFlight()
+
+        def work():
+            with tracker:
+                time.sleep(0.005)
+
+        threads = [threading.Thread(target=limit.call, args=(work,)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracker.highest == 2
+        assert limit.in_flight == 0
+
+    def test_coroutines_wait_for_the_limit(self):
+        """
+        Coroutines beyond the limit wait without blocking the event loop.
+        """
+        limit = AdaptiveConcurrencyLimit(3, max_limit=3)
+        tracker = InFlight()
+
+        async def work(i):
+            with tracker:
+                await asyncio.sleep(0.001)
+            return i
+
+        async def run():
+            return await asyncio.gather(*(limit.call_async(work, i) for i in range(20)))
+
+        assert asyncio.run(run()) == list(range(20))
+        assert tracker.highest == 3
+        assert limit.in_flight == 0
+
+    def test_errors_are_raised(self):
+        """
+        call() releases the slot of a failed call and raises its error.
+        """
+        limit = self.new_limit(2)
+        with pytest.raises(ApiException):
+            limit.call(lambda: (_ for _ in ()).throw(ApiException(500)))
+        assert limit.in_flight == 0
+        assert limit.limit == 1
+
+    def test_invalid_arguments(self):
+        """
+        The limits and the adjustment factors are validated.
+        """
+        with pytest.raises(ValueError, match='min_limit'):
+            AdaptiveConcurrencyLimit(1, min_limit=0)
+        with pytest.raises(ValueError, match='initial_limit'):
+            AdaptiveConcurrencyLimit(100, max_limit=10)
+        with pytest.raises(ValueError, match='backoff'):
+            AdaptiveConcurrencyLimit(backoff=1)
+        with pytest.raises(ValueError, match='latency_tolerance'):
+            AdaptiveConcurrencyLimit(latency_tolerance=1)
+        with pytest.raises(ValueError, match='min_latency_window'):
+            AdaptiveConcurrencyLimit(min_latency_window=0)
+
+
+class TestAdaptiveConcurrencyUsers:
+    """
+    Test Class for the helpers and clients using an adaptive concurrency limit
+    """
+
+    def test_run_bulk(self):
+        """
+        run_bulk() keeps its calls within the limit and shrinks it on throttling.
+        """
+        limit = AdaptiveConcurrencyLimit(3, max_limit=3)
+        tracker = InFlight()
+
+        def call(i):
+            with tracker:
+                time.sleep(0.002)
+            if i % 5 == 0:
+                raise ApiException(429)
+            return i
+
+        calls = [(str(i), CREATED, lambda i=i: call(i)) for i in range(20)]
+        results = run_bulk(calls, max_workers=8, concurrency=limit)
+
+        assert [result.status for result in results] == [FAILED if i % 5 == 0 else CREATED for i in range(20)]
+        assert tracker.highest <= 3
+        assert limit.decreases >= 1
+
+    @responses.activate
+    def test_create_topics(self):
+        """
+        The bulk helpers accept a concurrency limit.
+        """
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        limit = AdaptiveConcurrencyLimit(2)
+
+        results = create_topics(service, [{'name': 'topic%d' % i} for i in range(4)], concurrency=limit)
+
+        assert all(result.ok for result in results)
+        assert limit.in_flight == 0
+        assert limit.min_latency is not None
+
+    @responses.activate
+    def test_client(self):
+        """
+        A client with adaptive concurrency shrinks its limit on 503 responses.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', status=503)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_adaptive_concurrency(4)
+
+        with pytest.raises(ApiException):
+            service.get_topic('topic1')
+
+        assert service.concurrency_limit.limit == 2
+        service.disable_adaptive_concurrency()
+        assert service.concurrency_limit is None
+
+    @responses.activate
+    def test_expired_deadline(self, clock):
+        """
+        A request timing out because the deadline of the caller expired leaves the
+        limit alone.
+        """
+
+        def timeout(request):
+            clock.now = 1.0
+            raise requests.exceptions.ReadTimeout('timed out')
+
+        responses.add_callback(responses.GET, _base_url + '/admin/topics/topic1', callback=timeout)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_adaptive_concurrency(4)
+
+        with pytest.raises(DeadlineExceeded):
+            service.get_topic('topic1', deadline=Deadline(1.0, clock=clock))
+
+        assert service.concurrency_limit.limit == 4
+        assert service.concurrency_limit.decreases == 0
+        assert service.concurrency_limit.in_flight == 0
+
+    def test_async_client(self):
+        """
+        The async clients keep their requests within the limit.
+        """
+        tracker = InFlight()
+
+        async def handler(request):
+            with tracker:
+                await asyncio.sleep(0.001)
+            return httpx.Response(200, json={'name': 'topic1'})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        service.enable_adaptive_concurrency(2, max_limit=2)
+
+        async def run():
+            async with service:
+                return await asyncio.gather(*(service.get_topic('topic1') for _ in range(10)))
+
+        assert len(asyncio.run(run())) == 10
+        assert tracker.highest == 2
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the connection pool configuration
+"""
+
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from eventstreams_sdk.connection_pool import ConnectionStats, PooledHTTPAdapter, keepalive_socket_options
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer every GET with a topic, keeping the connection open."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = json.dumps({'name': self.path.rsplit('/', 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name='server_url')
+def fixture_server_url():
+    """
+    Serve HTTP/1.1 on a local port for the duration of a test.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:%d' % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionStats:
+    """
+    Test Class for ConnectionStats
+    """
+
+    def test_reuse_rate(self):
+        """
+        The reuse rate is the share of the requests sent on an existing connection.
+        """
+        stats = ConnectionStats(requests=10, connections=2)
+        assert stats.reused == 8
+        assert stats.reuse_rate == 0.8
+
+    def test_no_requests(self):
+        """
+        The reuse rate is zero before any request.
+        """
+        assert ConnectionStats(0, 0).reuse_rate == 0.0
+
+
+class TestConnectionPool:
+    """
+    Test Class for the connection pool of the service clients
+    """
+
+    def test_connections_are_reused(self, server_url, new_service):
+        """
+        Sequential requests share one keep-alive connection.
+        """
+        service = new_service(url=server_url)
+        for i in range(5):
+            assert service.get_topic('topic%d' % i).get_result() == {'name': 'topic%d' % i}
+
+        stats = service.connection_stats()
+        assert stats == ConnectionStats(requests=5, connections=1)
+        assert stats.reuse_rate == 0.8
+
+    def test_pool_sized_for_concurrency(self, server_url, new_service):
+        """
+        With a blocking pool, concurrent requests never open more connections than the
+        pool holds.
+        """
+        service = new_service(url=server_url)
+        service.configure_connection_pool(max_connections_per_host=2, pool_block=True)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: service.get_topic('topic%d' % i).get_result(), range(40)))
+
+        assert [result['name'] for result in results] == ['topic%d' % i for i in range(40)]
+        stats = service.connection_stats()
+        assert stats.requests == 40
+        assert stats.connections <= 2
+
+    def test_configuration_survives_retries_and_ssl_changes(self, new_service):
+        """
+        Enabling retries or changing the SSL verification keeps the pool configuration.
+        """
+        service = new_service(SchemaregistryV1)
+        service.configure_connection_pool(max_connections_per_host=32, max_hosts=2, pool_block=True)
+
+        service.enable_retries(max_retries=3)
+        service.set_disable_ssl_verification(True)
+
+        adapter = service.get_http_client().get_adapter('https://fake')
+        assert adapter is service.http_adapter
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter.max_retries.total == 3
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+        assert adapter.poolmanager.pools._maxsize == 2  # pylint: disable=protected-access
+
+        service.disable_retries()
+        assert service.http_adapter.max_retries.total == 0
+        assert service.http_adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+
+    def test_keepalive_idle(self, new_service):
+        """
+        keepalive_idle enables TCP keep-alive on the sockets of new connections.
+        """
+        service = new_service()
+        service.configure_connection_pool(keepalive_idle=30)
+
+        options = service.http_adapter.poolmanager.connection_pool_kw['socket_options']
+        assert options == keepalive_socket_options(30)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_invalid_configuration(self, new_service):
+        """
+        The pool sizes must be at least 1 and the idle time positive.
+        """
+        service = new_service()
+        with pytest.raises(ValueError, match='max_connections_per_host must be at least 1'):
+            service.configure_connection_pool(max_connections_per_host=0)
+        with pytest.raises(ValueError, match='max_hosts must be at least 1'):
+            service.configure_connection_pool(max_hosts=0)
+        with pytest.raises(ValueError, match='keepalive_idle must be positive'):
+            service.configure_connection_pool(keepalive_idle=0)
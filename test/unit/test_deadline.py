@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the deadlines of the calls
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.bulk import FAILED, run_bulk
+from eventstreams_sdk.circuit import is_failure
+from eventstreams_sdk.deadline import Deadline, DeadlineExceeded
+from eventstreams_sdk.pagination import list_all_topics
+from eventstreams_sdk.retry import RetryBudget, RetryPolicy
+
+_base_url = 'https://fake'
+
+
+class TestDeadline:
+    """
+    Test Class for Deadline
+    """
+
+    def test_remaining(self, clock):
+        """
+        The time left decreases to 0, after which check raises.
+        """
+        deadline = Deadline(2.0, clock=clock)
+        assert deadline.remaining() == 2.0
+        assert deadline.check() == 2.0
+        assert not deadline.expired
+
+        clock.now = 2.5
+        assert deadline.remaining() == 0.0
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded):
+            deadline.check()
+
+    def test_cap(self, clock):
+        """
+        Timeouts are shortened to the time left.
+        """
+        deadline = Deadline(2.0, clock=clock)
+        assert deadline.cap(None) == 2.0
+        assert deadline.cap(1.0) == 1.0
+        assert deadline.cap(60) == 2.0
+        assert deadline.cap((1.0, 60)) == (1.0, 2.0)
+        assert deadline.cap((None, 1.5)) == (2.0, 1.5)
+
+    def test_invalid_timeout(self):
+        """
+        A deadline cannot be in the past.
+        """
+        with pytest.raises(ValueError):
+            Deadline(-1)
+
+    def test_not_a_circuit_failure(self):
+        """
+        An expired deadline says nothing about the health of the service.
+        """
+        assert issubclass(DeadlineExceeded, TimeoutError)
+        assert not is_failure(DeadlineExceeded())
+
+    def test_retries_stop_at_deadline(self, clock):
+        """
+        No retry is made when its delay would outlast the deadline.
+        """
+        sleeps = []
+
+        def sleep(delay):
+            sleeps.append(delay)
+            clock.now += delay
+
+        policy = RetryPolicy(budget=RetryBudget(), sleep=sleep, uniform=lambda low, high: low)
+        calls = []
+
+        def fn():
+            calls.append(None)
+            clock.now += 0.4
+            raise ApiException(503)
+
+        with pytest.raises(ApiException):
+            policy.call(fn, 'GET', deadline=Deadline(1.0, clock=clock))
+        # 0.4s per attempt plus 0.1s per retry: the second retry would start at the deadline.
+        assert len(calls) == 2
+        assert sleeps == [0.1]
+
+
+class TestServiceDeadline:
+    """
+    Test Class for the deadlines of the service clients
+    """
+
+    @responses.activate
+    def test_timeout_is_capped(self, new_service):
+        """
+        The timeout of the request is the time left, even with a configured timeout.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', json={'name': 'topic1'})
+        service = new_service(timeout=30)
+
+        service.get_topic('topic1')
+        assert responses.calls[0].request.req_kwargs['timeout'] == 30
+
+        service.get_topic('topic1', deadline=Deadline(5.0))
+        assert 0 < responses.calls[1].request.req_kwargs['timeout'] <= 5.0
+
+    @responses.activate
+    def test_expired_deadline(self, clock, new_service):
+        """
+        No request is sent once the deadline has expired.
+        """
+        deadline = Deadline(1.0, clock=clock)
+        clock.now = 1.0
+
+        with pytest.raises(DeadlineExceeded):
+            new_service().get_topic('topic1', deadline=deadline)
+        assert not responses.calls
+
+    @responses.activate
+    def test_timeout_after_deadline(self, clock, new_service):
+        """
+        A request timing out once the deadline has expired raises DeadlineExceeded.
+        """
+        deadline = Deadline(1.0, clock=clock)
+
+        def timeout(request):
+            clock.now = 1.0
+            raise requests.exceptions.ReadTimeout('timed out')
+
+        responses.add_callback(responses.GET, _base_url + '/admin/topics/topic1', callback=timeout)
+        service = new_service()
+        service.enable_retry_policy(RetryPolicy(budget=RetryBudget(), sleep=lambda delay: None))
+
+        with pytest.raises(DeadlineExceeded):
+            service.get_topic('topic1', deadline=deadline)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_rate_limit_beyond_deadline(self, new_service):
+        """
+        A request the rate limit would delay past the deadline fails immediately.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', json={'name': 'topic1'})
+        service = new_service()
+        service.enable_rate_limiting(1.0, burst=1)
+
+        service.get_topic('topic1', deadline=Deadline(0.5))
+        for _ in range(10):
+            with pytest.raises(DeadlineExceeded):
+                service.get_topic('topic1', deadline=Deadline(0.5))
+        assert len(responses.calls) == 1
+        # The rejected requests gave their tokens back.
+        assert service.rate_limiter.reserve() <= 1.0
+
+    @responses.activate
+    def test_pagination(self, new_service):
+        """
+        Every page of a listing is sent within the deadline of the listing.
+        """
+        url = _base_url + '/admin/topics'
+        responses.add(responses.GET, url, json=[{'name': 'topic1'}, {'name': 'topic2'}])
+        responses.add(responses.GET, url, json=[{'name': 'topic3'}])
+
+        topics = list_all_topics(new_service(timeout=30), per_page=2, max_workers=1, deadline=Deadline(5.0))
+        assert [topic.name for topic in topics] == ['topic1', 'topic2', 'topic3']
+        assert len(responses.calls) == 2
+        assert all(call.request.req_kwargs['timeout'] <= 5.0 for call in responses.calls)
+
+    def test_async_client(self):
+        """
+        The async clients cap the timeout too, and accept a timeout with a configured one.
+        """
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions['timeout']['read'])
+            return httpx.Response(200, json={'name': 'topic1'})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        service.set_http_config({'timeout': 30})
+
+        async def run():
+            async with service:
+                await service.get_topic('topic1', timeout=10)
+                await service.get_topic('topic1', deadline=Deadline(5.0))
+                expired = Deadline(0.0)
+                with pytest.raises(DeadlineExceeded):
+                    await service.get_topic('topic1', deadline=expired)
+
+        asyncio.run(run())
+        assert timeouts[0] == 30
+        assert 0 < timeouts[1] <= 5.0
+        assert len(timeouts) == 2
+
+
+class TestBulkDeadline:
+    """
+    Test Class for the deadlines of the bulk helpers
+    """
+
+    def test_expired_deadline(self, clock):
+        """
+        The calls not started once the deadline has expired fail without being called.
+        """
+        deadline = Deadline(1.0, clock=clock)
+        calls = []
+
+        def call():
+            calls.append(None)
+            clock.now = 1.0
+
+        results = run_bulk([('a', 'done', call), ('b', 'done', call)], max_workers=1, deadline=deadline)
+        assert [result.status for result in results] == ['done', FAILED]
+        assert isinstance(results[1].error, DeadlineExceeded)
+        assert len(calls) == 1
+
+    def test_rate_limit_beyond_deadline(self):
+        """
+        The calls the rate limit would start after the deadline fail immediately.
+        """
+        calls = []
+        results = run_bulk(
+            [(name, 'done', lambda: calls.append(None)) for name in 'abc'],
+            max_workers=1,
+            rate_limit=1.0,
+            deadline=Deadline(0.5),
+        )
+        assert [result.status for result in results] == ['done', FAILED, FAILED]
+        assert len(calls) == 1
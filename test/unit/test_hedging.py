@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request hedging
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.hedging import HedgingPolicy
+
+_base_url = 'https://fake'
+
+
+class SlowFirst:
+    """
+    A call that is slow the first time it is made and fast afterwards.
+    """
+
+    def __init__(self, slow=0.5, error=None):
+        self.slow = slow
+        self.error = error
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.slow)
+            return 'primary'
+        if self.error is not None:
+            raise self.error
+        return 'hedge'
+
+
+class TestHedgingPolicy:
+    """
+    Test Class for HedgingPolicy
+    """
+
+    def teardown_method(self):
+        """
+        Stop the thread pools of the policies created by the test.
+        """
+        for policy in getattr(self, 'policies', []):
+            policy.shutdown()
+
+    def new_policy(self, *args, **kwargs):
+        """
+        Return a policy whose thread pool is stopped after the test.
+        """
+        policy = HedgingPolicy(*args, **kwargs)
+        self.policies = getattr(self, 'policies', []) + [policy]
+        return policy
+
+    def test_observed_delay(self):
+        """
+        The delay is the percentile of the latency of the operation, once enough
+        latencies are observed.
+        """
+        policy = self.new_policy(min_samples=10)
+        for i in range(9):
+            policy.record('get_topic', (i + 1) / 100)
+        assert policy.hedge_delay('get_topic') is None
+        for i in range(9, 100):
+            policy.record('get_topic', (i + 1) / 100)
+        assert policy.hedge_delay('get_topic') == pytest.approx(0.95, abs=0.01)
+        assert policy.hedge_delay('get_latest_schema') is None
+
+    def test_observed_delay_is_cached(self):
+        """
+        The observed delay is only recomputed every refresh_samples latencies.
+        """
+        policy = self.new_policy(min_samples=10, refresh_samples=50)
+        for _ in range(10):
+            policy.record('get_topic', 0.01)
+        assert policy.hedge_delay('get_topic') == pytest.approx(0.01)
+        for _ in range(49):
+            policy.record('get_topic', 1.0)
+        assert policy.hedge_delay('get_topic') == pytest.approx(0.01)
+        policy.record('get_topic', 1.0)
+        assert policy.hedge_delay('get_topic') == pytest.approx(1.0)
+
+    def test_fixed_delay(self):
+        """
+        A fixed delay applies from the first request.
+        """
+        assert self.new_policy(0.2).hedge_delay('get_topic') == 0.2
+
+    def test_applies_to_get_operations(self):
+        """
+        Only GET requests, of the listed operations if any, are hedged.
+        """
+        policy = self.new_policy()
+        assert policy.applies_to('GET', 'get_topic')
+        assert not policy.applies_to('POST', 'create_topic')
+        policy = self.new_policy(operations=['get_latest_schema'])
+        assert policy.applies_to('GET', 'get_latest_schema')
+        assert not policy.applies_to('GET', 'get_topic')
+
+    def test_slow_request_is_hedged(self):
+        """
+        A request slower than the delay is duplicated and the first result is used.
+        """
+        policy = self.new_policy(0.01, max_extra_load=1)
+        started = time.monotonic()
+
+        assert policy.call(SlowFirst(), 'get_topic') == 'hedge'
+
+        assert time.monotonic() - started < 0.4
+        assert (policy.requests, policy.hedges, policy.hedge_wins) == (1, 1, 1)
+
+    def test_fast_request_is_not_hedged(self):
+        """
+        A request completing within the delay is sent once.
+        """
+        policy = self.new_policy(1.0)
+        call = SlowFirst(slow=0)
+        assert policy.call(call, 'get_topic') == 'primary'
+        assert call.calls == 1
+        assert policy.hedges == 0
+
+    def test_queued_request_is_not_hedged(self):
+        """
+        The delay runs from the time the request leaves the queue of the thread pool.
+        """
+        policy = self.new_policy(0.05, max_extra_load=1, max_workers=1)
+        release = threading.Event()
+        busy = policy.get_executor().submit(release.wait)
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        try:
+            call = SlowFirst(slow=0)
+            assert policy.call(call, 'get_topic') == 'primary'
+        finally:
+            timer.cancel()
+            release.set()
+        busy.result()
+        assert call.calls == 1
+        assert policy.hedges == 0
+
+    def test_extra_load_is_capped(self):
+        """
+        No more duplicates than max_extra_load times the requests are sent.
+        """
+        policy = self.new_policy(0.0, max_extra_load=0.5)
+        for _ in range(10):
+            policy.call(SlowFirst(slow=0.005), 'get_topic')
+        assert policy.requests == 10
+        assert policy.hedges == 5
+
+    def test_failed_hedge(self):
+        """
+        A failed duplicate does not replace a successful request.
+        """
+        policy = self.new_policy(0.01, max_extra_load=1)
+        assert policy.call(SlowFirst(slow=0.05, error=ApiException(500)), 'get_topic') == 'primary'
+        assert policy.hedge_wins == 0
+
+    def test_async_loser_is_cancelled(self):
+        """
+        The async requests that lose the race are cancelled.
+        """
+        policy = self.new_policy(0.01, max_extra_load=1)
+        cancelled = []
+        calls = []
+
+        async def fn():
+            calls.append(None)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(None)
+                    raise
+            return len(calls)
+
+        async def run():
+            result = await policy.call_async(fn, 'get_topic')
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == 2
+        assert cancelled
+        assert policy.hedge_wins == 1
+
+    def test_invalid_arguments(self):
+        """
+        The delay, percentile, extra load and samples are validated.
+        """
+        with pytest.raises(ValueError):
+            HedgingPolicy(-1)
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_extra_load=-1)
+        with pytest.raises(ValueError):
+            HedgingPolicy(window=10, min_samples=20)
+        with pytest.raises(ValueError):
+            HedgingPolicy(refresh_samples=0)
+
+
+class TestServiceHedging:
+    """
+    Test Class for the hedging of the service clients
+    """
+
+    @responses.activate
+    def test_get_topic_is_hedged(self):
+        """
+        A slow get_topic is answered by its duplicate.
+        """
+        calls = []
+
+        def callback(request):
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return (200, {}, '{"name": "slow"}')
+            return (200, {}, '{"name": "topic1"}')
+
+        responses.add_callback(
+            responses.GET, _base_url + '/admin/topics/topic1', callback=callback, content_type='application/json'
+        )
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        policy = HedgingPolicy(0.02, max_extra_load=1, operations=['get_topic'])
+        service.enable_hedging(policy)
+
+        try:
+            assert service.get_topic('topic1').get_result() == {'name': 'topic1'}
+            assert policy.hedge_wins == 1
+        finally:
+            policy.shutdown()
+        service.disable_hedging()
+        assert service.hedging_policy is None
+
+    @responses.activate
+    def test_mutations_are_not_hedged(self):
+        """
+        Requests other than GET are sent once.
+        """
+        responses.add(responses.DELETE, _base_url + '/admin/topics/topic1', status=202)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_hedging(HedgingPolicy(0.0, max_extra_load=1))
+
+        service.delete_topic('topic1')
+
+        assert len(responses.calls) == 1
+        assert service.hedging_policy.requests == 0
+
+    def test_async_client(self):
+        """
+        The async clients hedge their GET requests.
+        """
+        calls = []
+
+        async def handler(request):
+            calls.append(None)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={'name': 'topic1'})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        service.enable_hedging(HedgingPolicy(0.01, max_extra_load=1))
+
+        async def run():
+            async with service:
+                return await service.get_topic('topic1')
+
+        started = time.monotonic()
+        assert asyncio.run(run()).get_result() == {'name': 'topic1'}
+        assert time.monotonic() - started < 2
+        assert len(calls) == 2
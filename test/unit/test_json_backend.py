@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the JSON backends
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.json_backend import JSONBackend, available_json_backends, get_json_backend
+
+_base_url = 'https://fake'
+
+
+class RecordingBackend(JSONBackend):
+    """
+    A standard library backend recording the documents it encodes and decodes.
+    """
+
+    def __init__(self):
+        super().__init__('recording')
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestJSONBackend:
+    """
+    Test Class for JSONBackend
+    """
+
+    def test_default_backend(self):
+        """
+        The fastest library installed is used by default.
+        """
+        assert available_json_backends()[-1] == 'json'
+        assert get_json_backend().name == available_json_backends()[0]
+        assert get_json_backend() is get_json_backend()
+
+    @pytest.mark.parametrize('name', available_json_backends())
+    def test_round_trip(self, name):
+        """
+        Every backend encodes to UTF-8 and decodes bytes and strings.
+        """
+        backend = get_json_backend(name)
+        obj = {'name': 'topic/ü', 'partitions': 3, 'configs': [{'name': 'cleanup.policy', 'value': None}]}
+        data = backend.dumps(obj)
+        assert isinstance(data, bytes)
+        assert json.loads(data.decode('utf-8')) == obj
+        assert backend.loads(data) == obj
+        assert backend.loads(data.decode('utf-8')) == obj
+
+    @pytest.mark.parametrize('name', available_json_backends())
+    def test_standard_library_fallback(self, name):
+        """
+        Documents a faster library rejects are handled by the standard library.
+        """
+        backend = get_json_backend(name)
+        big = 2**70
+        assert backend.loads(backend.dumps({'offset': big})) == {'offset': big}
+        assert backend.loads(b'{"value": "a\x01b"}') == {'value': 'a\x01b'}
+        with pytest.raises(json.JSONDecodeError):
+            backend.loads(b'{"value": ')
+
+    def test_invalid_name(self):
+        """
+        Only the supported libraries can be requested.
+        """
+        with pytest.raises(ValueError):
+            get_json_backend('simplejson')
+
+
+class TestServiceJSONBackend:
+    """
+    Test Class for the JSON backend of the service clients
+    """
+
+    @responses.activate
+    def test_requests_and_responses(self):
+        """
+        Request bodies are encoded and response bodies decoded with the backend.
+        """
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', json={'name': 'topic1'})
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        backend = RecordingBackend()
+        service.set_json_backend(backend)
+
+        service.create_topic(name='topic1', partitions=1)
+        assert json.loads(responses.calls[0].request.body) == {'name': 'topic1', 'partitions': 1}
+        assert backend.dumped == [{'name': 'topic1', 'partitions': 1}]
+
+        assert service.get_topic('topic1').get_result() == {'name': 'topic1'}
+        assert backend.loaded == [b'{"name": "topic1"}']
+
+    @responses.activate
+    def test_invalid_response(self):
+        """
+        A response that is not valid JSON still raises an ApiException.
+        """
+        responses.add(
+            responses.GET, _base_url + '/admin/topics/topic1', body='{"name": ', content_type='application/json'
+        )
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+
+        with pytest.raises(ApiException) as err:
+            service.get_topic('topic1')
+        assert err.value.message == 'Error processing the HTTP response'
+
+    def test_backend_by_name(self):
+        """
+        A library can be chosen by name, and survives the reconfiguration of the adapter.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        assert service.json_backend is get_json_backend()
+        service.set_json_backend('json')
+        service.enable_retries()
+        assert service.json_backend.name == 'json'
+        assert service.http_adapter.json_backend is service.json_backend
+
+    def test_async_client(self):
+        """
+        The async clients use the backend too.
+        """
+
+        def handler(request):
+            return httpx.Response(200, json={'name': json.loads(request.content)['name']})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        backend = RecordingBackend()
+        service.set_json_backend(backend)
+
+        async def run():
+            async with service:
+                return await service.create_topic(name='topic1')
+
+        assert asyncio.run(run()).get_result() == {'name': 'topic1'}
+        assert backend.dumped == [{'name': 'topic1'}]
+        assert len(backend.loaded) == 1
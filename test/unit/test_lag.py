@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lag module
+"""
+
+import copy
+import threading
+import time
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1, GroupDetail
+from eventstreams_sdk.lag import (
+    ConsumerGroupSnapshot,
+    LagChange,
+    LagTable,
+    LagWatcher,
+    percentile,
+    snapshot_consumer_groups,
+)
+from eventstreams_sdk.lazy_models import LazyGroupDetail
+
+_base_url = 'https://fake'
+
+
+def offset(topic, partition, current_offset, end_offset):
+    """
+    Return the json of a TopicPartitionOffset.
+    """
+    return {'topic': topic, 'partition': partition, 'current_offset': current_offset, 'end_offset': end_offset}
+
+
+_group1 = {
+    'group_id': 'group1',
+    'state': 'Stable',
+    'offsets': [
+        offset('orders', 0, 100, 110),
+        offset('orders', 1, 100, 130),
+        offset('payments', 0, 50, 50),
+    ],
+}
+
+_group2 = {
+    'group_id': 'group2',
+    'state': 'Empty',
+    'offsets': [
+        offset('orders', 0, 10, 110),
+        offset('orders', 1, 140, 130),
+    ],
+}
+
+
+class TestPercentile:
+    """
+    Test Class for percentile
+    """
+
+    def test_interpolation(self):
+        """
+        percentile() interpolates linearly between ranks.
+        """
+        values = [0, 10, 20, 30, 40]
+        assert percentile(values, 0) == 0
+        assert percentile(values, 50) == 20
+        assert percentile(values, 100) == 40
+        assert percentile(values, 90) == pytest.approx(36)
+        assert percentile([7], 99) == 7
+
+    def test_invalid(self):
+        """
+        percentile() rejects empty values and out of range percentiles.
+        """
+        with pytest.raises(ValueError):
+            percentile([], 50)
+        with pytest.raises(ValueError):
+            percentile([1], 101)
+
+
+class TestLagTable:
+    """
+    Test Class for LagTable
+    """
+
+    def setup_method(self):
+        """
+        Load the test groups.
+        """
+        self.table = LagTable.from_groups([_group1, _group2])
+
+    def test_rows(self):
+        """
+        Every partition is a row, and negative lags are reported as 0.
+        """
+        assert list(self.table.rows()) == [
+            ('group1', 'orders', 0, 100, 110, 10),
+            ('group1', 'orders', 1, 100, 130, 30),
+            ('group1', 'payments', 0, 50, 50, 0),
+            ('group2', 'orders', 0, 10, 110, 100),
+            ('group2', 'orders', 1, 140, 130, 0),
+        ]
+        assert self.table.group_ids == ['group1', 'group2']
+        assert self.table.states == ['Stable', 'Empty']
+        assert self.table.topics == ['orders', 'payments']
+        assert list(self.table.topic_index) == [0, 0, 1, 0, 0]
+
+    def test_aggregates(self):
+        """
+        sum(), max() and percentile() aggregate the whole table.
+        """
+        assert len(self.table) == 5
+        assert self.table.sum() == 140
+        assert self.table.max() == 100
+        assert self.table.percentile(50) == 10
+
+    def test_aggregates_by(self):
+        """
+        Aggregates can be computed per group, topic or group and topic.
+        """
+        assert self.table.sum(by='group') == {'group1': 40, 'group2': 100}
+        assert self.table.max(by='topic') == {'orders': 100, 'payments': 0}
+        assert self.table.percentile(100, by='group_topic') == {
+            ('group1', 'orders'): 30,
+            ('group1', 'payments'): 0,
+            ('group2', 'orders'): 100,
+        }
+        with pytest.raises(ValueError):
+            self.table.sum(by='partition')
+
+    def test_input_types(self):
+        """
+        Groups can be given as json, responses, models or lazy views.
+        """
+        groups = [
+            DetailedResponse(response=_group1, status_code=200),
+            GroupDetail.from_dict(_group1),
+            LazyGroupDetail.from_dict(_group1),
+        ]
+        table = LagTable.from_groups(groups)
+        assert table.sum(by='group') == {'group1': 120}
+        assert len(table.group_ids) == 1
+
+    def test_missing_offsets(self):
+        """
+        Partitions without a committed offset and groups without offsets are skipped.
+        """
+        table = LagTable()
+        table.add_group({'group_id': 'group3', 'offsets': [{'topic': 'orders', 'partition': 0, 'end_offset': 5}]})
+        table.add_group({'group_id': 'group4'})
+        assert len(table) == 0
+        assert table.sum() == 0
+        assert table.max() == 0
+        assert table.sum(by='group') == {}
+        with pytest.raises(ValueError):
+            table.percentile(50)
+
+    def test_missing_partition(self):
+        """
+        An offset without a partition, which is optional, is a row of partition -1.
+        """
+        table = LagTable()
+        table.add_group({'group_id': 'group3', 'offsets': [offset('orders', None, 5, 8)]})
+        table.add_group({'group_id': 'group4', 'offsets': [{'topic': 'orders', 'current_offset': 1, 'end_offset': 2}]})
+        assert list(table.rows()) == [('group3', 'orders', -1, 5, 8, 3), ('group4', 'orders', -1, 1, 2, 1)]
+
+    def test_many_partitions(self):
+        """
+        Tables of many groups and partitions aggregate correctly.
+        """
+        groups = [
+            {'group_id': 'group%d' % g, 'offsets': [offset('topic%d' % (p % 10), p, 0, p) for p in range(1000)]}
+            for g in range(20)
+        ]
+        table = LagTable.from_groups(groups)
+        assert len(table) == 20000
+        assert table.sum() == 20 * sum(range(1000))
+        assert table.max() == 999
+        assert table.percentile(50) == pytest.approx(499.5)
+        assert len(table.sum(by='group_topic')) == 200
+
+
+class FakeService:
+    """
+    Serve get_consumer_group from a dict of group json, counting calls in flight.
+    """
+
+    def __init__(self, groups):
+        self.groups = groups
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_consumer_group(self, group_id):
+        """
+        Return the current json of the group, or raise ApiException 404.
+        """
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.001)
+            if group_id not in self.groups:
+                raise ApiException(404, message='group not found')
+            return DetailedResponse(response=copy.deepcopy(self.groups[group_id]), status_code=200)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def list_consumer_groups(self, group_filter=None, per_page=None, page=None):
+        """
+        Return one page of the group IDs, or of the IDs starting with group_filter.
+        """
+        group_ids = [group_id for group_id in self.groups if not group_filter or group_id.startswith(group_filter)]
+        return DetailedResponse(response=group_ids[(page - 1) * per_page : page * per_page], status_code=200)
+
+
+class TestSnapshotConsumerGroups:
+    """
+    Test Class for snapshot_consumer_groups
+    """
+
+    def test_snapshot(self):
+        """
+        Every listed group is loaded, in listing order.
+        """
+        groups = {'group%03d' % i: dict(_group1, group_id='group%03d' % i) for i in range(50)}
+        service = FakeService(groups)
+
+        snapshot = snapshot_consumer_groups(service, per_page=7, max_workers=4)
+
+        assert isinstance(snapshot, ConsumerGroupSnapshot)
+        assert snapshot.group_ids == sorted(groups)
+        assert snapshot.states == ['Stable'] * 50
+        assert len(snapshot) == 3 * 50
+        assert snapshot.sum() == 40 * 50
+        assert not snapshot.errors
+        assert 1 < service.max_in_flight <= 4
+
+    def test_group_filter(self):
+        """
+        The group filter is applied to the listing.
+        """
+        service = FakeService({'group1': _group1, 'group2': _group2, 'other': _group1})
+
+        snapshot = snapshot_consumer_groups(service, group_filter='group', per_page=1)
+
+        assert snapshot.group_ids == ['group1', 'group2']
+
+    def test_errors(self):
+        """
+        Groups that cannot be fetched are reported in errors.
+        """
+
+        class DeletingService(FakeService):
+            def get_consumer_group(self, group_id):
+                if group_id == 'group1':
+                    raise ApiException(404, message='group not found')
+                return super().get_consumer_group(group_id)
+
+        snapshot = snapshot_consumer_groups(DeletingService({'group1': _group1, 'group2': _group2}))
+
+        assert snapshot.group_ids == ['group2']
+        assert snapshot.errors['group1'].status_code == 404
+
+    @responses.activate
+    def test_service(self):
+        """
+        snapshot_consumer_groups() lists and gets the groups through the client.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        responses.add(responses.GET, _base_url + '/admin/consumergroups', json=['group1', 'group2'])
+        responses.add(responses.GET, _base_url + '/admin/consumergroups/group1', json=_group1)
+        responses.add(responses.GET, _base_url + '/admin/consumergroups/group2', json=_group2)
+
+        snapshot = snapshot_consumer_groups(service, headers={'X-Test': 'snapshot'})
+
+        assert snapshot.sum(by='group') == {'group1': 40, 'group2': 100}
+        assert all(call.request.headers['X-Test'] == 'snapshot' for call in responses.calls)
+
+    def test_invalid_max_workers(self):
+        """
+        max_workers must be positive.
+        """
+        with pytest.raises(ValueError):
+            snapshot_consumer_groups(FakeService({}), max_workers=0)
+
+
+class TestLagWatcher:
+    """
+    Test Class for LagWatcher
+    """
+
+    def setup_method(self):
+        """
+        Create a watcher of the test groups with a manual clock.
+        """
+        self.service = FakeService({'group1': copy.deepcopy(_group1), 'group2': copy.deepcopy(_group2)})
+        self.now = 0.0
+        self.watcher = LagWatcher(self.service, ['group1', 'group2'], clock=lambda: self.now)
+
+    def teardown_method(self):
+        """
+        Release the workers of the watcher.
+        """
+        self.watcher.stop()
+
+    def test_first_poll_reports_everything(self):
+        """
+        Every partition is reported, without rates, by the first poll.
+        """
+        changes = self.watcher.poll()
+
+        assert [(c.group_id, c.topic, c.partition, c.lag) for c in changes] == [
+            ('group1', 'orders', 0, 10),
+            ('group1', 'orders', 1, 30),
+            ('group1', 'payments', 0, 0),
+            ('group2', 'orders', 0, 100),
+            ('group2', 'orders', 1, 0),
+        ]
+        assert all(c.consumption_rate is None and c.production_rate is None for c in changes)
+
+    def test_only_changes_are_reported(self):
+        """
+        Later polls report the partitions that moved, with their rates.
+        """
+        self.watcher.poll()
+        assert not self.watcher.poll()
+
+        self.service.groups['group1']['offsets'][1] = offset('orders', 1, 120, 140)
+        self.now = 10.0
+        changes = self.watcher.poll()
+
+        assert changes == [LagChange('group1', 'orders', 1, 120, 140, 20, 2.0, 1.0)]
+
+    def test_errors_keep_the_previous_offsets(self):
+        """
+        A group that fails to be fetched is reported in errors and keeps its offsets.
+        """
+        self.watcher.poll()
+        group2 = self.service.groups.pop('group2')
+
+        assert not self.watcher.poll()
+        assert list(self.watcher.errors) == ['group2']
+        assert self.watcher.errors['group2'].status_code == 404
+
+        self.service.groups['group2'] = group2
+        assert not self.watcher.poll()
+        assert not self.watcher.errors
+
+    def test_watch_unwatch(self):
+        """
+        Groups can be added and removed between polls.
+        """
+        self.watcher.poll()
+        self.watcher.unwatch('group1')
+        self.watcher.watch('group1')
+
+        changes = self.watcher.poll()
+
+        assert {c.group_id for c in changes} == {'group1'}
+        assert self.watcher.group_ids() == ['group2', 'group1']
+
+    def test_bounded_concurrency(self):
+        """
+        At most max_workers groups are fetched at once.
+        """
+        groups = {'group%d' % i: copy.deepcopy(_group1) for i in range(40)}
+        service = FakeService(groups)
+        with LagWatcher(service, groups, max_workers=4) as watcher:
+            changes = watcher.poll()
+
+        assert len(changes) == 3 * 40
+        assert 1 < service.max_in_flight <= 4
+
+    def test_background_polling(self):
+        """
+        The background thread passes the changes of each poll to on_change.
+        """
+        received = []
+        changed = threading.Event()
+
+        def on_change(changes):
+            received.append(changes)
+            changed.set()
+
+        watcher = LagWatcher(self.service, ['group1'], interval=0.01, on_change=on_change)
+        watcher.start()
+        try:
+            assert changed.wait(5)
+            with pytest.raises(RuntimeError):
+                watcher.start()
+        finally:
+            watcher.stop()
+
+        assert len(received) == 1
+        assert len(received[0]) == 3
+
+    def test_slow_poll_is_not_caught_up(self):
+        """
+        A poll slower than the interval delays the next poll instead of running missed
+        polls back to back.
+        """
+        waits = []
+
+        class Stopped:
+            """
+            Record the waits between polls, stopping after the second one.
+            """
+
+            def wait(self, timeout):
+                waits.append(timeout)
+                return len(waits) == 2
+
+        def poll():
+            if not waits:
+                self.now += 35
+
+        watcher = LagWatcher(self.service, ['group1'], interval=10, clock=lambda: self.now)
+        watcher.poll = poll
+        watcher._stopped = Stopped()  # pylint: disable=protected-access
+        watcher._run()  # pylint: disable=protected-access
+
+        assert waits == [0, 10]
+
+    def test_invalid_arguments(self):
+        """
+        The constructor rejects invalid intervals and worker counts.
+        """
+        with pytest.raises(ValueError):
+            LagWatcher(self.service, interval=0)
+        with pytest.raises(ValueError):
+            LagWatcher(self.service, max_workers=0)
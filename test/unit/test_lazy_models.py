@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy model views
+"""
+
+import tracemalloc
+
+import pytest
+
+from eventstreams_sdk.adminrest_v1 import (
+    GroupDetail,
+    Member,
+    TopicConfigs,
+    TopicDetail,
+    TopicDetailReplicaAssignmentsItem,
+    TopicPartitionOffset,
+)
+from eventstreams_sdk.lazy_models import LazyGroupDetail, LazyTopicDetail
+
+_topic_json = {
+    'name': 'topic1',
+    'partitions': 3,
+    'replicationFactor': 3,
+    'retentionMs': 86400000,
+    'cleanupPolicy': 'delete',
+    'configs': {'retention.bytes': 1073741824, 'segment.bytes': 536870912},
+    'replicaAssignments': [{'id': i, 'brokers': {'replicas': [0, 1, 2]}} for i in range(3)],
+}
+
+_group_json = {
+    'group_id': 'group1',
+    'state': 'Stable',
+    'members': [
+        {
+            'consumer_id': 'consumer1',
+            'client_id': 'client1',
+            'host': '/10.0.0.1',
+            'assignments': [{'topic': 'topic1', 'partition': i} for i in range(3)],
+        }
+    ],
+    'offsets': [{'topic': 'topic1', 'partition': i, 'current_offset': 10, 'end_offset': 15} for i in range(3)],
+}
+
+
+class TestLazyTopicDetail:
+    """
+    Test Class for LazyTopicDetail
+    """
+
+    def test_properties(self):
+        """
+        The view exposes the properties of TopicDetail.
+        """
+        view = LazyTopicDetail.from_dict(_topic_json)
+        model = TopicDetail.from_dict(_topic_json)
+
+        assert view.name == model.name
+        assert view.partitions == model.partitions
+        assert view.replication_factor == model.replication_factor
+        assert view.retention_ms == model.retention_ms
+        assert view.cleanup_policy == model.cleanup_policy
+        assert view.configs == model.configs
+        assert view.replica_assignments == model.replica_assignments
+
+    def test_nested_models_are_built_once(self):
+        """
+        Nested models are built on first access and then kept.
+        """
+        view = LazyTopicDetail.from_dict(_topic_json)
+
+        assert isinstance(view.configs, TopicConfigs)
+        assert view.configs is view.configs
+        assert all(isinstance(item, TopicDetailReplicaAssignmentsItem) for item in view.replica_assignments)
+        assert view.replica_assignments is view.replica_assignments
+
+    def test_missing_properties(self):
+        """
+        Properties missing from the json dictionary are None.
+        """
+        view = LazyTopicDetail.from_dict({'name': 'topic1'})
+        assert view.partitions is None
+        assert view.configs is None
+        assert view.replica_assignments is None
+
+    def test_serialization(self):
+        """
+        The view serializes like the model it stands for.
+        """
+        view = LazyTopicDetail.from_dict(_topic_json)
+
+        assert view.to_dict() == _topic_json
+        assert view.materialize() == TopicDetail.from_dict(_topic_json)
+        assert str(view) == str(TopicDetail.from_dict(_topic_json))
+        assert view == LazyTopicDetail._from_dict(view._to_dict())
+        assert view != LazyTopicDetail.from_dict({'name': 'topic2'})
+
+    def test_read_only(self):
+        """
+        Views cannot be modified.
+        """
+        view = LazyTopicDetail.from_dict(_topic_json)
+        with pytest.raises(AttributeError):
+            view.name = 'topic2'
+        with pytest.raises(AttributeError):
+            view.configs = None
+
+    def test_scan_allocates_less(self):
+        """
+        Holding many topics to read their names allocates far less through the views.
+        """
+        topics = [dict(_topic_json, name='topic%d' % i) for i in range(2000)]
+
+        def allocated(cls):
+            tracemalloc.start()
+            try:
+                objects = [cls.from_dict(topic) for topic in topics]
+                assert [topic.name for topic in objects] == [topic['name'] for topic in topics]
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return size
+
+        assert allocated(LazyTopicDetail) < 0.25 * allocated(TopicDetail)
+
+
+class TestLazyGroupDetail:
+    """
+    Test Class for LazyGroupDetail
+    """
+
+    def test_properties(self):
+        """
+        The view exposes the properties of GroupDetail.
+        """
+        view = LazyGroupDetail.from_dict(_group_json)
+
+        assert view.group_id == 'group1'
+        assert view.state == 'Stable'
+        assert all(isinstance(member, Member) for member in view.members)
+        assert all(isinstance(offset, TopicPartitionOffset) for offset in view.offsets)
+        assert view.offsets is view.offsets
+        assert view.materialize() == GroupDetail.from_dict(_group_json)
+        assert view.to_dict() == _group_json
+
+    def test_unread_properties_are_not_built(self):
+        """
+        Reading one nested property does not build the others.
+        """
+        view = LazyGroupDetail.from_dict(_group_json)
+        assert view.state == 'Stable'
+        assert len(view.offsets) == 3
+        with pytest.raises(AttributeError):
+            view._members  # pylint: disable=pointless-statement
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the pagination helpers
+"""
+
+import pytest
+import responses
+from responses import matchers
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1, TopicDetail
+from eventstreams_sdk.lazy_models import LazyTopicDetail
+from eventstreams_sdk.pagination import (
+    fetch_all_pages,
+    get_page_count,
+    iter_consumer_groups,
+    iter_pages,
+    iter_topics,
+    list_all_consumer_groups,
+    list_all_topics,
+)
+
+_service = AdminrestV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://fake'
+_service.set_service_url(_base_url)
+
+
+def add_topic_pages(total, per_page, headers=None):
+    """
+    Register mock list_topics pages serving `total` topics.
+    """
+    names = ['topic%d' % i for i in range(total)]
+    page_count = total // per_page + 1
+    for page in range(1, page_count + 1):
+        chunk = names[(page - 1) * per_page : page * per_page]
+        responses.add(
+            responses.GET,
+            _base_url + '/admin/topics',
+            json=[{'name': name, 'partitions': 1} for name in chunk],
+            headers=headers,
+            match=[matchers.query_param_matcher({'per_page': str(per_page), 'page': str(page)})],
+        )
+    return names
+
+
+class FakePages:
+    """
+    Serve DetailedResponse pages from a list of items, recording the requested pages.
+    """
+
+    def __init__(self, items, per_page, headers=None):
+        self.items = items
+        self.per_page = per_page
+        self.headers = headers
+        self.requested = []
+
+    def __call__(self, page):
+        self.requested.append(page)
+        chunk = self.items[(page - 1) * self.per_page : page * self.per_page]
+        return DetailedResponse(response=chunk, headers=self.headers, status_code=200)
+
+
+class TestIterPages:
+    """
+    Test Class for iter_pages
+    """
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    def test_stops_on_short_page(self, prefetch):
+        """
+        iter_pages() stops after the first page shorter than per_page.
+        """
+        pages = {1: [1, 2], 2: [3, 4], 3: [5]}
+        requested = []
+
+        def fetch(page):
+            requested.append(page)
+            return pages[page]
+
+        assert list(iter_pages(fetch, 2, prefetch=prefetch)) == [[1, 2], [3, 4], [5]]
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    def test_stops_on_empty_page(self, prefetch):
+        """
+        iter_pages() stops on an empty (or null) page.
+        """
+        pages = {1: [1, 2], 2: None}
+        assert list(iter_pages(pages.get, 2, prefetch=prefetch)) == [[1, 2], []]
+
+    def test_is_lazy(self):
+        """
+        iter_pages() only fetches a page when the previous one has been consumed.
+        """
+        requested = []
+
+        def fetch(page):
+            requested.append(page)
+            return [page, page]
+
+        pages = iter_pages(fetch, 2)
+        assert next(pages) == [1, 1]
+        assert next(pages) == [2, 2]
+        pages.close()
+        assert requested == [1, 2]
+
+    def test_invalid_per_page(self):
+        """
+        iter_pages() rejects a non-positive page size.
+        """
+        with pytest.raises(ValueError, match='per_page must be a positive integer'):
+            next(iter_pages(lambda page: [], 0))
+
+
+class TestIterTopics:
+    """
+    Test Class for iter_topics
+    """
+
+    @responses.activate
+    @pytest.mark.parametrize('prefetch', [False, True])
+    def test_iter_topics(self, prefetch):
+        """
+        iter_topics() walks every page and yields TopicDetail objects.
+        """
+        names = add_topic_pages(7, 3)
+
+        topics = list(iter_topics(_service, per_page=3, prefetch=prefetch))
+
+        assert all(isinstance(topic, TopicDetail) for topic in topics)
+        assert [topic.name for topic in topics] == names
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_iter_topics_filter(self):
+        """
+        iter_topics() forwards the topic filter.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/admin/topics',
+            json=[{'name': 'orders'}],
+            match=[matchers.query_param_matcher({'topic_filter': 'ord*', 'per_page': '100', 'page': '1'})],
+        )
+
+        assert [topic.name for topic in iter_topics(_service, topic_filter='ord*')] == ['orders']
+
+    @responses.activate
+    def test_iter_topics_lazy(self):
+        """
+        iter_topics(lazy=True) yields LazyTopicDetail views.
+        """
+        names = add_topic_pages(4, 3)
+
+        topics = list(iter_topics(_service, per_page=3, lazy=True))
+
+        assert all(isinstance(topic, LazyTopicDetail) for topic in topics)
+        assert [topic.name for topic in topics] == names
+
+
+class TestGetPageCount:
+    """
+    Test Class for get_page_count
+    """
+
+    def test_total_count_header(self):
+        """
+        get_page_count() rounds X-Total-Count up to whole pages.
+        """
+        response = DetailedResponse(headers={'X-Total-Count': '41'})
+        assert get_page_count(response, 20) == 3
+        assert get_page_count(response, 41) == 1
+
+    def test_link_header(self):
+        """
+        get_page_count() falls back to the last entry of the Link header.
+        """
+        link = (
+            '<http://kafka.admin.host/admin/consumergroups?page=2&per_page=20>; rel="next", '
+            '<http://kafka.admin.host/admin/consumergroups?page=1&per_page=20>; rel="first", '
+            '<http://kafka.admin.host/admin/consumergroups?page=5&per_page=20>; rel="last"'
+        )
+        assert get_page_count(DetailedResponse(headers={'Link': link}), 20) == 5
+
+    def test_unknown(self):
+        """
+        get_page_count() returns None without pagination headers.
+        """
+        assert get_page_count(DetailedResponse(headers={}), 20) is None
+        assert get_page_count(DetailedResponse(headers={'X-Total-Count': 'many'}), 20) is None
+
+
+class TestFetchAllPages:
+    """
+    Test Class for fetch_all_pages
+    """
+
+    def test_concurrent_pages_in_order(self):
+        """
+        fetch_all_pages() requests the discovered pages and merges them in order.
+        """
+        items = list(range(95))
+        fetch = FakePages(items, 10, headers={'X-Total-Count': '95'})
+
+        assert fetch_all_pages(fetch, 10, max_workers=4) == items
+        assert sorted(fetch.requested) == list(range(1, 11))
+
+    def test_single_page(self):
+        """
+        fetch_all_pages() stops after a short first page.
+        """
+        fetch = FakePages([1, 2], 10, headers={'X-Total-Count': '2'})
+
+        assert fetch_all_pages(fetch, 10) == [1, 2]
+        assert fetch.requested == [1]
+
+    def test_without_page_count(self):
+        """
+        fetch_all_pages() falls back to sequential paging without pagination headers.
+        """
+        items = list(range(25))
+        fetch = FakePages(items, 10)
+
+        assert fetch_all_pages(fetch, 10) == items
+        assert fetch.requested == [1, 2, 3]
+
+    def test_listing_grew(self):
+        """
+        fetch_all_pages() follows pages past a stale page count.
+        """
+        items = list(range(35))
+        fetch = FakePages(items, 10, headers={'X-Total-Count': '20'})
+
+        assert fetch_all_pages(fetch, 10) == items
+        assert sorted(fetch.requested) == [1, 2, 3, 4]
+
+    def test_invalid_max_workers(self):
+        """
+        fetch_all_pages() rejects a non-positive pool size.
+        """
+        with pytest.raises(ValueError, match='max_workers must be a positive integer'):
+            fetch_all_pages(FakePages([], 10), 10, max_workers=0)
+
+
+class TestListAllTopics:
+    """
+    Test Class for list_all_topics
+    """
+
+    @responses.activate
+    def test_list_all_topics(self):
+        """
+        list_all_topics() returns every topic as TopicDetail objects.
+        """
+        names = add_topic_pages(25, 10, headers={'X-Total-Count': '25'})
+
+        topics = list_all_topics(_service, per_page=10, max_workers=2)
+
+        assert [topic.name for topic in topics] == names
+        assert all(isinstance(topic, TopicDetail) for topic in topics)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_list_all_topics_lazy(self):
+        """
+        list_all_topics(lazy=True) returns LazyTopicDetail views.
+        """
+        names = add_topic_pages(5, 10)
+
+        topics = list_all_topics(_service, per_page=10, lazy=True)
+
+        assert [topic.name for topic in topics] == names
+        assert all(isinstance(topic, LazyTopicDetail) for topic in topics)
+
+
+class TestConsumerGroups:
+    """
+    Test Class for iter_consumer_groups and list_all_consumer_groups
+    """
+
+    def add_group_pages(self, total, per_page):
+        """
+        Register mock list_consumer_groups pages serving `total` group IDs.
+        """
+        group_ids = ['group%d' % i for i in range(total)]
+        for page in range(1, total // per_page + 2):
+            responses.add(
+                responses.GET,
+                _base_url + '/admin/consumergroups',
+                json=group_ids[(page - 1) * per_page : page * per_page],
+                headers={'X-Total-Count': str(total)},
+                match=[matchers.query_param_matcher({'per_page': str(per_page), 'page': str(page)})],
+            )
+        return group_ids
+
+    @responses.activate
+    def test_iter_consumer_groups(self):
+        """
+        iter_consumer_groups() yields every group ID.
+        """
+        group_ids = self.add_group_pages(5, 2)
+
+        assert list(iter_consumer_groups(_service, per_page=2)) == group_ids
+
+    @responses.activate
+    def test_list_all_consumer_groups(self):
+        """
+        list_all_consumer_groups() returns every group ID in order.
+        """
+        group_ids = self.add_group_pages(9, 2)
+
+        assert list_all_consumer_groups(_service, per_page=2, max_workers=3) == group_ids
+        assert len(responses.calls) == 5
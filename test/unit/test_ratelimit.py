@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the rate limiting
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.ratelimit import RateLimiter, TokenBucket
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+
+_base_url = 'https://fake'
+
+
+class FakeTime:
+    """
+    A manually advanced clock whose sleep advances it.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        """
+        Return the current time.
+        """
+        return self.now
+
+    def sleep(self, seconds):
+        """
+        Record the sleep and advance the clock.
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """
+    Test Class for TokenBucket
+    """
+
+    def setup_method(self):
+        """
+        Create a fake time source.
+        """
+        self.time = FakeTime()
+
+    def new_bucket(self, rate, capacity=None):
+        """
+        Return a bucket driven by the fake time source.
+        """
+        return TokenBucket(rate, capacity, clock=self.time.clock, sleep=self.time.sleep)
+
+    def test_burst_then_pacing(self):
+        """
+        A full bucket allows a burst of capacity, then paces callers at rate.
+        """
+        bucket = self.new_bucket(10, capacity=5)
+        for _ in range(5):
+            bucket.acquire()
+        assert not self.time.sleeps
+
+        bucket.acquire()
+        bucket.acquire()
+        assert self.time.sleeps == [pytest.approx(0.1), pytest.approx(0.1)]
+        assert bucket.waits == 2
+
+    def test_refill(self):
+        """
+        Tokens are added at rate, up to capacity.
+        """
+        bucket = self.new_bucket(2, capacity=2)
+        assert bucket.try_acquire(2)
+        assert not bucket.try_acquire()
+        self.time.now += 0.5
+        assert bucket.try_acquire()
+        self.time.now += 100
+        assert bucket.try_acquire(2)
+        assert not bucket.try_acquire()
+
+    def test_timeout(self):
+        """
+        acquire() gives up without taking tokens when the wait would exceed timeout.
+        """
+        bucket = self.new_bucket(1)
+        assert bucket.acquire()
+        assert not bucket.acquire(timeout=0.5)
+        assert not self.time.sleeps
+        assert bucket.acquire(timeout=1)
+        assert self.time.sleeps == [pytest.approx(1)]
+
+    def test_reserve(self):
+        """
+        reserve() takes tokens into debt and returns the wait instead of sleeping.
+        """
+        bucket = self.new_bucket(4, capacity=1)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.25)
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert not self.time.sleeps
+        assert bucket.waits == 2
+
+    def test_invalid_arguments(self):
+        """
+        The rate, the capacity and the tokens acquired are validated.
+        """
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, capacity=0.5)
+        with pytest.raises(ValueError):
+            self.new_bucket(1).acquire(2)
+        assert TokenBucket(0.5).capacity == 1
+
+
+class RecordingLimiter(RateLimiter):
+    """
+    A rate limiter recording the operations it is asked for.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.operations = []
+
+    def reserve(self, operation_id=None, timeout=None):
+        self.operations.append(operation_id)
+        return super().reserve(operation_id, timeout)
+
+
+class TestRateLimiter:
+    """
+    Test Class for RateLimiter
+    """
+
+    def setup_method(self):
+        """
+        Create a fake time source.
+        """
+        self.time = FakeTime()
+
+    def new_limiter(self, rate=None, **kwargs):
+        """
+        Return a limiter driven by the fake time source.
+        """
+        return RateLimiter(rate, clock=self.time.clock, sleep=self.time.sleep, **kwargs)
+
+    def test_operation_rates(self):
+        """
+        Operations with their own rate are paced independently of each other.
+        """
+        limiter = self.new_limiter(operation_rates={'create_topic': 2, 'get_topic': 100})
+        limiter.acquire('create_topic')
+        limiter.acquire('create_topic')
+        for _ in range(100):
+            limiter.acquire('get_topic')
+        limiter.acquire('list_topics')
+        assert not self.time.sleeps
+
+        limiter.acquire('create_topic')
+        assert self.time.sleeps == [pytest.approx(0.5)]
+
+    def test_global_rate(self):
+        """
+        The global rate applies to every operation on top of its own rate.
+        """
+        limiter = self.new_limiter(10, burst=1, operation_rates={'create_topic': 1})
+        limiter.acquire('create_topic')
+        limiter.acquire('get_topic')
+        assert self.time.sleeps == [pytest.approx(0.1)]
+        limiter.acquire('create_topic')
+        assert self.time.sleeps[1] == pytest.approx(0.9)
+
+    def test_reserve_within_timeout(self):
+        """
+        A request that cannot be sent within the timeout takes no token from any bucket.
+        """
+        limiter = self.new_limiter(10, burst=1, operation_rates={'create_topic': 1})
+        assert limiter.reserve('create_topic', timeout=0.5) == 0.0
+        for _ in range(10):
+            assert limiter.reserve('create_topic', timeout=0.5) is None
+        assert limiter.reserve('get_topic', timeout=0.5) == pytest.approx(0.1)
+        self.time.now = 1.0
+        assert limiter.reserve('create_topic', timeout=0.5) == 0.0
+
+    def test_unlimited(self):
+        """
+        A limiter without rates never waits.
+        """
+        limiter = self.new_limiter()
+        for _ in range(1000):
+            limiter.acquire('get_topic')
+        assert not self.time.sleeps
+
+
+class TestServiceRateLimiting:
+    """
+    Test Class for the rate limiting of the service clients
+    """
+
+    @responses.activate
+    def test_requests_take_tokens_of_their_operation(self):
+        """
+        Each request takes a token for the operation it is sent for.
+        """
+        responses.add(responses.GET, _base_url + '/admin/topics/topic1', json={'name': 'topic1'})
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_rate_limiting(operation_rates={'create_topic': 5})
+        assert service.rate_limiter.operation_buckets['create_topic'].rate == 5
+        service.rate_limiter = RecordingLimiter(operation_rates={'create_topic': 5})
+
+        service.get_topic('topic1')
+        service.create_topic(name='topic2')
+
+        assert service.rate_limiter.operations == ['get_topic', 'create_topic']
+        service.disable_rate_limiting()
+        service.get_topic('topic1')
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_schema_registry_operations(self):
+        """
+        The schema registry client rate limits its operations too.
+        """
+        responses.add(responses.GET, _base_url + '/artifacts', json=[])
+        service = SchemaregistryV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.rate_limiter = RecordingLimiter(rate=100)
+
+        service.list_schemas()
+
+        assert service.rate_limiter.operations == ['list_schemas']
+
+    def test_async_client_waits_without_blocking(self):
+        """
+        The async client awaits the rate limit wait instead of sleeping.
+        """
+        service = AsyncAdminrestV1(
+            authenticator=NoAuthAuthenticator(),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={'name': 'topic1'})),
+        )
+        service.set_service_url(_base_url)
+        service.rate_limiter = RecordingLimiter(rate=20, burst=1, sleep=pytest.fail)
+
+        async def run():
+            async with service:
+                return await asyncio.gather(service.get_topic('topic1'), service.get_topic('topic1'))
+
+        results = asyncio.run(run())
+
+        assert [result.get_result()['name'] for result in results] == ['topic1', 'topic1']
+        assert service.rate_limiter.operations == ['get_topic', 'get_topic']
+        assert service.rate_limiter.bucket.waits == 1
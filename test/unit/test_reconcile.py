@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the topic reconciler
+"""
+
+import json
+
+import responses
+
+from eventstreams_sdk.reconcile import TopicOperation, TopicReconciler, current_configs
+
+_base_url = 'https://fake'
+
+_current = [
+    {
+        'name': 'orders',
+        'partitions': 3,
+        'retentionMs': 86400000,
+        'cleanupPolicy': 'delete',
+        'configs': {'retention.bytes': '1073741824', 'segment.bytes': '536870912'},
+    },
+    {'name': 'payments', 'partitions': 6, 'retentionMs': 3600000, 'cleanupPolicy': 'delete'},
+    {'name': 'legacy', 'partitions': 1},
+]
+
+_desired = {
+    'orders': {'partitions': 3, 'configs': {'retention.ms': 86400000, 'segment.bytes': 536870912}},
+    'payments': {'partitions': 12, 'configs': {'retention.ms': 7200000, 'cleanup.policy': 'delete'}},
+    'refunds': {'partitions': 2, 'configs': {'cleanup.policy': 'compact'}},
+}
+
+
+def add_current_topics():
+    """
+    Mock the listing of the current topics.
+    """
+    responses.add(responses.GET, _base_url + '/admin/topics', json=_current)
+
+
+class TestTopicReconciler:
+    """
+    Test Class for TopicReconciler
+    """
+
+    def test_current_configs(self):
+        """
+        current_configs() merges the configs with the top level config properties.
+        """
+        assert current_configs(_current[0]) == {
+            'retention.ms': '86400000',
+            'cleanup.policy': 'delete',
+            'retention.bytes': '1073741824',
+            'segment.bytes': '536870912',
+        }
+        assert current_configs({'name': 'empty'}) == {}
+
+    @responses.activate
+    def test_plan(self, new_service):
+        """
+        The plan only touches the topics that differ, with one operation each.
+        """
+        add_current_topics()
+        plan = TopicReconciler(new_service(), _desired).plan()
+
+        assert list(plan) == [
+            TopicOperation('create', 'refunds', partitions=2, configs={'cleanup.policy': 'compact'}),
+            TopicOperation(
+                'update',
+                'payments',
+                partitions=12,
+                configs={'retention.ms': '7200000'},
+                current={'retention.ms': '3600000', 'partitions': 6},
+            ),
+        ]
+        assert not plan.conflicts
+        assert str(plan) == (
+            '+ create refunds (partitions=2, cleanup.policy=compact)\n'
+            '~ update payments (partitions: 6 -> 12, retention.ms: 3600000 -> 7200000)'
+        )
+
+    @responses.activate
+    def test_prune_and_filter(self, new_service):
+        """
+        prune deletes the undesired topics among those matching the topic filter.
+        """
+        service = new_service()
+        add_current_topics()
+        reconciler = TopicReconciler(service, _desired, prune=True, topic_filter='*')
+
+        plan = reconciler.plan()
+
+        assert [(operation.action, operation.topic) for operation in plan] == [
+            ('create', 'refunds'),
+            ('update', 'payments'),
+            ('delete', 'legacy'),
+        ]
+        assert responses.calls[0].request.params['topic_filter'] == '*'
+
+    def test_conflicts(self):
+        """
+        Partition decreases are reported as conflicts, other changes are still planned.
+        """
+        current = {'orders': {'name': 'orders', 'partitions': 6}}
+        desired = {'orders': {'partitions': 3, 'configs': {'retention.ms': 1000}}}
+
+        plan = TopicReconciler(None, desired).plan(current)
+
+        assert plan.conflicts == ['orders: cannot decrease partitions from 6 to 3']
+        assert list(plan) == [
+            TopicOperation('update', 'orders', configs={'retention.ms': '1000'}, current={'retention.ms': None})
+        ]
+        assert str(TopicReconciler(None, {}).plan({})) == 'No changes.'
+
+    def test_unreported_configs(self):
+        """
+        Desired configs list_topics does not report are conflicts, not perpetual updates,
+        but are still set on the topics created.
+        """
+        current = {'orders': {'name': 'orders', 'partitions': 3, 'retentionMs': 1000}}
+        desired = {
+            'orders': {'partitions': 3, 'configs': {'retention.ms': 1000, 'max.message.bytes': 2097152}},
+            'refunds': {'partitions': 1, 'configs': {'max.message.bytes': 2097152}},
+        }
+
+        plan = TopicReconciler(None, desired).plan(current)
+
+        assert plan.conflicts == ['orders: cannot verify config max.message.bytes, not reported by list_topics']
+        assert list(plan) == [
+            TopicOperation('create', 'refunds', partitions=1, configs={'max.message.bytes': '2097152'})
+        ]
+        current['orders']['configs'] = {'max.message.bytes': '1048576'}
+        plan = TopicReconciler(None, desired).plan(current)
+        assert not plan.conflicts
+        assert plan.operations[1].configs == {'max.message.bytes': '2097152'}
+
+    @responses.activate
+    def test_apply(self, new_service):
+        """
+        apply() sends one request per operation and reports each result.
+        """
+        service = new_service()
+        add_current_topics()
+        responses.add(responses.POST, _base_url + '/admin/topics', status=202)
+        responses.add(responses.PATCH, _base_url + '/admin/topics/payments', status=202)
+        responses.add(responses.DELETE, _base_url + '/admin/topics/legacy', status=500)
+
+        results = TopicReconciler(service, _desired, prune=True).apply(max_workers=2)
+
+        assert [(result.name, result.status) for result in results] == [
+            ('refunds', 'created'),
+            ('payments', 'updated'),
+            ('legacy', 'failed'),
+        ]
+        bodies = {
+            call.request.method: json.loads(call.request.body)
+            for call in responses.calls
+            if call.request.method in ('POST', 'PATCH')
+        }
+        assert bodies['POST'] == {
+            'name': 'refunds',
+            'partition_count': 2,
+            'configs': [{'name': 'cleanup.policy', 'value': 'compact'}],
+        }
+        assert bodies['PATCH'] == {
+            'new_total_partition_count': 12,
+            'configs': [{'name': 'retention.ms', 'value': '7200000'}],
+        }
+
+    @responses.activate
+    def test_apply_in_sync(self, new_service):
+        """
+        Topics in their desired state cost only the listing.
+        """
+        service = new_service()
+        add_current_topics()
+
+        results = TopicReconciler(service, {'orders': _desired['orders']}).apply()
+
+        assert not results
+        assert len(responses.calls) == 1
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the retry policy
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.async_adminrest_v1 import AsyncAdminrestV1
+from eventstreams_sdk.retry import DEFAULT_RETRY_BUDGET, RetryBudget, RetryPolicy
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+
+_base_url = 'https://fake'
+
+
+def new_policy(**kwargs):
+    """
+    Return a policy with its own budget that records its sleeps instead of sleeping.
+    """
+    sleeps = []
+    kwargs.setdefault('budget', RetryBudget())
+    policy = RetryPolicy(sleep=sleeps.append, **kwargs)
+    return policy, sleeps
+
+
+def failing(*errors, result='ok'):
+    """
+    Return a function raising the given errors in turn, then returning result.
+    """
+    errors = list(errors)
+    calls = []
+
+    def fn():
+        calls.append(None)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    fn.calls = calls
+    return fn
+
+
+class TestRetryBudget:
+    """
+    Test Class for RetryBudget
+    """
+
+    def test_ratio_of_requests(self, clock):
+        """
+        Once the saved budget is spent, retries are limited to a share of the requests.
+        """
+        budget = RetryBudget(0.5, min_per_second=0, capacity=1, clock=clock)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+        assert budget.denied == 2
+
+    def test_minimum_rate(self, clock):
+        """
+        A minimum number of retries per second is allowed without requests.
+        """
+        budget = RetryBudget(0, min_per_second=2, capacity=2, clock=clock)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        clock.now += 0.5
+        assert budget.withdraw()
+        clock.now += 100
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+    def test_invalid_arguments(self):
+        """
+        The ratio and the minimum rate must not be negative.
+        """
+        with pytest.raises(ValueError):
+            RetryBudget(-1)
+        with pytest.raises(ValueError):
+            RetryBudget(min_per_second=-1)
+
+
+class TestRetryPolicy:
+    """
+    Test Class for RetryPolicy
+    """
+
+    def test_idempotency(self):
+        """
+        Server errors and timeouts are only retried for operations safe to repeat.
+        """
+        policy = RetryPolicy(retryable_operations=['create_topic'])
+        assert policy.is_retryable(ApiException(503), 'GET')
+        assert policy.is_retryable(ApiException(502), 'PUT')
+        assert policy.is_retryable(ApiException(500), 'DELETE')
+        assert policy.is_retryable(requests.exceptions.ReadTimeout(), 'GET')
+        assert not policy.is_retryable(ApiException(503), 'POST', 'create_quota')
+        assert not policy.is_retryable(requests.exceptions.ReadTimeout(), 'PATCH', 'update_topic')
+        assert policy.is_retryable(ApiException(503), 'POST', 'create_topic')
+
+    def test_non_idempotent_operations(self):
+        """
+        The operations creating a resource are not retried whatever their method,
+        unless listed in retryable_operations.
+        """
+        policy = RetryPolicy()
+        assert not policy.is_retryable(ApiException(503), 'PUT', 'update_schema')
+        assert not policy.is_retryable(requests.exceptions.ReadTimeout(), 'PUT', 'update_schema')
+        assert policy.is_retryable(ApiException(503), 'PUT', 'update_schema_rule')
+        assert policy.is_retryable(ApiException(429), 'PUT', 'update_schema')
+        policy = RetryPolicy(retryable_operations=['update_schema'])
+        assert policy.is_retryable(ApiException(503), 'PUT', 'update_schema')
+
+    def test_unprocessed_requests(self):
+        """
+        Throttled requests and failed connections are retried whatever their method.
+        """
+        policy = RetryPolicy()
+        assert policy.is_retryable(ApiException(429), 'POST', 'create_quota')
+        assert policy.is_retryable(requests.exceptions.ConnectTimeout(), 'POST')
+        assert policy.is_retryable(httpx.ConnectError('refused'), 'PATCH')
+
+    def test_non_retryable_errors(self):
+        """
+        Client errors and other exceptions are not retried.
+        """
+        policy = RetryPolicy()
+        assert not policy.is_retryable(ApiException(404), 'GET')
+        assert not policy.is_retryable(ApiException(400), 'GET')
+        assert not policy.is_retryable(ValueError(), 'GET')
+
+    def test_decorrelated_jitter(self):
+        """
+        Each delay is drawn between the base delay and three times the previous one.
+        """
+        bounds = []
+
+        def uniform(low, high):
+            bounds.append((low, high))
+            return high
+
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0, uniform=uniform)
+        delays = [0.0]
+        for _ in range(4):
+            delays.append(policy.next_delay(delays[-1], ApiException(503)))
+
+        assert delays[1:] == [pytest.approx(0.3), pytest.approx(0.9), 1.0, 1.0]
+        assert bounds[0] == (0.1, pytest.approx(0.3))
+        assert bounds[1] == (0.1, pytest.approx(0.9))
+
+    def test_retry_after(self):
+        """
+        The delay honours the Retry-After header of the response, up to max_delay.
+        """
+        response = requests.Response()
+        response.status_code = 429
+        response.headers['Retry-After'] = '2'
+        policy = RetryPolicy(uniform=lambda low, high: low)
+        assert policy.next_delay(0, ApiException(429, http_response=response)) == 2.0
+        response.headers['Retry-After'] = '3600'
+        assert policy.next_delay(0, ApiException(429, http_response=response)) == 20.0
+
+    def test_call_retries_until_success(self):
+        """
+        call() retries the retryable failures and returns the first success.
+        """
+        policy, sleeps = new_policy(max_attempts=3)
+        fn = failing(ApiException(503), requests.exceptions.ReadTimeout())
+
+        assert policy.call(fn, 'GET', 'get_topic') == 'ok'
+        assert len(fn.calls) == 3
+        assert len(sleeps) == 2
+        assert policy.retries == 2
+
+    def test_call_gives_up(self):
+        """
+        call() raises the last error after max_attempts, or at once when not retryable.
+        """
+        policy, sleeps = new_policy(max_attempts=2)
+        fn = failing(ApiException(503), ApiException(504))
+        with pytest.raises(ApiException) as err:
+            policy.call(fn, 'GET')
+        assert err.value.status_code == 504
+
+        fn = failing(ApiException(503))
+        with pytest.raises(ApiException):
+            policy.call(fn, 'POST', 'create_topic')
+        assert len(fn.calls) == 1
+        assert len(sleeps) == 1
+
+    def test_budget_stops_retries(self):
+        """
+        Retries stop when the budget is exhausted.
+        """
+        budget = RetryBudget(0, min_per_second=0, capacity=1)
+        policy, _ = new_policy(budget=budget)
+        fn = failing(*[ApiException(503)] * 10)
+
+        with pytest.raises(ApiException):
+            policy.call(fn, 'GET')
+
+        assert len(fn.calls) == 2
+        assert budget.denied == 1
+
+    def test_shared_budget(self):
+        """
+        Policies share the budget of the process by default.
+        """
+        assert RetryPolicy().budget is DEFAULT_RETRY_BUDGET
+        assert RetryPolicy().budget is RetryPolicy().budget
+
+    def test_invalid_arguments(self):
+        """
+        The attempts and delays are validated.
+        """
+        with pytest.raises(ValueError):
+            RetryPolicy(0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=2, max_delay=1)
+
+
+class TestServiceRetryPolicy:
+    """
+    Test Class for the retry policy of the service clients
+    """
+
+    def new_service(self, service_class=AdminrestV1, **kwargs):
+        """
+        Return a client retrying with a policy that does not sleep.
+        """
+        service = service_class(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_retry_policy(new_policy(**kwargs)[0])
+        return service
+
+    @responses.activate
+    def test_get_is_retried(self):
+        """
+        A GET failing with 503 is sent again.
+        """
+        url = _base_url + '/admin/topics/topic1'
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json={'name': 'topic1'})
+        service = self.new_service()
+
+        assert service.get_topic('topic1').get_result() == {'name': 'topic1'}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_create_topic_needs_opt_in(self):
+        """
+        create_topic is only retried when listed as retryable.
+        """
+        url = _base_url + '/admin/topics'
+        responses.add(responses.POST, url, status=503)
+        responses.add(responses.POST, url, status=503)
+        responses.add(responses.POST, url, status=202)
+
+        with pytest.raises(ApiException):
+            self.new_service().create_topic(name='topic1')
+        assert len(responses.calls) == 1
+
+        service = self.new_service(retryable_operations=['create_topic'])
+        assert service.create_topic(name='topic1').get_status_code() == 202
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_put_state_is_retried(self):
+        """
+        The PUT operations of the schema registry are retried.
+        """
+        url = _base_url + '/artifacts/schema1/state'
+        responses.add(responses.PUT, url, status=502)
+        responses.add(responses.PUT, url, status=204)
+        service = self.new_service(SchemaregistryV1)
+
+        assert service.set_schema_state('schema1', state='DISABLED').get_status_code() == 204
+        assert len(responses.calls) == 2
+
+    def test_replaces_core_retries(self):
+        """
+        Enabling a retry policy disables the retries of the core.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.enable_retries()
+        service.enable_retry_policy()
+        assert service.retry_config is None
+        assert service.http_adapter.max_retries.total == 0
+        assert isinstance(service.retry_policy, RetryPolicy)
+        service.disable_retry_policy()
+        assert service.retry_policy is None
+
+    def test_async_client(self):
+        """
+        The async clients retry with the policy too.
+        """
+        statuses = [503, 429, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={'name': 'topic1'})
+
+        service = AsyncAdminrestV1(authenticator=NoAuthAuthenticator(), transport=httpx.MockTransport(handler))
+        service.set_service_url(_base_url)
+        service.enable_retry_policy(RetryPolicy(base_delay=0.001, max_delay=0.001, budget=RetryBudget()))
+
+        async def run():
+            async with service:
+                return await service.get_topic('topic1')
+
+        assert asyncio.run(run()).get_result() == {'name': 'topic1'}
+        assert not statuses
+        with pytest.raises(NotImplementedError):
+            service.enable_retries()
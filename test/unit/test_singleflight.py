@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2025.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request coalescing
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from eventstreams_sdk.adminrest_v1 import AdminrestV1
+from eventstreams_sdk.deadline import Deadline, DeadlineExceeded
+from eventstreams_sdk.schemaregistry_v1 import SchemaregistryV1
+from eventstreams_sdk.singleflight import SingleFlight
+
+_base_url = 'https://fake'
+
+_callers = 8
+
+
+def wait_for(condition, timeout=5.0):
+    """
+    Poll condition() until it holds.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out waiting for condition'
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """
+    Test Class for SingleFlight
+    """
+
+    def test_concurrent_calls_share_one_execution(self):
+        """
+        Concurrent calls for the same key run fn once and share its result.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+        executions = []
+
+        def fn():
+            executions.append(1)
+            release.wait()
+            return 'result'
+
+        with ThreadPoolExecutor(max_workers=_callers) as executor:
+            futures = [executor.submit(flight.do, 'key', fn) for _ in range(_callers)]
+            wait_for(lambda: flight.shared == _callers - 1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ['result'] * _callers
+        assert len(executions) == 1
+        assert flight.executed == 1
+        assert flight.in_flight() == 0
+
+    def test_exception_is_shared(self):
+        """
+        Waiting callers receive the exception of the shared call.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait()
+            raise RuntimeError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(flight.do, 'key', fn) for _ in range(2)]
+            wait_for(lambda: flight.shared == 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match='boom'):
+                    future.result()
+
+    def test_deadline_bounds_the_wait(self):
+        """
+        A waiting caller gives up once its deadline expires, without affecting the call.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait()
+            return 'result'
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, 'key', fn)
+            wait_for(lambda: flight.in_flight() == 1)
+            with pytest.raises(DeadlineExceeded):
+                flight.do('key', fn, Deadline(0.01))
+            release.set()
+            assert leader.result() == 'result'
+        assert flight.shared == 1
+
+    def test_sequential_calls_execute(self):
+        """
+        Calls that do not overlap each execute fn.
+        """
+        flight = SingleFlight()
+        assert flight.do('key', lambda: 1) == 1
+        assert flight.do('key', lambda: 2) == 2
+        assert flight.executed == 2
+        assert flight.shared == 0
+
+
+class TestRequestCoalescing:
+    """
+    Test Class for request coalescing on the service clients
+    """
+
+    def coalesce(self, service, path, call, status=200):
+        """
+        Run call(service) from many threads while the mock for path is held, and return
+        the outcomes.
+        """
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return (status, {'Content-Type': 'application/json'}, '{"name": "shared"}')
+
+        responses.add_callback(responses.GET, _base_url + path, callback=callback)
+        with ThreadPoolExecutor(max_workers=_callers) as executor:
+            futures = [executor.submit(call, service) for _ in range(_callers)]
+            wait_for(lambda: service.request_coalescing.shared == _callers - 1)
+            release.set()
+        return futures
+
+    @responses.activate
+    def test_get_topic(self):
+        """
+        Concurrent get_topic calls for one topic send a single request.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+
+        futures = self.coalesce(service, '/admin/topics/topic1', lambda service: service.get_topic('topic1'))
+
+        results = [future.result() for future in futures]
+        assert len(responses.calls) == 1
+        assert all(result.get_result() == {'name': 'shared'} for result in results)
+
+    @responses.activate
+    def test_get_latest_schema_error(self):
+        """
+        An error response is raised to every coalesced caller.
+        """
+        service = SchemaregistryV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+
+        futures = self.coalesce(service, '/artifacts/s1', lambda service: service.get_latest_schema('s1'), status=503)
+
+        for future in futures:
+            with pytest.raises(ApiException):
+                future.result()
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_deadline_of_a_coalesced_call(self):
+        """
+        A get_topic call waiting for the same call in flight stops at its deadline.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return (200, {'Content-Type': 'application/json'}, '{"name": "topic1"}')
+
+        responses.add_callback(responses.GET, _base_url + '/admin/topics/topic1', callback=callback)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(service.get_topic, 'topic1')
+            wait_for(lambda: service.request_coalescing.in_flight() == 1)
+            with pytest.raises(DeadlineExceeded):
+                service.get_topic('topic1', deadline=Deadline(0.01))
+            release.set()
+            assert leader.result().get_result() == {'name': 'topic1'}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_different_params_are_not_coalesced(self):
+        """
+        Requests with different query parameters are sent separately.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+        responses.add(responses.GET, _base_url + '/admin/topics', json=[])
+
+        service.list_topics(page=1)
+        service.list_topics(page=2)
+
+        assert len(responses.calls) == 2
+        assert service.request_coalescing.executed == 2
+
+    @responses.activate
+    def test_different_headers_are_not_coalesced(self):
+        """
+        Requests with different headers are sent separately.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return (200, {'Content-Type': 'application/json'}, '{"name": "topic1"}')
+
+        responses.add_callback(responses.GET, _base_url + '/admin/topics/topic1', callback=callback)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(service.get_topic, 'topic1', headers={'X-Tenant': tenant}) for tenant in ('a', 'b')
+            ]
+            try:
+                wait_for(lambda: service.request_coalescing.in_flight() == 2)
+            finally:
+                release.set()
+            for future in futures:
+                future.result()
+
+        assert sorted(call.request.headers['X-Tenant'] for call in responses.calls) == ['a', 'b']
+        assert service.request_coalescing.shared == 0
+
+    @responses.activate
+    def test_mutations_are_not_coalesced(self):
+        """
+        Only GET requests are coalesced.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.enable_request_coalescing()
+        responses.add(responses.DELETE, _base_url + '/admin/topics/topic1', status=202)
+
+        service.delete_topic('topic1')
+
+        assert service.request_coalescing.executed == 0
+
+    def test_disable(self):
+        """
+        disable_request_coalescing() removes the policy.
+        """
+        service = AdminrestV1(authenticator=NoAuthAuthenticator())
+        service.enable_request_coalescing()
+        service.disable_request_coalescing()
+        assert service.request_coalescing is None